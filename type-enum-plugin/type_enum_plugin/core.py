@@ -4,6 +4,9 @@ from typing import Callable
 
 from mypy.exprtotype import TypeTranslationError, expr_to_unanalyzed_type
 from mypy.nodes import (
+    ARG_NAMED_OPT,
+    ARG_POS,
+    Argument,
     AssignmentStmt,
     ClassDef,
     DictExpr,
@@ -22,6 +25,7 @@ from mypy.nodes import (
     Var,
 )
 from mypy.plugin import ClassDefContext, Plugin, SemanticAnalyzerPluginInterface
+from mypy.plugins.common import add_method_to_class
 from mypy.semanal_namedtuple import NamedTupleAnalyzer
 from mypy.types import (
     AnyType,
@@ -36,9 +40,12 @@ from mypy.types import (
     UnionType,
     get_proper_type,
 )
+from mypy.typevars import fill_typevars
 
 __all__ = ["plugin"]
 
+METADATA_KEY = "type_enum"
+
 
 @dataclass(kw_only=True)
 class TypeEnumTransform:
@@ -48,10 +55,18 @@ class TypeEnumTransform:
     reason: Expression | Statement
     # spec: DataclassTransformSpec
     api: SemanticAnalyzerPluginInterface
+    # whether the analysis of a field type was deferred
+    incomplete: bool = False
 
     def transform(self) -> None:
         """Transform the attributes in a TypeEnum."""
         cls = self.cls
+        metadata = cls.info.metadata.setdefault(METADATA_KEY, {})
+        if metadata.get("complete"):
+            # The semantic analyzer runs this hook again whenever anything else in
+            # the module was deferred. Re-adding `T` would then count as progress,
+            # which keeps the analyzer from ever reaching its final iteration.
+            return
         cls.info.is_final = True
         variants: list[tuple[TypeInfo, list[TypeVarLikeType]]] = []
         error_reported = False
@@ -145,6 +160,7 @@ class TypeEnumTransform:
                         if isinstance(target, TupleType):
                             target.partial_fallback.args = tuple(tvars)
 
+                    self.add_bulk_constructors(info, types)
                     variants.append((info, tvars))
                     continue
                 else:
@@ -175,6 +191,7 @@ class TypeEnumTransform:
                     info.type_vars = []
                     info.defn.type_vars = tvars
                     info.add_type_vars()
+                self.add_bulk_constructors(info, types)
                 variants.append((info, tvars))
             elif isinstance(stmt.rvalue, DictExpr):
                 if not stmt.rvalue.items:
@@ -204,11 +221,16 @@ class TypeEnumTransform:
                 info = self.create_namedtuple(
                     lhs.name, fieldnames, fieldtypes, stmt.line
                 )
+                self.add_bulk_constructors(info, fieldtypes)
                 variants.append((info, []))
             else:
                 self.api.fail("Only tuples or dicts are allowed in a TypeEnum", stmt)
                 error_reported = True
 
+        if self.incomplete:
+            # `T` is only added once all variants are known
+            return
+
         if not variants and not error_reported:
             self.api.fail("Empty TypeEnum.", self.cls)
 
@@ -225,15 +247,19 @@ class TypeEnumTransform:
             typ = UnionType.make_union(
                 [Instance(typ, type_vars, typ.line) for typ, type_vars in variants]
             )
+            # The alias gets no source position, because positions are part of the
+            # serialized alias; otherwise, inserting a line above the TypeEnum would
+            # change the interface of the module in the incremental cache.
             alias = TypeAlias(
                 typ,
                 self.api.qualified_name("T"),
-                self.reason.line,
-                self.reason.column,
+                -1,
+                -1,
                 alias_tvars=cls.info.defn.type_vars,
             )
-            aliasnode = SymbolTableNode(MDEF, alias)
+            aliasnode = SymbolTableNode(MDEF, alias, plugin_generated=True)
             self.api.add_symbol_table_node("T", aliasnode)
+            metadata["complete"] = True
 
     def get_type_from_expression(self, type_node: Expression) -> Type | None:
         try:
@@ -244,7 +270,9 @@ class TypeEnumTransform:
             self.api.fail(f"Invalid field type", type_node)
             return None
         analyzed = self.api.anal_type(type)
-        if isinstance(analyzed, UnboundType):
+        if analyzed is None:
+            self.incomplete = True
+        elif isinstance(analyzed, UnboundType):
             analyzed = AnyType(TypeOfAny.from_error)
         return analyzed
 
@@ -267,13 +295,66 @@ class TypeEnumTransform:
         )
         info.is_final = True
 
+        # the runtime stores the (declaration order) tag of the variant as `_tag_`
+        tag_var = Var("_tag_", self.api.named_type("builtins.int"))
+        tag_var.info = info
+        tag_var._fullname = f"{info.fullname}._tag_"
+        tag_var.is_classvar = True
+        info.names["_tag_"] = SymbolTableNode(MDEF, tag_var, plugin_generated=True)
+
         # add the surrounding class as a base class
         info.mro.append(self.cls.info)
 
-        node = SymbolTableNode(MDEF, info)
+        # Marking the node as generated keeps the fine-grained daemon from
+        # reprocessing the methods of the variant on their own; they are regenerated
+        # together with the module.
+        node = SymbolTableNode(MDEF, info, plugin_generated=True)
         self.api.add_symbol_table_node(name, node)
         return info
 
+    def add_bulk_constructors(self, info: TypeInfo, types: list[Type]) -> None:
+        """Add the `from_rows` and `from_columns` class methods of the runtime."""
+        values = self.api.named_type("builtins.list", [fill_typevars(info)])
+        bool_type = self.api.named_type("builtins.bool")
+        check = Argument(Var("check", bool_type), bool_type, None, ARG_NAMED_OPT)
+        pause_gc = Argument(Var("pause_gc", bool_type), bool_type, None, ARG_NAMED_OPT)
+        row = TupleType(
+            types,
+            self.api.named_type(
+                "builtins.tuple", [AnyType(TypeOfAny.implementation_artifact)]
+            ),
+        )
+        rows_type = self.api.named_type("typing.Iterable", [row])
+        rows = Argument(Var("rows", rows_type), rows_type, None, ARG_POS)
+        add_method_to_class(
+            self.api,
+            info.defn,
+            "from_rows",
+            [rows, check, pause_gc],
+            values,
+            is_classmethod=True,
+        )
+        columns = []
+        for i, typ in enumerate(types):
+            column_type = self.api.named_type("typing.Iterable", [typ])
+            columns.append(
+                Argument(
+                    Var(f"column{i}", column_type),
+                    column_type,
+                    None,
+                    ARG_POS,
+                    pos_only=True,
+                )
+            )
+        add_method_to_class(
+            self.api,
+            info.defn,
+            "from_columns",
+            [*columns, check, pause_gc],
+            values,
+            is_classmethod=True,
+        )
+
     @cached_property
     def namedtuple_builder(self) -> NamedTupleAnalyzer:
         return NamedTupleAnalyzer(self.api.options, self.api, self.api.msg)  # type: ignore
@@ -0,0 +1,99 @@
+"""Compare a `TypeEnumArray` with a list of variant instances.
+
+For a batch of shapes, this measures the memory that each representation needs
+(with `tracemalloc`) and the time to compute the area of every shape, once with a
+`match` statement over the list and once with `TypeEnumArray.map`.
+
+Run with `python -m benchmarks.bench_array [SIZE]` from the `type-enum` directory.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import numpy as np
+
+from type_enum import Field, TypeEnum
+from type_enum.array import TypeEnumArray
+
+DEFAULT_SIZE = 1_000_000
+
+
+class Shape(TypeEnum):
+    circle: Field[float]
+    rect: Field[float, float]
+    point: Field[()]
+
+
+def make_shapes(size: int) -> list[Any]:
+    rng = random.Random(0)
+    shapes: list[Any] = []
+    for _ in range(size):
+        kind = rng.random()
+        if kind < 0.45:
+            shapes.append(Shape.circle(rng.random()))
+        elif kind < 0.9:
+            shapes.append(Shape.rect(rng.random(), rng.random()))
+        else:
+            shapes.append(Shape.point())
+    return shapes
+
+
+def areas_with_match(shapes: list[Any]) -> list[float]:
+    result = []
+    for shape in shapes:
+        match shape:
+            case Shape.circle(r):
+                result.append(3.14159 * r * r)
+            case Shape.rect(w, h):
+                result.append(w * h)
+            case Shape.point():
+                result.append(0.0)
+    return result
+
+
+def areas_with_map(array: TypeEnumArray) -> np.ndarray:
+    return array.map(
+        {
+            Shape.circle: lambda r: 3.14159 * r * r,
+            Shape.rect: lambda w, h: w * h,
+            Shape.point: lambda: 0.0,
+        }
+    )
+
+
+def traced(build: Callable[[], Any]) -> tuple[Any, float]:
+    """Return the result of `build` and the memory (in MB) that it allocated."""
+    tracemalloc.start()
+    result = build()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, memory / 1e6
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    shapes, list_memory = traced(lambda: make_shapes(size))
+    array, array_memory = traced(lambda: TypeEnumArray(Shape, shapes))
+    assert np.allclose(areas_with_match(shapes), areas_with_map(array))
+    build_seconds = timed(lambda: TypeEnumArray(Shape, shapes))
+    match_seconds = timed(lambda: areas_with_match(shapes))
+    map_seconds = timed(lambda: areas_with_map(array))
+
+    print(f"{size} shapes")
+    print(f"{'':>22}  {'list':>8}  {'array':>8}")
+    print(f"{'memory (MB)':>22}  {list_memory:>8.1f}  {array_memory:>8.1f}")
+    print(f"{'areas (s)':>22}  {match_seconds:>8.3f}  {map_seconds:>8.3f}")
+    print(f"{'building the array (s)':>22}  {'':>8}  {build_seconds:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compare storing an event log as an Arrow IPC file with pickling a list of NamedTuples.
+
+Measures the time to write the log, to read all of it back, and to read 1000 values
+from the middle of it (which needs the whole file for pickle), plus the file sizes.
+
+Run with `python -m benchmarks.bench_arrow [SIZE]` from the `type-enum` directory.
+"""
+
+import os
+from pathlib import Path
+import pickle
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable, NamedTuple
+
+from type_enum import Field, TypeEnum
+from type_enum.arrow import from_arrow, read_arrow, write_arrow
+
+DEFAULT_SIZE = 500_000
+
+
+class Event(TypeEnum):
+    click: Field[int, int]
+    key: Field[str, bool]
+    scroll: Field[float]
+    quit: Field[()]
+
+
+class Click(NamedTuple):
+    x: int
+    y: int
+
+
+class Key(NamedTuple):
+    key: str
+    pressed: bool
+
+
+class Scroll(NamedTuple):
+    amount: float
+
+
+class Quit(NamedTuple):
+    pass
+
+
+# the NamedTuple with the same fields for each variant
+PLAIN = {Event.click: Click, Event.key: Key, Event.scroll: Scroll, Event.quit: Quit}
+
+
+def make_events(size: int) -> list[Any]:
+    rng = random.Random(0)
+    makers: list[Callable[[], Any]] = [
+        lambda: Event.click(rng.randrange(1920), rng.randrange(1080)),
+        lambda: Event.key(rng.choice("abcdefgh"), rng.random() < 0.5),
+        lambda: Event.scroll(rng.random()),
+        lambda: Event.quit(),
+    ]
+    return [rng.choice(makers)() for _ in range(size)]
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    events = make_events(size)
+    plain_events = [PLAIN[type(event)](*event) for event in events]
+    middle = slice(size // 2, size // 2 + 1000)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pickle_path = Path(tmpdir) / "events.pickle"
+        arrow_path = Path(tmpdir) / "events.arrow"
+
+        def write_pickle() -> None:
+            with open(pickle_path, "wb") as f:
+                pickle.dump(plain_events, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        def read_pickle() -> Any:
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+
+        rows = [
+            (
+                "write",
+                timed(write_pickle),
+                timed(lambda: write_arrow(arrow_path, Event, events)),
+            ),
+            (
+                "read all",
+                timed(read_pickle),
+                timed(lambda: from_arrow(Event, read_arrow(arrow_path, Event))),
+            ),
+            (
+                "read 1000",
+                timed(lambda: read_pickle()[middle]),
+                timed(lambda: from_arrow(Event, read_arrow(arrow_path, Event)[middle])),
+            ),
+        ]
+        assert from_arrow(Event, read_arrow(arrow_path, Event)) == events
+        pickle_size = os.path.getsize(pickle_path) / 1e6
+        arrow_size = os.path.getsize(arrow_path) / 1e6
+
+    print(f"{size} events")
+    print(f"{'':>13}  {'pickle':>8}  {'arrow':>8}")
+    for name, pickle_seconds, arrow_seconds in rows:
+        print(f"{name + ' (s)':>13}  {pickle_seconds:>8.3f}  {arrow_seconds:>8.3f}")
+    print(f"{'size (MB)':>13}  {pickle_size:>8.1f}  {arrow_size:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
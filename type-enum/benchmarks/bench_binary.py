@@ -0,0 +1,72 @@
+"""Compare `BinaryCodec` with pickling a list of NamedTuples for many small messages.
+
+Measures the number of messages encoded and decoded per second, and the size of the
+encoded data.
+
+Run with `python -m benchmarks.bench_binary [SIZE]` from the `type-enum` directory.
+"""
+
+import pickle
+import sys
+import time
+from typing import Any, Callable
+
+from type_enum.binary import BinaryCodec
+
+from .bench_arrow import PLAIN, Event, make_events
+
+DEFAULT_SIZE = 1_000_000
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> tuple[float, Any]:
+    """Return the best time of `repeat` calls of `func` and its result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    events = make_events(size)
+    plain_events = [PLAIN[type(event)](*event) for event in events]
+    codec = BinaryCodec(Event)
+
+    pickle_encode, pickled = timed(
+        lambda: pickle.dumps(plain_events, protocol=pickle.HIGHEST_PROTOCOL)
+    )
+    pickle_decode, _ = timed(lambda: pickle.loads(pickled))
+    # pickling each message on its own, like an RPC layer does
+    pickle_each, messages = timed(
+        lambda: [
+            pickle.dumps(e, protocol=pickle.HIGHEST_PROTOCOL) for e in plain_events
+        ]
+    )
+    pickle_each_decode, _ = timed(lambda: [pickle.loads(m) for m in messages])
+    binary_encode, encoded = timed(lambda: codec.encode_many(events))
+    binary_decode, decoded = timed(lambda: codec.decode_many(encoded))
+    binary_each, messages = timed(lambda: [codec.encode(event) for event in events])
+    binary_each_decode, _ = timed(lambda: [codec.decode(m) for m in messages])
+    assert decoded == events
+
+    print(f"{size} messages")
+    print(f"{'':>22}  {'pickle':>8}  {'binary':>8}")
+    rows = [
+        ("encode list (msg/s)", pickle_encode, binary_encode),
+        ("decode list (msg/s)", pickle_decode, binary_decode),
+        ("encode each (msg/s)", pickle_each, binary_each),
+        ("decode each (msg/s)", pickle_each_decode, binary_each_decode),
+    ]
+    for name, pickle_seconds, binary_seconds in rows:
+        print(
+            f"{name:>22}  {size / pickle_seconds:>8.2e}  {size / binary_seconds:>8.2e}"
+        )
+    print(
+        f"{'size (bytes/msg)':>22}  {len(pickled) / size:>8.1f}  {len(encoded) / size:>8.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
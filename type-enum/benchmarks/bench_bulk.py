@@ -0,0 +1,64 @@
+"""Compare the bulk constructors of variants with list comprehensions.
+
+Creates SIZE values of a variant with three fields, from rows (a list of tuples) and
+from columns (three lists), with and without checking the types of the fields, and
+with the garbage collector paused.
+
+Run with `python -m benchmarks.bench_bulk [SIZE]` from the `type-enum` directory.
+"""
+
+import random
+import sys
+import time
+from typing import Any, Callable
+
+from type_enum import Field, TypeEnum
+
+DEFAULT_SIZE = 1_000_000
+
+
+class Color(TypeEnum):
+    rgb: Field[int, int, float]
+    name: Field[str]
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> float:
+    """Return the best time of `repeat` calls of `func`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    rng = random.Random(0)
+    rows = [(rng.randrange(256), rng.randrange(256), rng.random()) for _ in range(size)]
+    rs, gs, bs = (list(column) for column in zip(*rows))
+    rgb = Color.rgb
+    assert (
+        rgb.from_rows(rows) == rgb.from_columns(rs, gs, bs) == [rgb(*r) for r in rows]
+    )
+
+    cases = [
+        ("[rgb(*row) for row in rows]", lambda: [rgb(*row) for row in rows]),
+        ("rgb.from_rows(rows)", lambda: rgb.from_rows(rows)),
+        ("  check=True", lambda: rgb.from_rows(rows, check=True)),
+        ("  pause_gc=True", lambda: rgb.from_rows(rows, pause_gc=True)),
+        (
+            "[rgb(r, g, b) for ... in zip(...)]",
+            lambda: [rgb(r, g, b) for r, g, b in zip(rs, gs, bs)],
+        ),
+        ("rgb.from_columns(rs, gs, bs)", lambda: rgb.from_columns(rs, gs, bs)),
+        ("  check=True", lambda: rgb.from_columns(rs, gs, bs, check=True)),
+        ("  pause_gc=True", lambda: rgb.from_columns(rs, gs, bs, pause_gc=True)),
+    ]
+    print(f"{size} values")
+    for name, func in cases:
+        print(f"{name:>36}  {size / timed(func):>8.2e} values/s")
+
+
+if __name__ == "__main__":
+    main()
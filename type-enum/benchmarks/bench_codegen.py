@@ -0,0 +1,61 @@
+"""Compare the import time of a module of TypeEnums with its generated static version.
+
+Run with `python -m benchmarks.bench_codegen` from the `type-enum` directory.
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+
+from type_enum.codegen import generate
+
+NUM_ENUMS = 20
+NUM_VARIANTS = 50
+
+IMPORT_TIMER = """\
+import time
+import type_enum
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def declarative_source() -> str:
+    lines = ["from type_enum import Field, TypeEnum", ""]
+    for i in range(NUM_ENUMS):
+        lines.append(f"class E{i}(TypeEnum):")
+        lines.extend(f"    v{j}: Field[int, str]" for j in range(NUM_VARIANTS))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def import_time(module: str, directory: str) -> float:
+    env_path = [directory, str(Path(__file__).parents[1])]
+    times = []
+    # the first run writes the bytecode cache, just like in a deployed application
+    for _ in range(6):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_TIMER.format(module=module)],
+            env={"PYTHONPATH": ":".join(env_path)},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times.append(float(result.stdout))
+    return min(times[1:])
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Path(tmpdir, "enums.py").write_text(declarative_source())
+        sys.path.insert(0, tmpdir)
+        Path(tmpdir, "enums_static.py").write_text(generate("enums"))
+        print(f"{NUM_ENUMS} enums with {NUM_VARIANTS} variants each")
+        for module in ("enums", "enums_static"):
+            print(f"{module:>12}: {import_time(module, tmpdir) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
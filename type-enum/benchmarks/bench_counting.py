@@ -0,0 +1,52 @@
+"""Measure the overhead of `type_enum.enable_counting` on construction and dispatch.
+
+With counting disabled, the variants and dispatch functions are exactly the original
+ones, so the first column is also the cost of a TypeEnum that was never counted.
+
+Run with `python -m benchmarks.bench_counting` from the `type-enum` directory.
+"""
+
+import timeit
+from typing import Any, Callable
+
+import type_enum
+
+from .common import make_enum
+
+NUM_VARIANTS = 20
+NUMBER = 500_000
+
+
+def measure(f: Callable[[], Any]) -> float:
+    seconds = min(timeit.repeat(f, number=NUMBER, repeat=5))
+    return seconds / NUMBER * 1e9
+
+
+def main() -> None:
+    E = make_enum(NUM_VARIANTS)
+    variant = E.v3
+    value = variant(1)
+    dispatch_f = E._dispatch_({v: (lambda value: value[0]) for v in E})
+    cases = {
+        "construct": lambda: variant(1),
+        "dispatch": lambda: dispatch_f(value),
+    }
+
+    print(
+        f"{'operation':>10}  {'disabled ns':>12}  {'enabled ns':>11}  {'overhead':>9}"
+    )
+    for name, f in cases.items():
+        disabled = measure(f)
+        type_enum.enable_counting(E)
+        try:
+            enabled = measure(f)
+        finally:
+            type_enum.disable_counting(E)
+        overhead = enabled - disabled
+        print(f"{name:>10}  {disabled:>12.1f}  {enabled:>11.1f}  {overhead:>+9.1f}")
+    counts = type_enum.variant_counts(E)["v3"]
+    print(f"counted {counts.constructed} constructions, {counts.dispatched} dispatches")
+
+
+if __name__ == "__main__":
+    main()
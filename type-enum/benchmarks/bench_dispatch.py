@@ -0,0 +1,40 @@
+"""Benchmark `E._dispatch_(...)` against an equivalent `match` statement.
+
+A `match` statement checks one `case` arm after another, so the cost of reaching a
+variant grows with its position; the compiled dispatch table does not.
+
+Run with `python -m benchmarks.bench_dispatch` from the `type-enum` directory.
+"""
+
+import timeit
+
+from .common import make_enum, make_match_function
+
+NUM_VARIANTS = 60
+NUMBER = 500_000
+
+
+def main() -> None:
+    E = make_enum(NUM_VARIANTS)
+    variants = list(E)
+    match_f = make_match_function(E, NUM_VARIANTS)
+    dispatch_f = E._dispatch_(
+        {
+            variant: (lambda value, i=i: value[0] + i)
+            for i, variant in enumerate(variants)
+        }
+    )
+
+    print(f"{'variant':>8}  {'match ns/call':>14}  {'dispatch ns/call':>17}")
+    for position in (0, NUM_VARIANTS // 2, NUM_VARIANTS - 1):
+        value = variants[position](1)
+        assert match_f(value) == dispatch_f(value)
+        results = []
+        for f in (match_f, dispatch_f):
+            seconds = min(timeit.repeat(lambda: f(value), number=NUMBER, repeat=5))
+            results.append(seconds / NUMBER * 1e9)
+        print(f"{position:>8}  {results[0]:>14.1f}  {results[1]:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark constructing values of a generic variant through its parameterizations.
+
+Compares calling `Maybe.some` directly with calling `Maybe.some[int]`, parameterizing
+and calling in one go, and calling the member of `Maybe.T[int]`. The last row calls an
+alias created by `typing` itself, which is what parameterizing a variant used to return.
+
+Run with `python -m benchmarks.bench_generic` from the `type-enum` directory.
+"""
+
+import timeit
+import typing
+from typing import Any, Callable
+
+from .common import make_maybe
+
+NUMBER = 500_000
+
+
+def main() -> None:
+    Maybe = make_maybe()
+    some_int = Maybe.some[int]
+    union_member = next(
+        member for member in typing.get_args(Maybe.T[int]) if member == some_int
+    )
+    typing_alias = typing._GenericAlias(Maybe.some, (int,))  # type: ignore[attr-defined]
+    cases: dict[str, Callable[[], Any]] = {
+        "Maybe.some(1)": lambda: Maybe.some(1),
+        "some_int(1)": lambda: some_int(1),
+        "Maybe.some[int](1)": lambda: Maybe.some[int](1),
+        "member of Maybe.T[int]": lambda: union_member(1),
+        "typing's alias": lambda: typing_alias(1),
+    }
+
+    print(f"{'call':>24}  {'ns/call':>8}  {'relative':>8}")
+    reference = None
+    for name, f in cases.items():
+        assert f() == Maybe.some(1)
+        seconds = min(timeit.repeat(f, number=NUMBER, repeat=5))
+        ns = seconds / NUMBER * 1e9
+        reference = reference or ns
+        print(f"{name:>24}  {ns:>8.1f}  {ns / reference:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
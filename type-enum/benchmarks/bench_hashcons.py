@@ -0,0 +1,108 @@
+"""Compare building repetitive expression trees with and without hash-consing.
+
+Two workloads are measured for a plain and a hash-consed TypeEnum:
+
+- a complete binary tree of the given depth whose two subtrees are always equal,
+  which hash-consing shares down to one node per level;
+- many small random expressions over a few variables and constants, as a parser
+  of a large file would create them.
+
+For each, this reports the time to build the trees, the memory they occupy (measured
+with `tracemalloc`) and, for the hash-consed TypeEnum, the size and hit rate of its
+table.
+
+Run with `python -m benchmarks.bench_hashcons` from the `type-enum` directory.
+"""
+
+import random
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import type_enum
+from type_enum import Field, TypeEnum
+
+DEPTH = 16
+NUM_EXPRESSIONS = 20_000
+
+
+class Expr(TypeEnum):
+    const: Field[int]
+    var: Field[str]
+    add: Field[Any, Any]
+    mul: Field[Any, Any]
+
+
+class SharedExpr(TypeEnum, hash_cons=True):
+    const: Field[int]
+    var: Field[str]
+    add: Field[Any, Any]
+    mul: Field[Any, Any]
+
+
+def balanced_tree(E: Any, depth: int) -> Any:
+    if depth == 0:
+        return E.var("x")
+    # both children are built separately, as a naive builder would do it
+    return E.add(balanced_tree(E, depth - 1), balanced_tree(E, depth - 1))
+
+
+def random_expressions(E: Any, count: int) -> list[Any]:
+    rng = random.Random(0)
+    leaves = [lambda: E.var(rng.choice("xyz")), lambda: E.const(rng.randrange(4))]
+
+    def expression(depth: int) -> Any:
+        if depth == 0:
+            return rng.choice(leaves)()
+        op = E.add if rng.random() < 0.5 else E.mul
+        return op(expression(depth - 1), expression(depth - 1))
+
+    return [expression(3) for _ in range(count)]
+
+
+def measure(build: Callable[[], Any]) -> tuple[float, float]:
+    """Return the time (in seconds) to run `build` and the memory (in MB) of its result.
+
+    The memory is measured in a second run, because `tracemalloc` slows down
+    allocations a lot.
+    """
+    start = time.perf_counter()
+    build()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    result = build()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return seconds, memory / 1e6
+
+
+def main() -> None:
+    workloads: dict[str, Callable[[Any], Any]] = {
+        f"balanced tree, depth {DEPTH}": lambda E: balanced_tree(E, DEPTH),
+        f"{NUM_EXPRESSIONS} random expressions": lambda E: random_expressions(
+            E, NUM_EXPRESSIONS
+        ),
+    }
+    print(
+        f"{'workload':>28}  {'mode':>11}  {'seconds':>8}  {'MB':>7}  "
+        f"{'table size':>10}  {'hit rate':>8}"
+    )
+    for name, workload in workloads.items():
+        seconds, memory = measure(lambda: workload(Expr))
+        print(f"{name:>28}  {'plain':>11}  {seconds:>8.3f}  {memory:>7.2f}")
+
+        before = type_enum.hash_cons_info(SharedExpr)
+        seconds, memory = measure(lambda: workload(SharedExpr))
+        after = type_enum.hash_cons_info(SharedExpr)
+        hits = after.hits - before.hits
+        hit_rate = hits / (hits + after.misses - before.misses)
+        type_enum.collect_hash_cons(SharedExpr)
+        print(
+            f"{name:>28}  {'hash-consed':>11}  {seconds:>8.3f}  {memory:>7.2f}  "
+            f"{after.size:>10}  {hit_rate:>8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
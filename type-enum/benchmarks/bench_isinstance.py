@@ -0,0 +1,33 @@
+"""Microbenchmark for `isinstance`/`issubclass` against a TypeEnum.
+
+The checks should take the same time regardless of the number of variants.
+
+Run with `python -m benchmarks.bench_isinstance` from the `type-enum` directory.
+"""
+
+import timeit
+
+from .common import make_enum
+
+NUMBER = 1_000_000
+
+
+def main() -> None:
+    print(f"{'variants':>8}  {'check':<28}  {'ns/call':>8}")
+    for num_variants in (2, 2000):
+        E = make_enum(num_variants)
+        first = E.v0(0)
+        last = getattr(E, f"v{num_variants - 1}")(0)
+        cases = {
+            "isinstance(first, E)": lambda: isinstance(first, E),
+            "isinstance(last, E)": lambda: isinstance(last, E),
+            "isinstance((0,), E)": lambda: isinstance((0,), E),
+            "issubclass(type(last), E)": lambda: issubclass(type(last), E),
+        }
+        for label, stmt in cases.items():
+            seconds = min(timeit.repeat(stmt, number=NUMBER, repeat=5))
+            print(f"{num_variants:>8}  {label:<28}  {seconds / NUMBER * 1e9:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
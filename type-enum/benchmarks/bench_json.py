@@ -0,0 +1,107 @@
+"""Compare `JsonCodec` with hand-written `match`-based converters for JSON lines.
+
+The hand-written version writes every event as an object with a `type` key and reads
+it back with `json.loads` and a `match` statement that checks the field types, which is
+how such converters are commonly written. Both read the file one line at a time.
+
+Run with `python -m benchmarks.bench_json [SIZE]` from the `type-enum` directory.
+"""
+
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Iterator
+
+from type_enum.json import JsonCodec
+
+from .bench_arrow import Event, make_events
+
+DEFAULT_SIZE = 500_000
+
+
+def to_dict(event: Any) -> dict[str, Any]:
+    match event:
+        case Event.click(x, y):
+            return {"type": "click", "x": x, "y": y}
+        case Event.key(key, pressed):
+            return {"type": "key", "key": key, "pressed": pressed}
+        case Event.scroll(amount):
+            return {"type": "scroll", "amount": amount}
+        case Event.quit():
+            return {"type": "quit"}
+    raise TypeError(f"Unknown event {event!r}")
+
+
+def from_dict(obj: Any) -> Any:
+    match obj:
+        case {"type": "click", "x": int(x), "y": int(y)}:
+            return Event.click(x, y)
+        case {"type": "key", "key": str(key), "pressed": bool(pressed)}:
+            return Event.key(key, pressed)
+        case {"type": "scroll", "amount": float(amount)}:
+            return Event.scroll(amount)
+        case {"type": "quit"}:
+            return Event.quit()
+    raise ValueError(f"Invalid event {obj!r}")
+
+
+def write_dicts(events: list[Any], path: Path) -> None:
+    with open(path, "w") as f:
+        for event in events:
+            f.write(json.dumps(to_dict(event)) + "\n")
+
+
+def read_dicts(path: Path) -> Iterator[Any]:
+    with open(path) as f:
+        for line in f:
+            yield from_dict(json.loads(line))
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> tuple[float, Any]:
+    """Return the best time of `repeat` calls of `func` and its result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    events = make_events(size)
+    codec = JsonCodec(Event)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dict_path = Path(tmpdir) / "dicts.jsonl"
+        codec_path = Path(tmpdir) / "codec.jsonl"
+
+        def write_codec() -> None:
+            with open(codec_path, "w") as f:
+                codec.write_lines(events, f)
+
+        def read_codec() -> list[Any]:
+            with open(codec_path) as f:
+                return list(codec.iter_lines(f))
+
+        dict_write, _ = timed(lambda: write_dicts(events, dict_path))
+        codec_write, _ = timed(write_codec)
+        dict_read, dict_events = timed(lambda: list(read_dicts(dict_path)))
+        codec_read, codec_events = timed(read_codec)
+        assert dict_events == codec_events == events
+        dict_size = dict_path.stat().st_size / size
+        codec_size = codec_path.stat().st_size / size
+
+    print(f"{size} events")
+    print(f"{'':>17}  {'match':>8}  {'codec':>8}")
+    for name, dict_seconds, codec_seconds in [
+        ("write (events/s)", dict_write, codec_write),
+        ("read (events/s)", dict_read, codec_read),
+    ]:
+        print(f"{name:>17}  {size / dict_seconds:>8.2e}  {size / codec_seconds:>8.2e}")
+    print(f"{'size (bytes/line)':>17}  {dict_size:>8.1f}  {codec_size:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Benchmark the definition cost of eager and lazy TypeEnums.
+
+This simulates the import of a module with many large TypeEnums of which only a single
+variant is used.
+
+Run with `python -m benchmarks.bench_lazy` from the `type-enum` directory.
+"""
+
+import time
+
+from .common import make_enum
+
+NUM_ENUMS = 20
+NUM_VARIANTS = 100
+
+
+def define_and_use(lazy: bool) -> tuple[float, float]:
+    start = time.perf_counter()
+    enums = [make_enum(NUM_VARIANTS, lazy=lazy) for _ in range(NUM_ENUMS)]
+    defined = time.perf_counter()
+    for E in enums:
+        assert isinstance(E.v0(0), E)
+    used = time.perf_counter()
+    return defined - start, used - defined
+
+
+def main() -> None:
+    print(f"{NUM_ENUMS} enums with {NUM_VARIANTS} variants each")
+    print(f"{'mode':>6}  {'define ms':>10}  {'first use ms':>13}")
+    for lazy in (False, True):
+        define, use = min(define_and_use(lazy) for _ in range(5))
+        mode = "lazy" if lazy else "eager"
+        print(f"{mode:>6}  {define * 1e3:>10.2f}  {use * 1e3:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
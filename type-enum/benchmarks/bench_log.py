@@ -0,0 +1,91 @@
+"""Measure the throughput of appending to and reading from an `EventLog`.
+
+Appends are measured one value at a time and in batches of 1000, with and without
+`sync=True`. Reads are measured for a scan of all values, for a scan of one variant
+(a quarter of the values) using its index, compared with decoding all values and
+filtering them, and for reads of single values at random sequence numbers.
+
+Run with `python -m benchmarks.bench_log [SIZE]` from the `type-enum` directory.
+"""
+
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+from type_enum.log import EventLog
+
+from .bench_arrow import Event, make_events
+
+DEFAULT_SIZE = 500_000
+BATCH = 1000
+SYNCED = 2000  # appends with `sync=True` are limited by the disk
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> tuple[float, Any]:
+    """Return the best time of `repeat` calls of `func` and its result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    events = make_events(size)
+    scrolls = [event for event in events if type(event) is Event.scroll]
+    seqs = random.Random(0).sample(range(size), min(size, 100_000))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runs = iter(range(1000))
+
+        def append(values: list[Any], batch: int, sync: bool = False) -> None:
+            path = Path(tmpdir) / str(next(runs))
+            with EventLog(Event, path, sync=sync) as log:
+                if batch == 1:
+                    for value in values:
+                        log.append(value)
+                else:
+                    for start in range(0, len(values), batch):
+                        log.extend(values[start : start + batch])
+
+        rows = [
+            ("append", size, timed(lambda: append(events, 1))[0]),
+            (f"extend {BATCH}", size, timed(lambda: append(events, BATCH))[0]),
+            (
+                "append, sync",
+                SYNCED,
+                timed(lambda: append(events[:SYNCED], 1, sync=True), 1)[0],
+            ),
+            (
+                f"extend {BATCH}, sync",
+                size,
+                timed(lambda: append(events, BATCH, sync=True), 1)[0],
+            ),
+        ]
+        with EventLog(Event, Path(tmpdir) / "read") as log:
+            log.extend(events)
+            seconds, values = timed(lambda: list(log))
+            assert values == events
+            rows.append(("scan all", size, seconds))
+            seconds, values = timed(
+                lambda: [event for event in log if type(event) is Event.scroll]
+            )
+            rows.append(("filter scroll", len(scrolls), seconds))
+            seconds, values = timed(lambda: list(log.scan(Event.scroll)))
+            assert values == scrolls
+            rows.append(("scan scroll", len(scrolls), seconds))
+            seconds, _ = timed(lambda: [log[seq] for seq in seqs])
+            rows.append(("random reads", len(seqs), seconds))
+
+    print(f"{size} events")
+    print(f"{'':>20}  {'values/s':>8}")
+    for name, count, seconds in rows:
+        print(f"{name:>20}  {count / seconds:>8.2e}")
+
+
+if __name__ == "__main__":
+    main()
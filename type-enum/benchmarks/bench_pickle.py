@@ -0,0 +1,90 @@
+"""Measure pickling of TypeEnum values, on its own and through `multiprocessing`.
+
+Sends a mixed workload of events through `multiprocessing.Pool.map`, where every event
+is pickled to a worker and the worker's result is pickled back, and compares it with
+the same workload made of equivalent NamedTuples. Also reports the time to pickle and
+unpickle the whole list in one process and the size of the payload.
+
+Run with `python -m benchmarks.bench_pickle [SIZE]` from the `type-enum` directory.
+"""
+
+import multiprocessing
+import pickle
+import sys
+import time
+from typing import Any, Callable
+
+from .bench_arrow import PLAIN, Click, Event, Key, Quit, Scroll, make_events
+
+DEFAULT_SIZE = 500_000
+PROCESSES = 4
+CHUNKSIZE = 1000
+
+
+def handle_event(event: Any) -> Any:
+    match event:
+        case Event.click(x, y):
+            return Event.click(y, x)
+        case Event.key(key, pressed):
+            return Event.key(key.upper(), not pressed)
+        case Event.scroll(amount):
+            return Event.scroll(-amount)
+    return event
+
+
+def handle_plain(event: Any) -> Any:
+    match event:
+        case Click(x, y):
+            return Click(y, x)
+        case Key(key, pressed):
+            return Key(key.upper(), not pressed)
+        case Scroll(amount):
+            return Scroll(-amount)
+        case Quit():
+            return event
+    raise TypeError(f"Unknown event {event!r}")
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> tuple[float, Any]:
+    """Return the best time of `repeat` calls of `func` and its result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    events = make_events(size)
+    plain_events = [PLAIN[type(event)](*event) for event in events]
+    protocol = pickle.HIGHEST_PROTOCOL
+    rows = []
+    with multiprocessing.Pool(PROCESSES) as pool:
+        for name, values, handler in [
+            ("NamedTuple", plain_events, handle_plain),
+            ("TypeEnum", events, handle_event),
+        ]:
+            dumps, data = timed(lambda: pickle.dumps(values, protocol=protocol))
+            loads, loaded = timed(lambda: pickle.loads(data))
+            assert loaded == values
+            pool_map, results = timed(
+                lambda: pool.map(handler, values, chunksize=CHUNKSIZE)
+            )
+            assert results == [handler(value) for value in values]
+            rows.append((name, size / dumps, size / loads, size / pool_map, len(data)))
+
+    print(f"{size} events, {PROCESSES} processes, chunks of {CHUNKSIZE}")
+    print(
+        f"{'':>10}  {'dumps/s':>8}  {'loads/s':>8}  {'Pool.map/s':>10}  {'bytes/value':>11}"
+    )
+    for name, dumps_rate, loads_rate, map_rate, nbytes in rows:
+        print(
+            f"{name:>10}  {dumps_rate:>8.2e}  {loads_rate:>8.2e}  {map_rate:>10.2e}  "
+            f"{nbytes / size:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Benchmark the mypy plugin on generated projects of increasing size.
+
+Every generated project consists of `modules` modules, each with `enums` TypeEnums of
+`variants` variants. The modules import each other in a cycle and the variants refer to
+classes and TypeEnums of the next module or to TypeEnums further down, so the semantic
+analyzer has to defer some of the TypeEnums, as it would in a large code base. Every
+module also contains a chain of classes that derive from classes further down, which
+takes the semantic analyzer many passes over the module. Finally, every module has a
+function that matches over a TypeEnum of the previous module.
+
+Each project is checked with a cold cache. Besides the total time, this reports how
+often the plugin hook was called and how much time was spent in it.
+
+Run with `python -m benchmarks.bench_plugin` from the `type-enum` directory; pass
+`--sizes 10 100` to choose the numbers of modules.
+"""
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+from typing import Any, Sequence
+
+from mypy import api
+import type_enum_plugin.core
+
+ENUMS_PER_MODULE = 10
+VARIANTS_PER_ENUM = 10
+
+_CONFIG = """\
+[mypy]
+plugins = type_enum_plugin
+strict = True
+"""
+
+
+def generate_module(index: int, num_modules: int, enums: int, variants: int) -> str:
+    """Return the source of module `index` of the generated project."""
+    next_module = f"m{(index + 1) % num_modules}"
+    prev_module = f"m{(index - 1) % num_modules}"
+    lines = [
+        "from typing import Generic, TypeVar",
+        "from type_enum import Field, TypeEnum",
+        f"import {next_module}",
+        f"import {prev_module}",
+        "",
+        'T = TypeVar("T")',
+    ]
+    # a chain of forward references to base classes; every pass of the semantic
+    # analyzer over the module resolves only one of them
+    for e in range(enums):
+        base = f"(P{e + 1})" if e + 1 < enums else ""
+        lines += ["", "", f"class P{e}{base}:", "    value: int"]
+    for e in range(enums):
+        generic = e % 3 == 2
+        bases = "TypeEnum, Generic[T]" if generic else "TypeEnum"
+        lines += ["", "", f"class E{e}({bases}):"]
+        for v in range(variants):
+            match v % 4:
+                case 0:
+                    field = "Field[int]"
+                case 1:
+                    field = f"Field[{next_module}.P0, str]"
+                case 2:
+                    # a forward reference within the module, which is deferred until
+                    # the next TypeEnum is complete
+                    target = f"E{e + 1}" if e + 1 < enums else f"{next_module}.E0"
+                    args = "[int]" if (e + 1) % 3 == 2 else ""
+                    field = f"Field[{target}.T{args}]"
+                case _:
+                    field = "Field[T]" if generic else "Field[()]"
+            lines.append(f"    v{v}: {field}")
+    enum_type = f"{prev_module}.E0"
+    lines += [
+        "",
+        "",
+        f"def handle(x: {enum_type}.T) -> int:",
+        "    match x:",
+    ]
+    for v in range(variants):
+        match v % 4:
+            case 0 | 2:
+                pattern = f"{enum_type}.v{v}(a)"
+            case 1:
+                pattern = f"{enum_type}.v{v}(a, _)"
+            case _:
+                pattern = f"{enum_type}.v{v}()"
+        lines += [f"        case {pattern}:", f"            return {v}"]
+    lines.append("")
+    return "\n".join(lines)
+
+
+def generate_project(root: Path, modules: int, enums: int, variants: int) -> None:
+    for index in range(modules):
+        source = generate_module(index, modules, enums, variants)
+        (root / f"m{index}.py").write_text(source)
+    (root / "mypy.ini").write_text(_CONFIG)
+
+
+class _HookTimer:
+    """Wraps the plugin hook to count the calls and the time spent in it."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.original = type_enum_plugin.core.type_enum_callback
+
+    def __call__(self, ctx: Any) -> None:
+        self.calls += 1
+        start = time.perf_counter()
+        try:
+            self.original(ctx)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def __enter__(self) -> "_HookTimer":
+        type_enum_plugin.core.type_enum_callback = self
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        type_enum_plugin.core.type_enum_callback = self.original
+
+
+def check(root: Path) -> tuple[float, _HookTimer]:
+    files = sorted(str(path) for path in root.glob("m*.py"))
+    args = ["--config-file", str(root / "mypy.ini"), "--cache-dir", "/dev/null"]
+    with _HookTimer() as timer:
+        start = time.perf_counter()
+        stdout, stderr, status = api.run([*args, *files])
+        seconds = time.perf_counter() - start
+    if status != 0:
+        raise RuntimeError(f"mypy failed:\n{stdout}{stderr}")
+    return seconds, timer
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_plugin")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--enums", type=int, default=ENUMS_PER_MODULE)
+    parser.add_argument("--variants", type=int, default=VARIANTS_PER_ENUM)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'modules':>7}  {'enums':>6}  {'total s':>8}  {'hook calls':>10}  "
+        f"{'hook s':>7}  {'hook share':>10}"
+    )
+    for modules in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            generate_project(root, modules, args.enums, args.variants)
+            seconds, timer = check(root)
+        print(
+            f"{modules:>7}  {modules * args.enums:>6}  {seconds:>8.2f}  "
+            f"{timer.calls:>10}  {timer.seconds:>7.2f}  "
+            f"{timer.seconds / seconds:>10.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Compare `AsyncDispatcher` with a single consumer loop that dispatches with `match`.
+
+One in ten jobs waits for simulated I/O, the others are handled right away. In the
+consumer loop, every job waits behind the slow jobs before it; the dispatcher handles
+the slow jobs with up to `SLOW_CONCURRENCY` workers, and the fast jobs separately.
+Measures the jobs per second and the latency of the fast jobs (from being queued to
+being handled).
+
+Run with `python -m benchmarks.bench_routing [SIZE]` from the `type-enum` directory.
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+from typing import Any
+
+from type_enum import Field, TypeEnum
+from type_enum.routing import AsyncDispatcher
+
+DEFAULT_SIZE = 20_000
+IO_SECONDS = 0.002
+SLOW_CONCURRENCY = 64
+QUEUE_SIZE = 1000
+
+
+class Job(TypeEnum):
+    fast: Field[int]
+    slow: Field[int]
+
+
+def make_jobs(size: int) -> list[Any]:
+    rng = random.Random(0)
+    return [Job.slow(i) if rng.random() < 0.1 else Job.fast(i) for i in range(size)]
+
+
+class Timings:
+    def __init__(self, size: int) -> None:
+        self.queued = [0.0] * size
+        self.handled = [0.0] * size
+
+    async def fast(self, job: Any) -> None:
+        self.handled[job[0]] = time.perf_counter()
+
+    async def slow(self, job: Any) -> None:
+        await asyncio.sleep(IO_SECONDS)
+        self.handled[job[0]] = time.perf_counter()
+
+
+async def consumer_loop(jobs: list[Any], timings: Timings) -> None:
+    queue: asyncio.Queue[Any] = asyncio.Queue(QUEUE_SIZE)
+
+    async def consume() -> None:
+        while True:
+            job = await queue.get()
+            match job:
+                case Job.fast():
+                    await timings.fast(job)
+                case Job.slow():
+                    await timings.slow(job)
+            queue.task_done()
+
+    consumer = asyncio.create_task(consume())
+    for i, job in enumerate(jobs):
+        timings.queued[i] = time.perf_counter()
+        await queue.put(job)
+    await queue.join()
+    consumer.cancel()
+
+
+async def dispatcher(jobs: list[Any], timings: Timings) -> None:
+    handlers = {Job.fast: timings.fast, Job.slow: timings.slow}
+    async with AsyncDispatcher(
+        Job,
+        handlers,
+        concurrency={Job.slow: SLOW_CONCURRENCY},
+        queue_size=QUEUE_SIZE,
+    ) as router:
+        for i, job in enumerate(jobs):
+            timings.queued[i] = time.perf_counter()
+            await router.put(job)
+
+
+async def run(size: int) -> None:
+    jobs = make_jobs(size)
+    fast = [job[0] for job in jobs if type(job) is Job.fast]
+    print(f"{size} jobs, {size - len(fast)} of them wait {IO_SECONDS * 1e3:.0f} ms")
+    print(f"{'':>14}  {'jobs/s':>8}  {'fast median (ms)':>16}  {'fast p99 (ms)':>13}")
+    for name, func in [("consumer loop", consumer_loop), ("dispatcher", dispatcher)]:
+        timings = Timings(size)
+        start = time.perf_counter()
+        await func(jobs, timings)
+        seconds = time.perf_counter() - start
+        latencies = sorted(timings.handled[i] - timings.queued[i] for i in fast)
+        median = statistics.median(latencies)
+        p99 = latencies[int(len(latencies) * 0.99)]
+        print(
+            f"{name:>14}  {size / seconds:>8.2e}  {median * 1e3:>16.3f}"
+            f"  {p99 * 1e3:>13.3f}"
+        )
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    asyncio.run(run(size))
+
+
+if __name__ == "__main__":
+    main()
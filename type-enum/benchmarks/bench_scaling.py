@@ -0,0 +1,39 @@
+"""Benchmark how the definition of a TypeEnum scales with the number of variants.
+
+Both the time and the memory allocated per variant should stay roughly constant.
+
+Run with `python -m benchmarks.bench_scaling` from the `type-enum` directory.
+"""
+
+import gc
+import time
+import tracemalloc
+
+from .common import make_enum
+
+
+def main() -> None:
+    print(f"{'variants':>8}  {'total ms':>10}  {'us/variant':>10}  {'KiB/variant':>11}")
+    for num_variants in (10, 100, 1_000, 10_000):
+        gc.collect()
+        start = time.perf_counter()
+        E = make_enum(num_variants)
+        seconds = time.perf_counter() - start
+        del E
+
+        gc.collect()
+        tracemalloc.start()
+        E = make_enum(num_variants)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del E
+
+        print(
+            f"{num_variants:>8}  {seconds * 1e3:>10.1f}  "
+            f"{seconds / num_variants * 1e6:>10.1f}  "
+            f"{size / num_variants / 1024:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare `parallel_map` with `multiprocessing.Pool.map` for a mixed batch of events.
+
+`Pool.map` pickles every event to the workers, whereas `parallel_map` copies the whole
+batch into a shared memory block once and sends only its name. Both pickle the results
+back. Measured for a cheap function, where sending the values dominates, and for a more
+CPU-bound one.
+
+Run with `python -m benchmarks.bench_shared [SIZE]` from the `type-enum` directory.
+"""
+
+import math
+import multiprocessing
+import sys
+import time
+from typing import Any, Callable
+
+from type_enum.array import TypeEnumArray
+from type_enum.shared import parallel_map
+
+from .bench_arrow import Event, make_events
+
+DEFAULT_SIZE = 500_000
+PROCESSES = 4
+
+
+def cheap(event: Any) -> int:
+    return event._tag_
+
+
+def expensive(event: Any) -> float:
+    match event:
+        case Event.click(x, y):
+            return sum(math.hypot(x - i, y - i) for i in range(20))
+        case Event.scroll(amount):
+            return sum(amount**i for i in range(20))
+    return 0.0
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> tuple[float, Any]:
+    """Return the best time of `repeat` calls of `func` and its result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    events = make_events(size)
+    array = TypeEnumArray(Event, events)
+    chunksize = -(-size // (4 * PROCESSES))
+    rows = []
+    with multiprocessing.Pool(PROCESSES) as pool:
+        for func in (cheap, expensive):
+            pool_seconds, expected = timed(
+                lambda: pool.map(func, events, chunksize=chunksize)
+            )
+            list_seconds, from_list = timed(
+                lambda: parallel_map(func, events, enum=Event, pool=pool)
+            )
+            array_seconds, from_array = timed(
+                lambda: parallel_map(func, array, pool=pool)
+            )
+            assert from_list == from_array == expected
+            rows.append((func.__name__, pool_seconds, list_seconds, array_seconds))
+
+    print(f"{size} events, {PROCESSES} processes, {multiprocessing.cpu_count()} CPUs")
+    print(f"{'':>10}  {'Pool.map':>9}  {'from list':>9}  {'from array':>10}")
+    for name, *seconds in rows:
+        pool_rate, list_rate, array_rate = (size / s for s in seconds)
+        print(f"{name:>10}  {pool_rate:>9.2e}  {list_rate:>9.2e}  {array_rate:>10.2e}")
+    print("(events per second)")
+
+
+if __name__ == "__main__":
+    main()
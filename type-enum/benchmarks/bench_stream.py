@@ -0,0 +1,148 @@
+"""Compare `MessageReader`/`MessageWriter` with pickled messages over a loopback socket.
+
+The pickle version writes every message with its own `write()` call and reads it with
+two `readexactly()` calls (for the length and the pickle), which is how a protocol is
+often first written with asyncio streams. Measures the messages per second of a one-way
+stream, and the round-trip latency of single messages sent to an echo server.
+
+Run with `python -m benchmarks.bench_stream [SIZE]` from the `type-enum` directory.
+"""
+
+import asyncio
+import pickle
+import statistics
+import struct
+import sys
+import time
+from typing import Any, Callable
+
+from type_enum.stream import MessageReader, MessageWriter
+
+from .bench_arrow import PLAIN, Event, make_events
+
+DEFAULT_SIZE = 200_000
+ROUND_TRIPS = 5_000
+BATCH = 1000  # messages between two calls of `drain`
+
+_LENGTH = struct.Struct("<I")
+
+
+class Pickled:
+    """Messages as pickled NamedTuples, one `write()` per message."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def write(self, value: Any) -> None:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self.writer.write(_LENGTH.pack(len(data)) + data)
+
+    async def drain(self) -> None:
+        await self.writer.drain()
+
+    async def read(self) -> Any:
+        try:
+            (length,) = _LENGTH.unpack(await self.reader.readexactly(4))
+        except asyncio.IncompleteReadError:
+            return None
+        return pickle.loads(await self.reader.readexactly(length))
+
+
+class Framed:
+    """Messages with `MessageReader` and `MessageWriter`."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = MessageReader(reader, Event)
+        self.writer = MessageWriter(writer, Event)
+        self.write = self.writer.write
+        self.drain = self.writer.drain
+        self.read = self.reader.read
+
+
+Protocol = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Any]
+
+
+async def throughput(protocol: Protocol, values: list[Any]) -> float:
+    """Return the seconds to send `values` to a server that reads all of them."""
+    done = asyncio.get_running_loop().create_future()
+
+    async def count(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        messages = protocol(reader, writer)
+        received = 0
+        while await messages.read() is not None:
+            received += 1
+        done.set_result(received)
+        writer.close()
+
+    async with await asyncio.start_server(count, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        start = time.perf_counter()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        messages = protocol(reader, writer)
+        for i, value in enumerate(values, 1):
+            messages.write(value)
+            if i % BATCH == 0:
+                await messages.drain()
+        await messages.drain()
+        writer.write_eof()
+        assert await done == len(values)
+        seconds = time.perf_counter() - start
+        writer.close()
+    return seconds
+
+
+async def round_trips(protocol: Protocol, values: list[Any]) -> list[float]:
+    """Return the round-trip times of `values` sent to an echo server one at a time."""
+
+    async def echo(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        messages = protocol(reader, writer)
+        while (value := await messages.read()) is not None:
+            messages.write(value)
+            await messages.drain()
+        writer.close()
+
+    async with await asyncio.start_server(echo, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        messages = protocol(reader, writer)
+        times = []
+        for value in values:
+            start = time.perf_counter()
+            messages.write(value)
+            await messages.drain()
+            await messages.read()
+            times.append(time.perf_counter() - start)
+        # the server closes the connection after the end of the stream
+        writer.write_eof()
+        assert await messages.read() is None
+        writer.close()
+    return times
+
+
+async def run(size: int) -> None:
+    events = make_events(size)
+    plain_events = [PLAIN[type(event)](*event) for event in events]
+    rows = []
+    for name, protocol, values in [
+        ("pickle", Pickled, plain_events),
+        ("framed", Framed, events),
+    ]:
+        seconds = min([await throughput(protocol, values) for _ in range(3)])
+        times = sorted(await round_trips(protocol, values[:ROUND_TRIPS]))
+        p99 = times[int(len(times) * 0.99)]
+        rows.append((name, size / seconds, statistics.median(times), p99))
+
+    print(f"{size} messages, {ROUND_TRIPS} round trips")
+    print(f"{'':>7}  {'msg/s':>8}  {'median (us)':>11}  {'p99 (us)':>8}")
+    for name, rate, median, p99 in rows:
+        print(f"{name:>7}  {rate:>8.2e}  {median * 1e6:>11.1f}  {p99 * 1e6:>8.1f}")
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    asyncio.run(run(size))
+
+
+if __name__ == "__main__":
+    main()
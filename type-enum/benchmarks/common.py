@@ -0,0 +1,94 @@
+"""Helpers shared by the benchmark scripts."""
+
+from types import new_class
+from typing import Any, Callable, Generic, TypeVar
+
+from type_enum import TypeEnum
+
+T = TypeVar("T")
+
+# field shapes that `make_mixed_enum` cycles through
+_SHAPES: list[Any] = [
+    type[tuple[()]],
+    type[tuple[int]],
+    type[tuple[int, str]],
+    type[tuple[float, float, float]],
+    type[tuple[list[int], dict[str, int] | None]],
+]
+
+# field values that fit the shapes, for making values of all variants
+_SAMPLES: list[tuple[Any, ...]] = [(), (1,), (1, "a"), (1.0, 2.0, 3.0), ([1, 2], None)]
+
+
+def make_enum(
+    num_variants: int,
+    name: str = "E",
+    *,
+    lazy: bool = False,
+    cache_hash: bool = False,
+    intern: Any = (),
+) -> Any:
+    """Create a TypeEnum with `num_variants` variants of shape `(int,)`."""
+    annotations = {f"v{i}": type[tuple[int]] for i in range(num_variants)}
+    return _make(name, annotations, lazy, cache_hash=cache_hash, intern=intern)
+
+
+def make_mixed_enum(num_variants: int, name: str = "E") -> Any:
+    """Create a TypeEnum whose variants have between 0 and 3 fields of various types."""
+    annotations = {f"v{i}": _SHAPES[i % len(_SHAPES)] for i in range(num_variants)}
+    return _make(name, annotations, False)
+
+
+def mixed_values(enum: Any) -> list[Any]:
+    """Return one value of every variant of an enum made by `make_mixed_enum`."""
+    return [variant(*_SAMPLES[i % len(_SAMPLES)]) for i, variant in enumerate(enum)]
+
+
+def make_picklable_enum(num_variants: int) -> Any:
+    """Return a mixed TypeEnum that is a module attribute, so pickle can find it."""
+    name = f"Mixed{num_variants}"
+    enum = globals().get(name)
+    if enum is None:
+        enum = globals()[name] = make_mixed_enum(num_variants, name)
+    return enum
+
+
+def make_generic_enum(num_variants: int, name: str = "E") -> Any:
+    """Create a TypeEnum that is generic in `T`; the variants have shape `(T, int)`."""
+    annotations = {f"v{i}": type[tuple[T, int]] for i in range(num_variants)}
+    return _make(name, annotations, False, (TypeEnum, Generic[T]))
+
+
+def make_maybe() -> Any:
+    """Create the usual `Maybe` TypeEnum with the variants `some` and `nothing`."""
+    annotations = {"some": type[tuple[T]], "nothing": type[tuple[()]]}
+    return _make("Maybe", annotations, False, (TypeEnum, Generic[T]))
+
+
+def make_match_function(E: Any, num_variants: int) -> Callable[[Any], int]:
+    """Build a function that matches over all variants of `E` in declaration order."""
+    arms = "".join(
+        f"        case E.v{i}(x):\n            return x + {i}\n"
+        for i in range(num_variants)
+    )
+    source = f"def f(value):\n    match value:\n{arms}"
+    namespace: dict[str, Any] = {"E": E}
+    exec(source, namespace)
+    return namespace["f"]
+
+
+def _make(
+    name: str,
+    annotations: dict[str, Any],
+    lazy: bool,
+    bases: tuple[Any, ...] = (TypeEnum,),
+    *,
+    cache_hash: bool = False,
+    intern: Any = (),
+) -> Any:
+    def body(ns: dict[str, Any]) -> None:
+        ns["__module__"] = __name__
+        ns["__annotations__"] = annotations
+
+    kwds = {"lazy": lazy, "cache_hash": cache_hash, "intern": intern}
+    return new_class(name, bases, kwds, exec_body=body)
@@ -0,0 +1,125 @@
+"""Run the pyperf suite and compare the results against a saved baseline.
+
+Usage (from the `type-enum` directory)::
+
+    python -m benchmarks.compare --update      # save a baseline
+    ... change the code ...
+    python -m benchmarks.compare               # compare against it
+
+The exit status is 1 if any benchmark got slower than the threshold. Arguments after
+`--` are passed on to the suite, e.g. `python -m benchmarks.compare -- --fast`.
+"""
+
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+from typing import Sequence
+
+import pyperf
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def run_suite(output: Path, suite_args: Sequence[str]) -> None:
+    output.unlink(missing_ok=True)
+    command = [sys.executable, "-m", "benchmarks.suite", "-o", str(output)]
+    subprocess.run([*command, *suite_args], check=True)
+
+
+def compare(
+    baseline: pyperf.BenchmarkSuite, results: pyperf.BenchmarkSuite, threshold: float
+) -> bool:
+    """Print a table of the changes and return whether there were regressions."""
+    regressed = False
+    names = baseline.get_benchmark_names()
+    width = max(map(len, names), default=0)
+    print(f"{'benchmark':<{width}}  {'baseline':>12}  {'current':>12}  {'change':>8}")
+    for name in names:
+        old = baseline.get_benchmark(name)
+        try:
+            new = results.get_benchmark(name)
+        except KeyError:
+            print(f"{name:<{width}}  {_format(old.mean()):>12}  {'missing':>12}")
+            continue
+        change = new.mean() / old.mean() - 1
+        # only count changes that are larger than the noise of both runs
+        noise = max(_relative_stdev(old), _relative_stdev(new))
+        marker = ""
+        if change > max(threshold, noise):
+            marker = "  slower"
+            regressed = True
+        elif -change > max(threshold, noise):
+            marker = "  faster"
+        print(
+            f"{name:<{width}}  {_format(old.mean()):>12}  {_format(new.mean()):>12}  "
+            f"{change:>+8.1%}{marker}"
+        )
+    for name in sorted(set(results.get_benchmark_names()) - set(names)):
+        mean = results.get_benchmark(name).mean()
+        print(f"{name:<{width}}  {'new':>12}  {_format(mean):>12}")
+    return regressed
+
+
+def _relative_stdev(benchmark: pyperf.Benchmark) -> float:
+    if benchmark.get_nvalue() < 2:
+        return 0.0
+    return benchmark.stdev() / benchmark.mean()
+
+
+def _format(seconds: float) -> str:
+    for unit, factor in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.2f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.compare",
+        description="Run the benchmark suite and compare it against a baseline.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="pyperf JSON file with the baseline (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--results",
+        type=Path,
+        help="compare this pyperf JSON file instead of running the suite",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="save the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown that counts as a regression (default: %(default)s)",
+    )
+    parser.add_argument("suite_args", nargs="*", help="arguments for the suite")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results_path = args.results
+        if results_path is None:
+            results_path = Path(tmp) / "results.json"
+            run_suite(results_path, args.suite_args)
+        results = pyperf.BenchmarkSuite.load(str(results_path))
+    if args.update:
+        results.dump(str(args.baseline), replace=True)
+        print(f"saved baseline to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        parser.error(f"no baseline at {args.baseline}; create one with --update")
+    baseline = pyperf.BenchmarkSuite.load(str(args.baseline))
+    return 1 if compare(baseline, results, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
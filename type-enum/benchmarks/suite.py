@@ -0,0 +1,142 @@
+"""pyperf benchmark suite for the runtime library.
+
+Run with `python -m benchmarks.suite -o results.json` from the `type-enum` directory;
+all the usual pyperf options are supported (e.g. `--fast` or `--rigorous`). Use
+`python -m benchmarks.compare` to compare the results against a saved baseline.
+"""
+
+import pickle
+from typing import Any, Callable
+
+import pyperf
+
+from .common import (
+    make_enum,
+    make_generic_enum,
+    make_match_function,
+    make_maybe,
+    make_mixed_enum,
+    make_picklable_enum,
+    mixed_values,
+)
+
+NUM_VARIANTS = 20
+
+
+def add_class_creation(runner: pyperf.Runner) -> None:
+    runner.bench_func("create small enum", make_enum, 3)
+    runner.bench_func("create large enum", make_enum, 200)
+    runner.bench_func("create mixed enum", make_mixed_enum, 50)
+    runner.bench_func("create generic enum", make_generic_enum, 20)
+
+
+def add_construction(runner: pyperf.Runner) -> None:
+    E = make_mixed_enum(NUM_VARIANTS)
+    Maybe = make_maybe()
+    some_int = Maybe.some[int]
+    bench_calls(runner, "construct nullary", E.v0)
+    bench_calls(runner, "construct unary", E.v1, 1)
+    bench_calls(runner, "construct binary", E.v2, 1, "a")
+    Interned = make_enum(1, intern=["v0"])
+    bench_calls(runner, "construct unary (interned)", Interned.v0, 1)
+    bench_calls(runner, "construct generic", Maybe.some, 1)
+    bench_calls(runner, "construct generic (specialized)", some_int, 1)
+    bench_calls(
+        runner, "construct generic (specialize+call)", lambda: Maybe.some[int](1)
+    )
+
+
+def add_isinstance(runner: pyperf.Runner) -> None:
+    E = make_enum(NUM_VARIANTS)
+    first, last = E.v0(0), getattr(E, f"v{NUM_VARIANTS - 1}")(0)
+    union = E.T
+    bench_calls(runner, "isinstance E (first variant)", isinstance, first, E)
+    bench_calls(runner, "isinstance E (last variant)", isinstance, last, E)
+    bench_calls(runner, "isinstance E (no variant)", isinstance, (0,), E)
+    bench_calls(runner, "isinstance E.T (first variant)", isinstance, first, union)
+    bench_calls(runner, "isinstance E.T (last variant)", isinstance, last, union)
+
+
+def add_match(runner: pyperf.Runner) -> None:
+    E = make_enum(NUM_VARIANTS)
+    match_f = make_match_function(E, NUM_VARIANTS)
+    for depth in (0, NUM_VARIANTS // 2, NUM_VARIANTS - 1):
+        value = getattr(E, f"v{depth}")(1)
+        bench_calls(runner, f"match depth {depth}", match_f, value)
+    dispatch_f = E._dispatch_({variant: (lambda value: value[0]) for variant in E})
+    value = getattr(E, f"v{NUM_VARIANTS - 1}")(1)
+    bench_calls(runner, "dispatch", dispatch_f, value)
+
+
+def add_dunder_methods(runner: pyperf.Runner) -> None:
+    E = make_mixed_enum(NUM_VARIANTS)
+    a, b = E.v2(1, "a"), E.v2(1, "a")
+    c = E.v1(1)
+    bench_calls(runner, "repr", repr, a)
+    bench_calls(runner, "hash", hash, a)
+    bench_calls(runner, "eq (equal)", a.__eq__, b)
+    bench_calls(runner, "eq (different variant)", a.__eq__, c)
+    bench_calls(runner, "dict lookup", {a: 1, c: 2}.__getitem__, b)
+
+
+def add_collections(runner: pyperf.Runner) -> None:
+    E = make_enum(NUM_VARIANTS)
+    # every payload occurs in every variant
+    keys = [getattr(E, f"v{i % NUM_VARIANTS}")(i // NUM_VARIANTS) for i in range(1000)]
+    table = dict.fromkeys(keys, 0)
+    bench_calls(runner, "dict build (mixed keys)", dict.fromkeys, keys, 0)
+    bench_calls(runner, "dict lookups (mixed keys)", _lookup_all, table, keys)
+    bench_calls(runner, "set dedupe (mixed keys)", set, keys + keys)
+    payload = tuple(range(100))
+    for cache_hash in (False, True):
+        E = make_enum(NUM_VARIANTS, cache_hash=cache_hash)
+        keys = [getattr(E, f"v{i}")(payload) for i in range(NUM_VARIANTS)] * 50
+        name = "cached hash" if cache_hash else "uncached hash"
+        bench_calls(runner, f"set dedupe (large payloads, {name})", set, keys)
+
+
+def _lookup_all(table: dict[Any, int], keys: list[Any]) -> None:
+    for key in keys:
+        table[key]
+
+
+def add_pickling(runner: pyperf.Runner) -> None:
+    E = make_picklable_enum(NUM_VARIANTS)
+    value = E.v2(1, "a")
+    bench_calls(runner, "pickle dumps", pickle.dumps, value)
+    bench_calls(runner, "pickle loads", pickle.loads, pickle.dumps(value))
+    values = mixed_values(E) * 50
+    bench_calls(runner, "pickle dumps (mixed list)", pickle.dumps, values)
+    bench_calls(runner, "pickle loads (mixed list)", pickle.loads, pickle.dumps(values))
+
+
+def bench_calls(
+    runner: pyperf.Runner, name: str, func: Callable[..., Any], *args: Any
+) -> None:
+    """Benchmark a cheap call with a loop that has as little overhead as possible."""
+
+    def time_func(loops: int) -> float:
+        range_it = range(loops)
+        t0 = pyperf.perf_counter()
+        for _ in range_it:
+            func(*args)
+        return pyperf.perf_counter() - t0
+
+    runner.bench_time_func(name, time_func)
+
+
+def main() -> None:
+    runner = pyperf.Runner(program_args=("-m", "benchmarks.suite"))
+    runner.metadata["description"] = "type-enum runtime benchmarks"
+    runner.parse_args()
+    add_class_creation(runner)
+    add_construction(runner)
+    add_isinstance(runner)
+    add_match(runner)
+    add_dunder_methods(runner)
+    add_collections(runner)
+    add_pickling(runner)
+
+
+if __name__ == "__main__":
+    main()
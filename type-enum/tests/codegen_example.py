@@ -0,0 +1,36 @@
+"""TypeEnums for testing `type_enum.codegen`."""
+
+from typing import Any, Callable, Generic, Literal, Optional, TypeVar
+
+from type_enum import Field, TypeEnum
+
+from .codegen_types import Mode
+
+U = TypeVar("U")
+
+
+class Color(TypeEnum, intern={"name": 64}):
+    transparent: Field[()]
+    name: Field[str]
+    rgb: Field[int, int, int]
+
+
+class Maybe(TypeEnum, Generic[U]):
+    nothing: Field[()]
+    some: Field[U]
+
+
+class Event(TypeEnum):
+    paint: Field[Color.T, Optional[list[float]]]
+    open: Field[Literal[Mode.READ, Mode.WRITE], Callable[[int], str]]
+    empty: Field[tuple[()], dict[str, Maybe.T[int]]]
+
+
+class Point(TypeEnum, cache_hash=True):
+    origin: Field[()]
+    xy: Field[float, float]
+
+
+class Expr(TypeEnum, hash_cons=True):
+    lit: Field[int]
+    neg: Field[Any]
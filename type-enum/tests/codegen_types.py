@@ -0,0 +1,11 @@
+"""Types for the fields of the TypeEnums in `codegen_example`.
+
+The generated module imports them from here, as it must not import `codegen_example`.
+"""
+
+from enum import Enum
+
+
+class Mode(Enum):
+    READ = 1
+    WRITE = 2
@@ -0,0 +1,151 @@
+from typing import Any, Generic, TypeVar
+import unittest
+
+from type_enum import Field, TypeEnum
+
+from .common import CustomTestCase
+
+try:
+    import numpy as np
+
+    from type_enum.array import TypeEnumArray
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+U = TypeVar("U")
+
+
+class Shape(TypeEnum):
+    circle: Field[float]
+    rect: Field[float, float]
+    empty: Field[()]
+    label: Field[str, tuple[int, int]]
+
+
+SHAPES = [
+    Shape.circle(1.0),
+    Shape.rect(2.0, 3.0),
+    Shape.empty(),
+    Shape.label("a", (1, 2)),
+    Shape.circle(2.0),
+]
+
+
+@unittest.skipIf(np is None, "requires numpy")
+class TypeEnumArrayTest(CustomTestCase):
+    def test_roundtrip(self) -> None:
+        array = TypeEnumArray(Shape, SHAPES)
+        self.assertEqual(len(array), 5)
+        self.assertEqual(list(array), SHAPES)
+        self.assertEqual([array[i] for i in range(-5, 5)], SHAPES + SHAPES)
+        self.assertIs(array[2], Shape.empty())
+        with self.assertRaises(IndexError):
+            array[5]
+        self.assertEqual(array.tags.tolist(), [0, 1, 2, 3, 0])
+        self.assertEqual(array.offsets.tolist(), [0, 0, 0, 0, 1])
+        self.assertEqual(array.tags.dtype, np.uint8)
+        self.assertEqual(
+            repr(array[:2]),
+            "TypeEnumArray(Shape, [Shape.circle(1.0), Shape.rect(2.0, 3.0)])",
+        )
+
+    def test_append(self) -> None:
+        array = TypeEnumArray(Shape)
+        for i in range(100):
+            array.append(Shape.circle(float(i)))
+            array.extend([Shape.empty(), Shape.rect(float(i), 2.0 * i)])
+        self.assertEqual(len(array), 300)
+        self.assertEqual(array[-1], Shape.rect(99.0, 198.0))
+        self.assertEqual(array.select(Shape.circle)[0].sum(), sum(range(100)))
+
+    def test_invalid_values(self) -> None:
+        array = TypeEnumArray(Shape, SHAPES)
+        with self.assertRaises(TypeError):
+            array.extend([Shape.circle(3.0), (1.0,)])
+        with self.assertRaisesRegex(TypeError, "field 0 of Shape.circle"):
+            array.extend([Shape.empty(), Shape.circle("x")])  # type: ignore[arg-type]
+        # nothing was appended
+        self.assertEqual(list(array), SHAPES)
+
+    def test_mask_and_select(self) -> None:
+        array = TypeEnumArray(Shape, SHAPES)
+        self.assertEqual(array.mask(Shape.circle).tolist(), [1, 0, 0, 0, 1])
+        (radius,) = array.select(Shape.circle)
+        self.assertEqual(radius.dtype, np.float64)
+        self.assertEqual(radius.tolist(), [1.0, 2.0])
+        with self.assertRaises(ValueError):
+            radius[0] = 3.0
+        names, positions = array.select(Shape.label)
+        self.assertEqual(names.dtype, object)
+        self.assertEqual(positions.tolist(), [(1, 2)])
+        self.assertEqual(array.select(Shape.empty), ())
+        with self.assertRaises(TypeError):
+            array.mask(Shape)
+
+    def test_indexing(self) -> None:
+        array = TypeEnumArray(Shape, SHAPES)
+        circles = array[array.mask(Shape.circle)]
+        self.assertEqual(list(circles), [Shape.circle(1.0), Shape.circle(2.0)])
+        self.assertEqual(circles.select(Shape.rect)[0].tolist(), [])
+        self.assertEqual(list(array[::-1]), SHAPES[::-1])
+        self.assertEqual(list(array[[4, 2, 4]]), [SHAPES[4], SHAPES[2], SHAPES[4]])
+        # the result is a new array
+        circles.append(Shape.empty())
+        self.assertEqual(len(array), 5)
+
+    def test_map(self) -> None:
+        array = TypeEnumArray(Shape, SHAPES)
+        area = array.map(
+            {
+                Shape.circle: lambda r: 3 * r**2,
+                Shape.rect: lambda w, h: w * h,
+                Shape.empty: lambda: 0,
+                Shape.label: lambda name, position: np.zeros(len(name)),
+            }
+        )
+        self.assertEqual(area.tolist(), [3.0, 6.0, 0.0, 0.0, 12.0])
+
+        # the same checks as for `_dispatch_`
+        with self.assertRaisesRegex(
+            TypeError, "Missing handlers .*: rect, empty, label"
+        ):
+            array.map({Shape.circle: lambda r: r})
+        with self.assertRaises(ValueError):
+            array.map(
+                {
+                    Shape.circle: lambda r: r[:1],
+                    Shape.rect: lambda w, h: w,
+                    Shape.empty: lambda: 0,
+                    Shape.label: lambda name, position: 0,
+                }
+            )
+
+    def test_generic_and_nested(self) -> None:
+        class Maybe(TypeEnum, Generic[U]):
+            nothing: Field[()]
+            some: Field[U]
+
+        values: list[Any] = [Maybe.some(Shape.empty()), Maybe.nothing(), Maybe.some(2)]
+        array = TypeEnumArray(Maybe, values)
+        self.assertEqual(list(array), values)
+        self.assertEqual(array.select(Maybe.some[int])[0].dtype, object)
+
+    def test_native_columns_keep_values(self) -> None:
+        class E(TypeEnum):
+            a: Field[int, float]
+            b: Field[bool]
+            c: Field[complex]
+
+        array = TypeEnumArray(E)
+        for value in [E.a(1.7, 2.0), E.a("3", 2.0), E.a(True, 2.0), E.a(1, 2)]:  # type: ignore[arg-type]
+            with self.assertRaises(TypeError):
+                array.append(value)
+        with self.assertRaisesRegex(TypeError, "expected bool, got 'x' in E.b"):
+            array.append(E.b("x"))  # type: ignore[arg-type]
+        with self.assertRaises(TypeError):
+            array.append(E.c(1.0))
+        self.assertEqual(len(array), 0)
+        values = [E.a(1, 2.5), E.a(np.int32(3), np.float32(0.5)), E.b(True), E.c(1j)]  # type: ignore[arg-type]
+        array.extend(values)
+        self.assertEqual(list(array), values)
+        self.assertEqual([type(field) for field in array[0]], [int, float])
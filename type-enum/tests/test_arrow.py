@@ -0,0 +1,97 @@
+import datetime
+from pathlib import Path
+import tempfile
+from typing import Any, Optional
+import unittest
+
+from type_enum import Field, TypeEnum
+
+from .common import CustomTestCase
+
+try:
+    import pyarrow as pa  # type: ignore[import-untyped]
+
+    from type_enum import arrow
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+class Color(TypeEnum):
+    name: Field[str]
+    rgb: Field[int, int, int]
+
+
+class Event(TypeEnum):
+    click: Field[int, int]
+    key: Field[str, Optional[bool]]
+    paint: Field[Color.T, list[float]]
+    at: Field[datetime.datetime]
+    quit: Field[()]
+
+
+EVENTS: list[Any] = [
+    Event.click(1, 2),
+    Event.key("a", None),
+    Event.paint(Color.rgb(1, 2, 3), [0.5]),
+    Event.quit(),
+    Event.at(datetime.datetime(2024, 1, 1, 12, 30)),
+    Event.paint(Color.name("red"), []),
+]
+
+
+@unittest.skipIf(pa is None, "requires pyarrow")
+class ArrowTest(CustomTestCase):
+    def test_type(self) -> None:
+        union_type = arrow.arrow_type(Event)
+        self.assertEqual(union_type.mode, "dense")
+        self.assertEqual(union_type.type_codes, [0, 1, 2, 3, 4])
+        self.assertEqual(
+            [union_type.field(i).name for i in range(5)],
+            ["click", "key", "paint", "at", "quit"],
+        )
+        self.assertEqual(
+            union_type.field(0).type,
+            pa.struct([("field0", pa.int64()), ("field1", pa.int64())]),
+        )
+        self.assertEqual(
+            union_type.field(2).type.field(0).type, arrow.arrow_type(Color)
+        )
+
+        class Bad(TypeEnum):
+            A: Field[complex]
+
+        with self.assertRaises(TypeError):
+            arrow.arrow_type(Bad)
+
+    def test_roundtrip(self) -> None:
+        array = arrow.to_arrow(Event, EVENTS)
+        self.assertEqual(array.type, arrow.arrow_type(Event))
+        self.assertEqual(len(array), 6)
+        self.assertEqual(arrow.from_arrow(Event, array), EVENTS)
+        self.assertEqual(arrow.from_arrow(Event, array[2:5]), EVENTS[2:5])
+        self.assertIs(arrow.from_arrow(Event, array)[3], Event.quit())
+        self.assertEqual(arrow.from_arrow(Event, arrow.to_arrow(Event, [])), [])
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(TypeError):
+            arrow.to_arrow(Event, [Color.name("red")])
+        with self.assertRaises(TypeError):
+            arrow.from_arrow(Color, arrow.to_arrow(Event, EVENTS))
+
+    def test_ipc(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "events.arrow"
+            count = arrow.write_arrow(path, Event, iter(EVENTS * 10), batch_size=7)
+            self.assertEqual(count, 60)
+
+            allocated = pa.total_allocated_bytes()
+            values = arrow.read_arrow(path, Event)
+            # the values are read from the mapped file, not copied
+            self.assertEqual(pa.total_allocated_bytes(), allocated)
+            self.assertEqual(values.num_chunks, 9)
+            self.assertEqual(len(values), 60)
+            self.assertEqual(arrow.from_arrow(Event, values[5:15]), (EVENTS * 10)[5:15])
+            self.assertEqual(list(arrow.iter_arrow(path, Event)), EVENTS * 10)
+
+            with self.assertRaises(TypeError):
+                arrow.read_arrow(path, Color)
@@ -0,0 +1,115 @@
+from typing import Any, Optional
+
+import type_enum
+from type_enum import Field, TypeEnum
+from type_enum.binary import BinaryCodec
+
+from .common import CustomTestCase
+
+
+class Color(TypeEnum):
+    name: Field[str]
+    rgb: Field[int, int, int]
+
+
+class Event(TypeEnum):
+    click: Field[int, int]
+    key: Field[str, Optional[bool]]
+    paint: Field[Color.T, bytes]
+    note: Field[Optional[str], Optional[float]]
+    quit: Field[()]
+
+
+EVENTS: list[Any] = [
+    Event.click(1, -2),
+    Event.key("é", None),
+    Event.key("a", True),
+    Event.paint(Color.rgb(1, 2, 3), b"xy"),
+    Event.quit(),
+    Event.note(None, 1.5),
+    Event.note("", None),
+    Event.paint(Color.name("red"), b""),
+]
+
+
+class BinaryTest(CustomTestCase):
+    def test_format(self) -> None:
+        codec = BinaryCodec(Event)
+        self.assertEqual(
+            codec.encode(Event.click(1, 2)),
+            b"\x00" + (1).to_bytes(8, "little") + (2).to_bytes(8, "little"),
+        )
+        self.assertEqual(codec.encode(Event.key("ab", None)), b"\x01\x02\0\0\0\0\0ab")
+        self.assertEqual(codec.encode(Event.quit()), b"\x04")
+
+    def test_roundtrip(self) -> None:
+        codec = BinaryCodec(Event)
+        for event in EVENTS:
+            self.assertEqual(codec.decode(codec.encode(event)), event)
+        data = codec.encode_many(EVENTS)
+        self.assertEqual(codec.decode_many(data), EVENTS)
+        self.assertEqual(codec.decode_many(memoryview(data)), EVENTS)
+        self.assertIs(codec.decode_many(data)[4], Event.quit())
+        self.assertEqual(codec.decode_many(b""), [])
+
+        value, end = codec.decode_from(data, 17)
+        self.assertEqual(value, EVENTS[1])
+        self.assertEqual(codec.decode_from(data, end), (EVENTS[2], end + 8))
+
+    def test_encode_into(self) -> None:
+        codec = BinaryCodec(Event)
+        out = bytearray(b"abc")
+        self.assertEqual(codec.encode_into(EVENTS, out), len(out) - 3)
+        self.assertEqual(out[:3], b"abc")
+        self.assertEqual(codec.decode_many(memoryview(out)[3:]), EVENTS)
+
+        # on errors, nothing is appended
+        size = len(out)
+        with self.assertRaises(TypeError):
+            codec.encode_into([Event.quit(), Color.name("red")], out)
+        bad_key: Any = Event.key(1, None)  # type: ignore[arg-type]
+        with self.assertRaises(TypeError):
+            codec.encode_into([Event.quit(), bad_key], out)
+        with self.assertRaises(ValueError):
+            codec.encode_into([Event.quit(), Event.click(2**70, 0)], out)
+        self.assertEqual(len(out), size)
+
+    def test_invalid_data(self) -> None:
+        codec = BinaryCodec(Event)
+        data = codec.encode_many(EVENTS)
+        with self.assertRaises(ValueError):
+            codec.decode_many(data[:-1])
+        with self.assertRaises(ValueError):
+            codec.decode_many(data + b"\x09")
+        with self.assertRaises(ValueError):
+            codec.decode(data)
+        with self.assertRaises(ValueError):
+            codec.decode_from(data, len(data) - 1)
+
+    def test_construction_hooks(self) -> None:
+        class Point(TypeEnum, hash_cons=True):
+            xy: Field[int, int]
+            named: Field[str]
+
+        codec = BinaryCodec(Point)
+        points = [Point.xy(1, 2), Point.named("origin")]
+        for point in points:
+            self.assertIs(codec.decode(codec.encode(point)), point)
+
+        codec = BinaryCodec(Event)
+        data = codec.encode_many(EVENTS)
+        type_enum.enable_counting(Event)
+        try:
+            codec.decode_many(data)
+        finally:
+            type_enum.disable_counting(Event)
+        self.assertEqual(type_enum.variant_counts(Event)["click"].constructed, 1)
+        self.assertEqual(type_enum.variant_counts(Event)["paint"].constructed, 2)
+        type_enum.reset_counts(Event)
+
+    def test_unsupported_type(self) -> None:
+        class Bad(TypeEnum):
+            A: Field[list[int]]
+
+        with self.assertRaises(TypeError):
+            BinaryCodec(Bad)
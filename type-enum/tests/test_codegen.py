@@ -0,0 +1,202 @@
+from contextlib import redirect_stdout
+import importlib.util
+import io
+from pathlib import Path
+import pickle
+import sys
+import tempfile
+from types import ModuleType
+from typing import Any, get_args
+
+import type_enum
+from type_enum.codegen import generate, main
+
+from . import codegen_example
+from .common import CustomTestCase
+
+
+def import_from_path(name: str, path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class CodegenTest(CustomTestCase):
+    static: Any
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "codegen_example_static.py"
+            path.write_text(generate(codegen_example))
+            cls.static = import_from_path("codegen_example_static", path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        del sys.modules["codegen_example_static"]
+
+    def test_same_structure(self) -> None:
+        for name in ("Color", "Maybe", "Event", "Point", "Expr"):
+            runtime = getattr(codegen_example, name)
+            static = getattr(self.static, name)
+            self.assertEqual(dict(static._tags_), dict(runtime._tags_))
+            for runtime_variant, static_variant in zip(runtime, static):
+                self.assertEqual(static_variant.__name__, runtime_variant.__name__)
+                self.assertEqual(
+                    static_variant.__qualname__, runtime_variant.__qualname__
+                )
+                self.assertEqual(static_variant.__doc__, runtime_variant.__doc__)
+                self.assertEqual(static_variant._fields, runtime_variant._fields)
+                self.assertEqual(
+                    static_variant.__match_args__, runtime_variant.__match_args__
+                )
+                self.assertIs(static_variant.__module__, self.static.__name__)
+
+    def test_pickle(self) -> None:
+        Color = self.static.Color
+        Point = self.static.Point
+        for value in [Color.rgb(1, 2, 3), Color.transparent(), Point.xy(1.0, 2.0)]:
+            result = pickle.loads(pickle.dumps(value))
+            self.assertEqual(result, value)
+            self.assertIs(type(result), type(value))
+        self.assertIs(pickle.loads(pickle.dumps(Color.name("red"))), Color.name("red"))
+
+    def test_isinstance(self) -> None:
+        Color = self.static.Color
+        red = Color.name("red")
+        self.assertIsInstance(red, Color)
+        self.assertIsInstance(red, Color.name)
+        self.assertIsInstance(red, Color.T)
+        self.assertIsInstance(red, tuple)
+        self.assertIsSubclass(Color.rgb, Color)
+        self.assertNotIsInstance(red, codegen_example.Color)
+        self.assertNotIsInstance(codegen_example.Color.name("red"), Color)
+        self.assertNotIsInstance(("red",), Color)
+        self.assertIs(Color.name.rgb, Color.rgb)
+
+    def test_matching(self) -> None:
+        Color = self.static.Color
+
+        def f(color: Any) -> str:
+            color_name: str
+            r: int
+            g: int
+            b: int
+            match color:
+                case Color.transparent():
+                    return "transparent"
+                case Color.name(color_name):
+                    return color_name
+                case Color.rgb(r, g, b):
+                    return f"{r} {g} {b}"
+            return "no match"
+
+        self.assertEqual(f(Color.transparent()), "transparent")
+        self.assertEqual(f(Color.name("red")), "red")
+        self.assertEqual(f(Color.rgb(1, 2, 3)), "1 2 3")
+        self.assertEqual(f(codegen_example.Color.name("red")), "no match")
+
+    def test_repr(self) -> None:
+        Color = self.static.Color
+        for runtime, static in [
+            (codegen_example.Color.transparent(), Color.transparent()),
+            (codegen_example.Color.name("red"), Color.name("red")),
+            (codegen_example.Color.rgb(1, 2, 3), Color.rgb(1, 2, 3)),
+        ]:
+            self.assertEqual(repr(static), repr(runtime))
+
+    def test_generic(self) -> None:
+        Maybe = self.static.Maybe
+        a = Maybe.some[int](3)
+        self.assertEqual(repr(a), "Maybe.some(3)")
+        self.assertIsInstance(a, Maybe)
+        self.assertEqual(Maybe.T[int], Maybe.nothing | Maybe.some[int])
+        self.assertIs(Maybe.some[int], Maybe.some[int])
+        self.assertIn(Maybe.some[int], get_args(Maybe.T[int]))
+        with self.assertRaises(TypeError):
+            Maybe.some[int, str]
+
+    def test_namedtuple_methods(self) -> None:
+        Color = self.static.Color
+        rgb = Color.rgb(1, 2, 3)
+        self.assertEqual(rgb.field1, 2)
+        self.assertEqual(rgb._replace(field0=0), Color.rgb(0, 2, 3))
+        self.assertEqual(rgb._asdict(), {"field0": 1, "field1": 2, "field2": 3})
+        self.assertEqual(Color.rgb._make([4, 5, 6]), Color.rgb(4, 5, 6))
+        with self.assertRaises(TypeError):
+            Color.rgb._make([4, 5])
+        with self.assertRaises(TypeError):
+            Color.rgb(1, 2)
+
+    def test_bulk_construction(self) -> None:
+        Color = self.static.Color
+        self.assertEqual(Color.rgb.from_rows([(1, 2, 3)]), [Color.rgb(1, 2, 3)])
+        self.assertIs(Color.name.from_columns(["red"])[0], Color.name("red"))
+        with self.assertRaises(TypeError):
+            Color.rgb.from_columns([1], [2], ["3"], check=True)
+
+    def test_interning(self) -> None:
+        Color = self.static.Color
+        self.assertIs(Color.transparent(), Color.transparent())
+        self.assertIs(Color.transparent._make(()), Color.transparent())
+        self.assertIs(Color.name("red"), Color.name("red"))
+        self.assertIs(Color.name._make(["red"]), Color.name("red"))
+        self.assertEqual(type_enum.interning_info(Color.name).maxsize, 64)
+        self.assertIsNot(Color.rgb(1, 2, 3), Color.rgb(1, 2, 3))
+
+    def test_hash_cons(self) -> None:
+        Expr = self.static.Expr
+        self.assertIs(Expr.neg(Expr.lit(1)), Expr.neg(Expr.lit(1)))
+        self.assertEqual(type_enum.hash_cons_info(Expr).hits, 2)
+
+    def test_equality(self) -> None:
+        Color = self.static.Color
+        self.assertEqual(Color.name("red"), Color.name("red"))
+        self.assertEqual(hash(Color.name("red")), hash(Color.name("red")))
+        self.assertNotEqual(Color.name("red"), ("red",))
+        self.assertNotEqual(Color.name("red"), codegen_example.Color.name("red"))
+        self.assertNotEqual(hash(Color.transparent()), hash(()))
+
+        Point = self.static.Point
+        xy = Point.xy(1.0, 2.0)
+        self.assertEqual(hash(xy), xy.__dict__["_hash_"])
+        self.assertNotIn("_hash_", pickle.loads(pickle.dumps(xy)).__dict__)
+        self.assertEqual(xy, Point.xy(1.0, 2.0))
+        self.assertNotEqual(Point.origin(), ())
+
+    def test_annotations(self) -> None:
+        Event = self.static.Event
+        self.assertEqual(Event.paint.__annotations__["field0"], self.static.Color.T)
+        self.assertEqual(
+            Event.open.__annotations__, codegen_example.Event.open.__annotations__
+        )
+        self.assertEqual(Event._dispatch_({v: len for v in Event})(Event.open(1, 2)), 2)
+
+    def test_cli(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with redirect_stdout(io.StringIO()):
+                main(["tests.codegen_example", "--output-dir", tmpdir])
+            source = (Path(tmpdir) / "codegen_example_static.py").read_text()
+        self.assertEqual(source, generate(codegen_example))
+
+    def test_no_import_of_source(self) -> None:
+        source = generate(codegen_example)
+        self.assertIn("import tests.codegen_types\n", source)
+        self.assertNotIn("import tests.codegen_example", source)
+        # the generated code only imports private names from `type_enum`
+        self.assertNotIn("from collections", source)
+        module = ModuleType("codegen_local")
+        exec(
+            "from enum import Enum\n"
+            "from type_enum import Field, TypeEnum\n"
+            "class Mode(Enum):\n"
+            "    READ = 1\n"
+            "class E(TypeEnum):\n"
+            "    open: Field[Mode]\n",
+            module.__dict__,
+        )
+        with self.assertRaisesRegex(ValueError, "codegen_local.Mode is defined in"):
+            generate(module)
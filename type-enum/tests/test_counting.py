@@ -0,0 +1,126 @@
+import threading
+from typing import Generic, Tuple, Type, TypeVar
+
+import type_enum
+from type_enum import TypeEnum, VariantCounts
+
+from .common import CustomTestCase
+
+T = TypeVar("T")
+
+
+class Pet(TypeEnum):
+    Cat: Type[Tuple[str]]
+    Dog: Type[Tuple[str, int]]
+
+
+class CountingTest(CustomTestCase):
+    def test_construction(self) -> None:
+        class E(TypeEnum):
+            A: Type[Tuple[int]]
+            B: Type[Tuple[()]]
+
+        original_new = E.A.__new__
+        E.A(0)
+        type_enum.enable_counting(E)
+        try:
+            self.assertEqual(tuple(E.A(1)), (1,))
+            E.A(2)
+            E.B()
+        finally:
+            type_enum.disable_counting(E)
+        E.A(3)
+        self.assertIs(E.A.__new__, original_new)
+        self.assertEqual(
+            type_enum.variant_counts(E),
+            {"A": VariantCounts(2, 0), "B": VariantCounts(1, 0)},
+        )
+        type_enum.reset_counts(E)
+        self.assertEqual(
+            type_enum.variant_counts(E),
+            {"A": VariantCounts(0, 0), "B": VariantCounts(0, 0)},
+        )
+
+    def test_generic_and_snapshot(self) -> None:
+        class Maybe(TypeEnum, Generic[T]):
+            some: Type[Tuple[T]]
+            nothing: Type[Tuple[()]]
+
+        type_enum.enable_counting(Maybe)
+        type_enum.enable_counting(Pet)
+        try:
+            Maybe.some[int](3)
+            Maybe.some(4)
+            Pet.Dog("Rex", 3)
+            Pet.Dog("Bello", 5)
+        finally:
+            type_enum.disable_counting(Maybe)
+            type_enum.disable_counting(Pet)
+        self.assertEqual(type_enum.variant_counts(Maybe)["some"].constructed, 2)
+        self.assertEqual(type_enum.variant_counts(Pet)["Dog"].constructed, 2)
+        snapshot = type_enum.snapshot_counts()
+        self.assertEqual(snapshot[f"{__name__}.Pet"]["Dog"], VariantCounts(2, 0))
+        type_enum.reset_counts()
+        self.assertEqual(type_enum.variant_counts(Pet)["Dog"], VariantCounts(0, 0))
+
+    def test_dispatch(self) -> None:
+        class E(TypeEnum):
+            A: Type[Tuple[int]]
+            B: Type[Tuple[()]]
+
+        before = E._dispatch_({E.A: lambda a: a[0], E.B: lambda b: -1})
+        a, b = E.A(5), E.B()
+        type_enum.enable_counting(E)
+        try:
+            during = E._dispatch_({E.A: lambda a: a[0] + 1, E.B: lambda b: -2})
+            self.assertEqual(before(a), 5)
+            self.assertEqual(during(a), 6)
+            self.assertEqual(during(b), -2)
+        finally:
+            type_enum.disable_counting(E)
+        before(a)
+        during(b)
+        self.assertEqual(
+            type_enum.variant_counts(E),
+            {"A": VariantCounts(0, 2), "B": VariantCounts(0, 1)},
+        )
+
+    def test_threads(self) -> None:
+        class E(TypeEnum):
+            A: Type[Tuple[int]]
+
+        def work() -> None:
+            for i in range(1000):
+                E.A(i)
+
+        type_enum.enable_counting(E)
+        try:
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            type_enum.disable_counting(E)
+        self.assertEqual(type_enum.variant_counts(E)["A"].constructed, 4000)
+
+    def test_lazy(self) -> None:
+        class E(TypeEnum, lazy=True):
+            A: Type[Tuple[int]]
+            B: Type[Tuple[()]]
+
+        self.assertEqual(
+            type_enum.variant_counts(E),
+            {"A": VariantCounts(0, 0), "B": VariantCounts(0, 0)},
+        )
+        E.A(1)
+        type_enum.enable_counting(E)
+        try:
+            E.A(2)
+            E.B()
+        finally:
+            type_enum.disable_counting(E)
+        self.assertEqual(
+            type_enum.variant_counts(E),
+            {"A": VariantCounts(1, 0), "B": VariantCounts(1, 0)},
+        )
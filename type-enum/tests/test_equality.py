@@ -0,0 +1,97 @@
+import copy
+from typing import Generic, TypeVar
+
+from type_enum import Field, TypeEnum
+
+from .common import CustomTestCase
+
+U = TypeVar("U")
+
+
+class EqualityTest(CustomTestCase):
+    def test_variants(self) -> None:
+        class E(TypeEnum):
+            A: Field[int]
+            B: Field[int]
+            C: Field[()]
+            D: Field[()]
+
+        self.assertEqual(E.A(3), E.A(3))
+        self.assertNotEqual(E.A(3), E.A(4))
+        self.assertNotEqual(E.A(3), E.B(3))
+        self.assertNotEqual(E.C(), E.D())
+        self.assertFalse(E.A(3) != E.A(3))
+        self.assertTrue(E.A(3) != E.B(3))
+        self.assertEqual(hash(E.A(3)), hash(E.A(3)))
+        self.assertNotEqual(hash(E.A(3)), hash(E.B(3)))
+        self.assertNotEqual(hash(E.C()), hash(E.D()))
+        self.assertEqual(len({E.A(3), E.B(3), E.A(3), E.C(), E.D()}), 4)
+
+    def test_plain_tuples(self) -> None:
+        class E(TypeEnum):
+            A: Field[int]
+            B: Field[()]
+
+        self.assertNotEqual(E.A(3), (3,))
+        self.assertNotEqual((3,), E.A(3))
+        self.assertNotEqual(E.B(), ())
+        self.assertEqual({(3,): "tuple", E.A(3): "variant"}[(3,)], "tuple")
+        self.assertEqual(tuple(E.A(3)), (3,))
+        self.assertNotEqual(E.A(3), 3)
+
+    def test_other_enum(self) -> None:
+        class E(TypeEnum):
+            A: Field[int]
+
+        class F(TypeEnum):
+            A: Field[int]
+
+        self.assertNotEqual(E.A(3), F.A(3))
+
+    def test_cached_hash(self) -> None:
+        class E(TypeEnum, cache_hash=True):
+            A: Field[int, str]
+            B: Field[int, str]
+
+        a = E.A(1, "x")
+        self.assertEqual(hash(a), hash(E.A(1, "x")))
+        self.assertEqual(a.__dict__["_hash_"], hash(a))
+        self.assertNotEqual(hash(a), hash(E.B(1, "x")))
+        self.assertEqual(a, E.A(1, "x"))
+        self.assertNotEqual(a, E.B(1, "x"))
+        self.assertIsInstance(a, E)
+        self.assertIsInstance(a, E.A)
+        self.assertEqual(repr(a), "E.A(1, 'x')")
+        self.assertEqual(E.A.__name__, "A")
+        self.assertEqual(E.A._tag_, 0)
+        # the cached hash is not copied along
+        self.assertNotIn("_hash_", copy.copy(a).__dict__)
+        self.assertEqual(copy.copy(a), a)
+
+        match a:
+            case E.A(x, y):
+                self.assertEqual((x, y), (1, "x"))
+            case _:
+                self.fail("no match")
+
+    def test_cached_hash_generic(self) -> None:
+        class Maybe(TypeEnum, Generic[U], cache_hash=True):
+            some: Field[U]
+            nothing: Field[()]
+
+        a = Maybe.some[int](3)
+        self.assertEqual(hash(a), hash(Maybe.some(3)))
+        self.assertEqual(a, Maybe.some(3))
+        self.assertNotEqual(Maybe.nothing(), ())
+        self.assertIsInstance(a, Maybe.some)
+
+    def test_cached_hash_lazy(self) -> None:
+        class E(TypeEnum, lazy=True, cache_hash=True):
+            A: Field[int]
+            B: Field[int]
+
+        a = E.A(3)
+        self.assertEqual(hash(a), hash(E.A(3)))
+        self.assertIn("_hash_", a.__dict__)
+        self.assertNotEqual(E.A(3), E.B(3))
+        self.assertEqual(len({E.A(3), E.B(3), E.A(3)}), 2)
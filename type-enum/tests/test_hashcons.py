@@ -0,0 +1,135 @@
+import copy
+import threading
+from typing import Any
+
+import type_enum
+from type_enum import Field, TypeEnum
+
+from .common import CustomTestCase
+
+
+class HashConsTest(CustomTestCase):
+    def test_canonical(self) -> None:
+        class Expr(TypeEnum, hash_cons=True):
+            lit: Field[int]
+            add: Field[Any, Any]
+            zero: Field[()]
+
+        a = Expr.add(Expr.lit(1), Expr.lit(2))
+        b = Expr.add(Expr.lit(1), Expr.lit(2))
+        self.assertIs(a, b)
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, Expr.add(Expr.lit(2), Expr.lit(1)))
+        self.assertNotEqual(a, (Expr.lit(1), Expr.lit(2)))
+        self.assertEqual(len({a, b, Expr.lit(1)}), 2)
+        self.assertIs(Expr.lit(field0=1), Expr.lit(1))  # type: ignore[call-arg]
+        self.assertIs(Expr.lit._make([1]), Expr.lit(1))
+        self.assertIs(a._replace(field1=Expr.lit(2)), a)  # type: ignore[call-arg]
+        self.assertIs(copy.copy(a), a)
+        self.assertIs(copy.deepcopy(a), a)
+        self.assertIs(Expr.zero(), Expr.zero())
+        self.assertEqual(repr(a), "Expr.add(Expr.lit(1), Expr.lit(2))")
+
+        match a:
+            case Expr.add(Expr.lit(x), Expr.lit(y)):
+                self.assertEqual((x, y), (1, 2))
+            case _:
+                self.fail("no match")
+
+    def test_typed(self) -> None:
+        class E(TypeEnum, hash_cons=True):
+            leaf: Field[Any]
+
+        one = E.leaf(1)
+        for field in [True, 1.0, 1 + 0j]:
+            value = E.leaf(field)
+            self.assertIsNot(value, one)
+            self.assertIs(type(value[0]), type(field))
+            self.assertIs(E.leaf(field), value)
+        zero = E.leaf(0.0)
+        self.assertEqual(str(E.leaf(-0.0)[0]), "-0.0")
+        self.assertIs(E.leaf(0.0), zero)
+        self.assertIs(E.leaf(0), E.leaf(0))
+
+    def test_info(self) -> None:
+        class Expr(TypeEnum, hash_cons=True):
+            lit: Field[int]
+            neg: Field[Any]
+
+        self.assertEqual(type_enum.hash_cons_info(Expr), (0, 0, 0))
+        self.assertEqual(type_enum.hash_cons_info(Expr).hit_rate, 0.0)
+        a = Expr.neg(Expr.lit(1))
+        b = Expr.neg(Expr.lit(1))
+        info = type_enum.hash_cons_info(Expr)
+        self.assertEqual(info, (2, 2, 2))
+        self.assertEqual(info.hit_rate, 0.5)
+        self.assertIs(a, b)
+
+    def test_collect(self) -> None:
+        class Expr(TypeEnum, hash_cons=True):
+            lit: Field[int]
+            neg: Field[Any]
+
+        kept = Expr.lit(1)
+        tree: Any = Expr.lit(2)
+        for _ in range(100):
+            tree = Expr.neg(tree)
+        self.assertEqual(type_enum.hash_cons_info(Expr).size, 102)
+        # nothing can be removed while the values are alive
+        self.assertEqual(type_enum.collect_hash_cons(Expr), 0)
+        del tree
+        # a single collection removes the whole tree
+        self.assertEqual(type_enum.collect_hash_cons(Expr), 101)
+        self.assertEqual(type_enum.hash_cons_info(Expr).size, 1)
+        self.assertIs(Expr.lit(1), kept)
+
+    def test_automatic_collection(self) -> None:
+        class E(TypeEnum, hash_cons=True):
+            A: Field[int]
+
+        for i in range(10 * type_enum._hashcons.MIN_THRESHOLD):
+            E.A(i)
+        self.assertLess(
+            type_enum.hash_cons_info(E).size, type_enum._hashcons.MIN_THRESHOLD
+        )
+
+    def test_lazy(self) -> None:
+        class E(TypeEnum, lazy=True, hash_cons=True):
+            A: Field[int]
+
+        self.assertIs(E.A(1), E.A(1))
+        self.assertEqual(type_enum.hash_cons_info(E).hits, 1)
+
+    def test_threads(self) -> None:
+        class E(TypeEnum, hash_cons=True):
+            A: Field[int]
+
+        results: list[Any] = []
+
+        def construct() -> None:
+            results.extend(E.A(i % 10) for i in range(1000))
+
+        threads = [threading.Thread(target=construct) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(value) for value in results}), 10)
+
+    def test_invalid(self) -> None:
+        class E(TypeEnum):
+            A: Field[int]
+
+        with self.assertRaises(TypeError):
+            type_enum.hash_cons_info(E)
+
+        with self.assertRaises(TypeError):
+
+            class F(TypeEnum, hash_cons=True, cache_hash=True):
+                A: Field[int]
+
+        class G(TypeEnum, hash_cons=True):
+            A: Field[list[int]]
+
+        with self.assertRaises(TypeError):
+            G.A([1])
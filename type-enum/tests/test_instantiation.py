@@ -1,9 +1,10 @@
 # from __future__ import annotations
 
-from typing import Generic, Tuple, Type, TypeVar
+import gc
+from typing import Annotated, Any, Generic, Tuple, Type, TypeVar, get_args, get_origin
 from typing_extensions import assert_type
 
-from type_enum import TypeEnum
+from type_enum import Field, TypeEnum
 
 from .common import CustomTestCase
 
@@ -71,7 +72,11 @@ class InstantiationTest(CustomTestCase):
                     return 0
 
         self.assertEqual(f(a), 3)
-        self.assertEqual(repr(Maybe.Some), "<class 'tests.test_instantiation.Some'>")
+        self.assertEqual(
+            repr(Maybe.Some),
+            "<class 'tests.test_instantiation.InstantiationTest.test_generic."
+            "<locals>.Maybe.Some'>",
+        )
 
         with self.assertRaises(TypeError):
             Maybe.Some[int, str](3)  # type: ignore[misc]
@@ -100,6 +105,46 @@ class InstantiationTest(CustomTestCase):
         self.assertEqual(f(a), 3)
         self.assertEqual(repr(a), "E.A(3)")
 
+    def test_generic_specializations(self) -> None:
+        U = TypeVar("U")
+
+        for kwds in [{}, {"cache_hash": True}, {"lazy": True}]:
+
+            class Maybe(TypeEnum, Generic[U], **kwds):
+                Some: Type[Tuple[U]]
+                Nothing: Type[Tuple[()]]
+
+            some_int = Maybe.Some[int]
+            self.assertIs(Maybe.Some[int], some_int)
+            self.assertIs(get_origin(some_int), Maybe.Some)
+            self.assertEqual(get_args(some_int), (int,))
+            maybe: Any = Maybe
+            self.assertEqual(maybe.Some[U][int], some_int)
+            self.assertEqual(
+                repr(some_int),
+                "tests.test_instantiation.InstantiationTest."
+                "test_generic_specializations.<locals>.Maybe.Some[int]",
+            )
+
+            a = some_int(3)
+            self.assertIs(type(a), Maybe.Some)
+            self.assertEqual(a, Maybe.Some(3))
+            self.assertFalse(hasattr(a, "__orig_class__"))
+            b = Maybe.Some[str](field0="x")  # type: ignore[call-arg]
+            self.assertEqual(b, Maybe.Some("x"))
+
+            # the members of a parameterized union are fast as well
+            members = get_args(maybe.T[int])
+            self.assertIn(some_int, members)
+            self.assertEqual(members[members.index(some_int)](4), Maybe.Some(4))
+
+            # unhashable parameters are not cached, but still work
+            annotated = maybe.Some[Annotated[int, {}]]
+            self.assertIsNot(maybe.Some[Annotated[int, {}]], annotated)
+            self.assertEqual(annotated(5), Maybe.Some(5))
+            with self.assertRaises(TypeError):
+                maybe.Some[int, str]
+
     def test_generic_without_base_class(self) -> None:
         U = TypeVar("U")
 
@@ -163,3 +208,74 @@ class InstantiationTest(CustomTestCase):
 
             class E(TypeEnum):
                 A = {}  # type: ignore[var-annotated,misc]
+
+
+class BulkConstructionTest(CustomTestCase):
+    def test_from_rows(self) -> None:
+        class E(TypeEnum):
+            rgb: Field[int, int, float]
+            empty: Field[()]
+
+        values = E.rgb.from_rows([(1, 2, 3.0), (4, 5, 6.0)])
+        assert_type(values, list[E.rgb])
+        self.assertEqual(values, [E.rgb(1, 2, 3.0), E.rgb(4, 5, 6.0)])
+        self.assertIs(type(values[0]), E.rgb)
+        self.assertEqual(E.rgb.from_rows([], check=True), [])
+        self.assertIs(E.empty.from_rows([(), ()])[1], E.empty())
+        with self.assertRaisesRegex(TypeError, "row 1"):
+            E.rgb.from_rows([(1, 2, 3.0), (4, 5)])  # type: ignore[list-item]
+        with self.assertRaisesRegex(TypeError, "field 2 of .*rgb.*'x' in row 1"):
+            E.rgb.from_rows([(1, 2, 3.0), (4, 5, "x")], check=True)  # type: ignore[list-item]
+        # rows can be any iterables
+        rows = [iter((1, 2, 3.0)), iter((4, 5, 6.0))]
+        self.assertEqual(E.rgb.from_rows(rows, check=True), values)  # type: ignore[arg-type]
+
+    def test_from_columns(self) -> None:
+        class E(TypeEnum):
+            rgb: Field[int, int, float]
+            name: Field[str | None]
+
+        values = E.rgb.from_columns([1, 4], [2, 5], [3.0, 6], check=True)
+        assert_type(values, list[E.rgb])
+        self.assertEqual(values, [E.rgb(1, 2, 3.0), E.rgb(4, 5, 6)])
+        self.assertEqual(E.name.from_columns(["a", None]), [E.name("a"), E.name(None)])
+        with self.assertRaises(TypeError):
+            E.rgb.from_columns([1], [2])  # type: ignore[call-arg]
+        with self.assertRaises(ValueError):
+            E.rgb.from_columns([1], [2], [3.0, 4.0])
+        with self.assertRaisesRegex(TypeError, "expected Optional\\[str\\], got 1"):
+            E.name.from_columns(["a", 1], check=True)  # type: ignore[list-item]
+
+    def test_pause_gc(self) -> None:
+        class E(TypeEnum):
+            rgb: Field[int, int, float]
+
+        self.assertTrue(gc.isenabled())
+        values = E.rgb.from_rows([(1, 2, 3.0)], pause_gc=True)
+        self.assertEqual(E.rgb.from_columns([1], [2], [3.0], pause_gc=True), values)
+        self.assertTrue(gc.isenabled())
+        with self.assertRaises(TypeError):
+            E.rgb.from_rows([(1, 2)], pause_gc=True)  # type: ignore[list-item]
+        self.assertTrue(gc.isenabled())
+        # the collector stays disabled if it was disabled before
+        gc.disable()
+        try:
+            E.rgb.from_rows([(1, 2, 3.0)], pause_gc=True)
+            self.assertFalse(gc.isenabled())
+        finally:
+            gc.enable()
+
+    def test_replaced_new(self) -> None:
+        U = TypeVar("U")
+
+        class E(TypeEnum, intern={"name": 8}):
+            name: Field[str]
+
+        class Maybe(TypeEnum, Generic[U]):
+            some: Field[U]
+
+        self.assertIs(E.name.from_columns(["a"])[0], E.name("a"))
+        self.assertIs(E.name.from_rows([("b",)])[0], E.name("b"))
+        values = Maybe.some[int].from_rows([(1,)], check=True)
+        assert_type(values, list[Maybe.some[int]])
+        self.assertEqual(values, [Maybe.some(1)])
@@ -0,0 +1,128 @@
+import copy
+from typing import Generic, TypeVar
+
+import type_enum
+from type_enum import Field, TypeEnum
+
+from .common import CustomTestCase
+
+U = TypeVar("U")
+
+
+class SingletonTest(CustomTestCase):
+    def test_nullary(self) -> None:
+        class E(TypeEnum):
+            A: Field[()]
+            B: Field[()]
+            C: Field[int]
+
+        self.assertIs(E.A(), E.A())
+        self.assertIsNot(E.A(), E.B())
+        self.assertIsNot(E.C(1), E.C(1))
+        self.assertIs(copy.copy(E.A()), E.A())
+        self.assertIs(copy.deepcopy(E.A()), E.A())
+        self.assertEqual(repr(E.A()), "E.A()")
+        self.assertIs(E.A._make(()), E.A())
+        self.assertIs(E.A()._replace(), E.A())
+        with self.assertRaises(TypeError):
+            E.A._make([1])
+
+    def test_lazy_and_generic(self) -> None:
+        class E(TypeEnum, lazy=True):
+            A: Field[()]
+
+        class Maybe(TypeEnum, Generic[U], cache_hash=True):
+            nothing: Field[()]
+            some: Field[U]
+
+        self.assertIs(E.A(), E.A())
+        self.assertIs(Maybe.nothing(), Maybe.nothing())
+
+    def test_counting(self) -> None:
+        class E(TypeEnum):
+            A: Field[()]
+
+        type_enum.enable_counting(E)
+        try:
+            self.assertIs(E.A(), E.A())
+        finally:
+            type_enum.disable_counting(E)
+        self.assertEqual(type_enum.variant_counts(E)["A"].constructed, 2)
+        self.assertIs(E.A(), E.A())
+
+
+class InterningTest(CustomTestCase):
+    def test_interned(self) -> None:
+        class Token(TypeEnum, intern={"keyword": 2}):
+            keyword: Field[str]
+            number: Field[int]
+
+        kw_if = Token.keyword("if")
+        self.assertIs(Token.keyword("if"), kw_if)
+        self.assertIsNot(Token.number(1), Token.number(1))
+        self.assertEqual(type_enum.interning_info(Token.keyword), (1, 1, 2, 1))
+        with self.assertRaises(TypeError):
+            type_enum.interning_info(Token.number)
+
+        # the least recently used value is evicted
+        Token.keyword("else")
+        Token.keyword("while")
+        self.assertIsNot(Token.keyword("if"), kw_if)
+        self.assertEqual(type_enum.interning_info(Token.keyword).currsize, 2)
+
+        type_enum.clear_interned(Token.keyword)
+        self.assertEqual(type_enum.interning_info(Token.keyword), (0, 0, 2, 0))
+
+        # `_make` and `_replace` return interned values as well
+        kw_if = Token.keyword("if")
+        self.assertIs(Token.keyword._make(["if"]), kw_if)
+        self.assertIs(Token.keyword("else")._replace(field0="if"), kw_if)  # type: ignore[call-arg]
+
+    def test_typed(self) -> None:
+        class E(TypeEnum, intern=["A"]):
+            A: Field[object]
+
+        self.assertIs(E.A(1), E.A(1))
+        self.assertIs(type(E.A(True)[0]), bool)
+        self.assertEqual(type_enum.interning_info(E.A).maxsize, 1024)
+
+    def test_unhashable(self) -> None:
+        class E(TypeEnum, intern=["A"]):
+            A: Field[list[int]]
+
+        with self.assertRaises(TypeError):
+            E.A([1])
+
+    def test_lazy(self) -> None:
+        class E(TypeEnum, lazy=True, intern=["A"]):
+            A: Field[int]
+
+        self.assertIs(E.A(1), E.A(1))
+
+    def test_counting(self) -> None:
+        class E(TypeEnum, intern=["A"]):
+            A: Field[int]
+
+        type_enum.enable_counting(E)
+        try:
+            self.assertIs(E.A(1), E.A(1))
+        finally:
+            type_enum.disable_counting(E)
+        self.assertEqual(type_enum.variant_counts(E)["A"].constructed, 2)
+        self.assertIs(E.A(2), E.A(2))
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(TypeError):
+
+            class E(TypeEnum, intern=["B"]):
+                A: Field[int]
+
+        with self.assertRaises(TypeError):
+
+            class F(TypeEnum, intern="A"):
+                A: Field[int]
+
+        with self.assertRaises(ValueError):
+
+            class G(TypeEnum, intern={"A": 0}):
+                A: Field[int]
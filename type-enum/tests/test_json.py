@@ -0,0 +1,110 @@
+import io
+from typing import Any, Optional
+
+from type_enum import Field, TypeEnum
+from type_enum.json import JsonCodec
+
+from .common import CustomTestCase
+
+
+class Color(TypeEnum):
+    name: Field[str]
+    rgb: Field[int, int, int]
+
+
+class Event(TypeEnum):
+    click: Field[int, int]
+    key: Field[str, Optional[bool]]
+    paint: Field[Color.T, list[float]]
+    labels: Field[dict[str, list[Color.T]], Optional[Color.T]]
+    raw: Field[Any]
+    quit: Field[()]
+
+
+EVENTS: list[Any] = [
+    Event.click(1, -2),
+    Event.key("é", None),
+    Event.paint(Color.rgb(1, 2, 3), [0.5]),
+    Event.labels({"a": [Color.name("red")]}, None),
+    Event.labels({}, Color.name("blue")),
+    Event.raw({"x": [1, None]}),
+    Event.quit(),
+]
+
+
+class JsonTest(CustomTestCase):
+    def test_format(self) -> None:
+        codec = JsonCodec(Event)
+        self.assertEqual(codec.encode(Event.click(1, 2)), '["click",1,2]')
+        self.assertEqual(
+            codec.to_data(Event.labels({"a": [Color.name("red")]}, None)),
+            ["labels", {"a": [["name", "red"]]}, None],
+        )
+        self.assertEqual(codec.to_data(Event.quit()), ["quit"])
+        self.assertEqual(
+            codec.from_data(["paint", ["rgb", 1, 2, 3], [1, 2.5]]),
+            Event.paint(Color.rgb(1, 2, 3), [1.0, 2.5]),
+        )
+
+    def test_roundtrip(self) -> None:
+        codec = JsonCodec(Event)
+        for event in EVENTS:
+            self.assertEqual(codec.decode(codec.encode(event)), event)
+        self.assertIs(codec.decode('["quit"]'), Event.quit())
+        # ints are converted for float fields
+        value = codec.decode('["paint", ["name", "red"], [1]]')
+        self.assertIs(type(value[1][0]), float)
+
+    def test_invalid(self) -> None:
+        codec = JsonCodec(Event)
+        for text in [
+            '["click", 1, "2"]',
+            '["click", true, 2]',
+            '["click", 1]',
+            '["quit", 1]',
+            '["unknown"]',
+            "[]",
+            '{"click": [1, 2]}',
+            '["paint", ["rgb", 1, 2, 3.5], []]',
+            '["paint", ["name", "red"], ["x"]]',
+            '["labels", {"a": [3]}, null]',
+            '["key", "a", 1]',
+            '["click", 1',
+        ]:
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                codec.decode(text)
+        with self.assertRaisesRegex(ValueError, "field 2 of Color.rgb: expected int"):
+            codec.decode('["paint", ["rgb", 1, 2, "3"], []]')
+        with self.assertRaises(TypeError):
+            codec.encode(Color.name("red"))
+
+    def test_lines(self) -> None:
+        codec = JsonCodec(Event)
+        file = io.StringIO()
+        self.assertEqual(codec.write_lines(iter(EVENTS), file), len(EVENTS))
+        self.assertEqual(file.getvalue().count("\n"), len(EVENTS))
+        file.seek(0)
+        self.assertEqual(list(codec.iter_lines(file)), EVENTS)
+
+        binary_file = io.BytesIO(b'["quit"]\n\n["click", 1, 2]\n')
+        self.assertEqual(
+            list(codec.iter_lines(binary_file)), [Event.quit(), Event.click(1, 2)]
+        )
+        lines = codec.iter_lines(io.StringIO('["quit"]\n\n["click", 1]\n'))
+        self.assertIs(next(lines), Event.quit())
+        with self.assertRaisesRegex(ValueError, "^line 3: "):
+            next(lines)
+
+    def test_hash_cons(self) -> None:
+        class Point(TypeEnum, hash_cons=True):
+            xy: Field[int, int]
+
+        point = Point.xy(1, 2)
+        self.assertIs(JsonCodec(Point).decode('["xy", 1, 2]'), point)
+
+    def test_unsupported_type(self) -> None:
+        class Bad(TypeEnum):
+            A: Field[set[int]]
+
+        with self.assertRaises(TypeError):
+            JsonCodec(Bad)
@@ -0,0 +1,123 @@
+import threading
+from typing import Generic, Literal, Tuple, Type, TypeVar, Union
+
+from type_enum import TypeEnum
+
+from .common import CustomTestCase
+
+
+class LazyTest(CustomTestCase):
+    def test_variants_created_on_access(self) -> None:
+        class E(TypeEnum, lazy=True):
+            A: Type[Tuple[int]]
+            B: Type[Tuple[int, str]]
+
+        self.assertNotIsInstance(vars(E)["A"], type)
+        self.assertNotIsInstance(vars(E)["B"], type)
+        a = E.A(3)
+        self.assertIsInstance(vars(E)["A"], type)
+        self.assertNotIsInstance(vars(E)["B"], type)
+        self.assertIs(E.A, E.A)
+
+        self.assertIsInstance(a, E)
+        self.assertIsInstance(a, E.A)
+        self.assertIsSubclass(E.A, E)
+        self.assertNotIsInstance((3,), E)
+        self.assertEqual(repr(a), "E.A(3)")
+        self.assertEqual(dict(E._tags_), {"A": 0, "B": 1})
+        self.assertEqual(E.A._tag_, 0)
+
+    def test_siblings(self) -> None:
+        class E(TypeEnum, lazy=True):
+            A: Type[Tuple[int]]
+            B: Type[Tuple[()]]
+
+        self.assertIs(E.A.B, E.B)
+        self.assertIs(E.B.A, E.A)
+        self.assertIs(E.A.A.B.B, E.B)
+        self.assertEqual(list(E), [E.A, E.B])
+
+    def test_concurrent_definitions(self) -> None:
+        errors: list[Exception] = []
+
+        def define(lazy: bool) -> None:
+            for _ in range(200):
+                try:
+
+                    class E(TypeEnum, lazy=lazy):
+                        A: Type[Tuple[int]]
+                        B: Type[Tuple[str]]
+
+                    E.A
+                except Exception as e:
+                    errors.append(e)
+
+        # resolving the annotations of a lazy TypeEnum in one thread does not
+        # interfere with an eager definition in another
+        threads = [
+            threading.Thread(target=define, args=(lazy,)) for lazy in (False, True)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertNotIn("__annotations__", vars(type(TypeEnum)))
+
+    def test_matching(self) -> None:
+        class Color(TypeEnum, lazy=True):
+            transparent: type[tuple[()]]
+            name: type[tuple[str]]
+
+        def f(color: Color.T) -> str:
+            match color:
+                case Color.transparent():
+                    return ""
+                case Color.name(color_name):
+                    return color_name
+
+        self.assertEqual(f(Color.name("red")), "red")
+        self.assertEqual(f(Color.transparent()), "")
+        self.assertIsInstance(Color.name("red"), Color.T)  # type: ignore[arg-type]
+
+    def test_generic(self) -> None:
+        U = TypeVar("U")
+
+        class Maybe(TypeEnum, Generic[U], lazy=True):
+            Some: Type[Tuple[U]]
+            Nothing: Type[Tuple[()]]
+
+        def f(x: Maybe.T[int]) -> int:
+            match x:
+                case Maybe.Some(y):
+                    return y
+                case Maybe.Nothing():
+                    return 0
+
+        self.assertEqual(f(Maybe.Some[int](3)), 3)
+        self.assertEqual(f(Maybe.Nothing()), 0)
+
+    def test_docstring(self) -> None:
+        class E(TypeEnum, lazy=True):
+            A: Type[Tuple[Union[Literal[1], dict[int, list[str]]]]]
+
+        self.assertEqual(E.A.__doc__, "E.A(Union[int, dict[int, list[str]]])")
+        self.assertEqual(E.A(1).__doc__, "E.A(Union[int, dict[int, list[str]]])")
+
+    def test_invalid_body(self) -> None:
+        with self.assertRaises(TypeError):
+
+            class E(TypeEnum, lazy=True):
+                A = 0  # type: ignore[misc]
+
+        with self.assertRaises(TypeError):
+
+            class F(TypeEnum, lazy=True):  # type: ignore[misc]
+                pass
+
+        class G(TypeEnum, lazy=True):
+            A: Type[int]  # type: ignore[misc]
+
+        # the annotations are only checked once a variant is needed
+        with self.assertRaises(TypeError):
+            G.A
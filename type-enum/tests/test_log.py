@@ -0,0 +1,139 @@
+import os
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from type_enum import Field, TypeEnum
+from type_enum.log import EventLog
+
+from .common import CustomTestCase
+
+
+class Account(TypeEnum):
+    deposit: Field[int]
+    withdraw: Field[int, str]
+    close: Field[()]
+
+
+EVENTS: list[Any] = [
+    Account.deposit(10),
+    Account.withdraw(3, "rent"),
+    Account.deposit(5),
+    Account.close(),
+    Account.deposit(7),
+]
+
+
+class EventLogTest(CustomTestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "log"
+
+    def open(self) -> EventLog:
+        log = EventLog(Account, self.path)
+        self.addCleanup(log.close)
+        return log
+
+    def test_append(self) -> None:
+        log = self.open()
+        self.assertEqual(log.append(EVENTS[0]), 0)
+        self.assertEqual(log.extend(EVENTS[1:]), range(1, 5))
+        self.assertEqual(log.extend([]), range(5, 5))
+        self.assertEqual(len(log), 5)
+        self.assertEqual(list(log), EVENTS)
+        self.assertEqual(log[3], Account.close())
+        self.assertEqual(log[-1], Account.deposit(7))
+        self.assertEqual(log[1:3], EVENTS[1:3])
+        with self.assertRaises(IndexError):
+            log[5]
+
+    def test_reopen(self) -> None:
+        with EventLog(Account, self.path) as log:
+            log.extend(EVENTS)
+        log = self.open()
+        self.assertEqual(list(log), EVENTS)
+        log.append(Account.deposit(1))
+        self.assertEqual(log[5], Account.deposit(1))
+
+    def test_scan(self) -> None:
+        log = self.open()
+        log.extend(EVENTS)
+        self.assertEqual(
+            list(log.scan(Account.deposit)),
+            [Account.deposit(10), Account.deposit(5), Account.deposit(7)],
+        )
+        self.assertEqual(
+            list(log.scan(Account.close, Account.deposit, start=2)),
+            [Account.deposit(5), Account.close(), Account.deposit(7)],
+        )
+        self.assertEqual(list(log.scan(start=4)), [Account.deposit(7)])
+        values = log.scan(Account.deposit)
+        log.append(Account.deposit(1))
+        self.assertEqual(len(list(values)), 3)
+        with self.assertRaises(TypeError):
+            log.scan(Account)
+
+    def test_invalid_value(self) -> None:
+        log = self.open()
+        log.append(EVENTS[0])
+        with self.assertRaises(TypeError):
+            log.extend([Account.deposit(1), "not a value"])
+        self.assertEqual(list(log), EVENTS[:1])
+
+    def test_other_enum(self) -> None:
+        class Other(TypeEnum):
+            deposit: Field[int]
+
+        EventLog(Account, self.path).close()
+        with self.assertRaises(ValueError):
+            EventLog(Other, self.path)
+
+    def test_truncated_records(self) -> None:
+        with EventLog(Account, self.path) as log:
+            log.extend(EVENTS)
+        records = self.path / "records"
+        size = records.stat().st_size
+        for cut in (1, 5, 9):
+            with open(records, "r+b") as f:
+                f.truncate(size - cut)
+            log = self.open()
+            self.assertEqual(list(log), EVENTS[:4])
+            self.assertEqual(list(log.scan(Account.deposit)), EVENTS[0:3:2])
+            log.append(EVENTS[4])
+            log.close()
+            self.assertEqual(records.stat().st_size, size)
+
+    def test_damaged_record(self) -> None:
+        with EventLog(Account, self.path) as log:
+            log.extend(EVENTS)
+        records = self.path / "records"
+        with open(records, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            f.write(b"\xff")
+        self.assertEqual(list(self.open()), EVENTS[:4])
+
+    def test_missing_indexes(self) -> None:
+        with EventLog(Account, self.path) as log:
+            log.extend(EVENTS)
+        # as if the log had crashed while writing the indexes of the last three values
+        with open(self.path / "offsets", "r+b") as f:
+            f.truncate(2 * 8 + 5)
+        with open(self.path / "variants" / "deposit", "r+b") as f:
+            f.truncate(8)
+        log = self.open()
+        self.assertEqual(list(log), EVENTS)
+        self.assertEqual(list(log.scan(Account.deposit)), EVENTS[0:5:2])
+
+    def test_stale_indexes(self) -> None:
+        with EventLog(Account, self.path) as log:
+            log.extend(EVENTS)
+        with open(self.path / "records", "r+b") as f:
+            f.truncate(f.seek(0, os.SEEK_END) - 1)
+        with open(self.path / "offsets", "ab") as f:
+            f.write(bytes(8))
+        log = self.open()
+        self.assertEqual(list(log), EVENTS[:4])
+        self.assertEqual(list(log.scan(Account.deposit)), EVENTS[0:3:2])
+        self.assertEqual((self.path / "offsets").stat().st_size, 4 * 8)
+        self.assertEqual((self.path / "variants" / "deposit").stat().st_size, 2 * 8)
@@ -1,4 +1,4 @@
-from typing import Tuple, Type
+from typing import Generic, Tuple, Type, TypeVar
 
 from type_enum import Field, TypeEnum
 
@@ -41,3 +41,80 @@ class MiscTest(CustomTestCase):
 
         self.assertNotIsInstance((), E)
         self.assertNotIsInstance((), E.B)
+
+    def test_other_enum(self) -> None:
+        class E(TypeEnum):
+            A: Type[Tuple[int]]
+
+        class F(TypeEnum):
+            A: Type[Tuple[int]]
+
+        self.assertIsInstance(E.A(3), E)
+        self.assertNotIsInstance(E.A(3), F)
+        self.assertNotIsInstance(3, E)
+        self.assertNotIsSubclass(E.A, F)
+        self.assertNotIsSubclass(tuple, E)
+
+    def test_tags(self) -> None:
+        class E(TypeEnum):
+            A: Type[Tuple[int]]
+            B: Type[Tuple[()]]
+            C: Type[Tuple[str, str]]
+
+        self.assertEqual(E.A._tag_, 0)
+        self.assertEqual(E.B._tag_, 1)
+        self.assertEqual(E.C("a", "b")._tag_, 2)
+        self.assertEqual(dict(E._tags_), {"A": 0, "B": 1, "C": 2})
+
+    def test_variants_named_like_the_api(self) -> None:
+        class Msg(TypeEnum):
+            tags: Field[list[str]]
+            dispatch: Field[()]
+
+        self.assertEqual(Msg.tags(["a"]), Msg.tags(["a"]))
+        self.assertIsInstance(Msg.dispatch(), Msg)
+        self.assertEqual(dict(Msg._tags_), {"tags": 0, "dispatch": 1})
+        f = Msg._dispatch_({Msg.tags: len, Msg.dispatch: len})
+        self.assertEqual(f(Msg.tags(["a"])), 1)
+
+    def test_dispatch(self) -> None:
+        U = TypeVar("U")
+
+        class Maybe(TypeEnum, Generic[U]):
+            some: Type[Tuple[U]]
+            nothing: Type[Tuple[()]]
+
+        def some(x: Maybe.some[int]) -> int:
+            return x[0]
+
+        def nothing(x: Maybe.nothing) -> int:
+            return 0
+
+        f = Maybe._dispatch_({Maybe.some[int]: some, Maybe.nothing: nothing})
+        self.assertEqual(f(Maybe.some(3)), 3)
+        self.assertEqual(f(Maybe.nothing()), 0)
+        with self.assertRaises(TypeError):
+            f((3,))
+
+        with self.assertRaisesRegex(TypeError, "Missing handlers .*: nothing"):
+            Maybe._dispatch_({Maybe.some: some})
+
+        class E(TypeEnum):
+            A: Type[Tuple[()]]
+
+        with self.assertRaises(TypeError):
+            Maybe._dispatch_({Maybe.some: some, Maybe.nothing: nothing, E.A: nothing})
+        with self.assertRaises(TypeError):
+            Maybe._dispatch_({Maybe.some: some, Maybe.some[int]: some})
+
+    def test_siblings(self) -> None:
+        class E(TypeEnum):
+            A: Type[Tuple[int]]
+            B: Type[Tuple[()]]
+
+        self.assertIs(E.A.B, E.B)
+        self.assertIs(E.B.A, E.A)
+        self.assertIs(E.A(3).B, E.B)
+        # the siblings are shared through a common base class
+        self.assertNotIn("B", vars(E.A))
+        self.assertIsInstance(E.A(3), tuple)
@@ -0,0 +1,87 @@
+import copy
+import pickle
+from typing import Any, Generic, TypeVar
+
+from type_enum import Field, TypeEnum
+
+from .common import CustomTestCase
+
+U = TypeVar("U")
+
+
+class Maybe(TypeEnum, Generic[U]):
+    some: Field[U]
+    nothing: Field[()]
+
+
+class Cached(TypeEnum, cache_hash=True):
+    A: Field[int, str]
+
+
+class Interned(TypeEnum, intern={"A"}):
+    A: Field[int]
+
+
+class Consed(TypeEnum, hash_cons=True):
+    A: Field[int, str]
+
+
+class Lazy(TypeEnum, lazy=True):
+    A: Field[int]
+    B: Field[str]
+
+
+class Outer:
+    class Inner(TypeEnum):
+        A: Field[int]
+
+
+def roundtrip(value: Any, protocol: int = pickle.HIGHEST_PROTOCOL) -> Any:
+    return pickle.loads(pickle.dumps(value, protocol=protocol))
+
+
+class PicklingTest(CustomTestCase):
+    def test_qualname(self) -> None:
+        self.assertEqual(Maybe.some.__qualname__, "Maybe.some")
+        self.assertEqual(Cached.A.__qualname__, "Cached.A")
+        self.assertEqual(Outer.Inner.A.__qualname__, "Outer.Inner.A")
+
+    def test_roundtrip(self) -> None:
+        values: list[Any] = [
+            Maybe.some(1),
+            Maybe.some[int](2),
+            Maybe.some(Maybe.some("nested")),
+            Maybe.nothing(),
+            Cached.A(1, "x"),
+            Lazy.B("b"),
+            Outer.Inner.A(3),
+        ]
+        for value in values:
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(value=value, protocol=protocol):
+                    result = roundtrip(value, protocol)
+                    self.assertEqual(result, value)
+                    self.assertIs(type(result), type(value))
+        self.assertEqual(roundtrip(values), values)
+
+    def test_by_reference(self) -> None:
+        data = pickle.dumps(Maybe.some(1))
+        self.assertIn(b"Maybe.some", data)
+        # the class is referenced, so the field names are not in the payload
+        self.assertNotIn(b"field0", data)
+        self.assertLess(len(pickle.dumps([Maybe.some(i) for i in range(100)])), 1000)
+
+    def test_construction(self) -> None:
+        self.assertIs(roundtrip(Maybe.nothing()), Maybe.nothing())
+        interned = Interned.A(1)
+        self.assertIs(roundtrip(interned), interned)
+        consed = Consed.A(1, "x")
+        self.assertIs(roundtrip(consed), consed)
+        self.assertIs(roundtrip([consed, consed])[1], consed)
+
+    def test_cached_hash(self) -> None:
+        value = Cached.A(1, "x")
+        hash(value)
+        self.assertNotIn("_hash_", roundtrip(value).__dict__)
+        self.assertNotIn("_hash_", copy.copy(value).__dict__)
+        self.assertEqual(hash(roundtrip(value)), hash(value))
@@ -0,0 +1,245 @@
+import os
+from pathlib import Path
+import tempfile
+import textwrap
+
+from mypy import api, build
+from mypy.dmypy_server import Server
+from mypy.dmypy_util import DEFAULT_STATUS_FILE
+from mypy.main import process_options
+
+from .common import CustomTestCase
+
+# the same override as in pyproject.toml, for when `type_enum` is not installed in
+# site-packages (mypy does not report errors there anyway)
+_CONFIG = """\
+[mypy]
+plugins = type_enum_plugin
+strict = True
+
+[mypy-type_enum.*]
+ignore_errors = True
+"""
+
+
+def run_mypy(sources: dict[str, str]) -> tuple[str, int]:
+    """Type-check the given modules with a cold cache and return the output."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "mypy.ini").write_text(_CONFIG)
+        for name, source in sources.items():
+            (root / f"{name}.py").write_text(textwrap.dedent(source))
+        args = ["--config-file", str(root / "mypy.ini"), "--cache-dir", "/dev/null"]
+        files = [str(root / f"{name}.py") for name in sources]
+        stdout, stderr, status = api.run([*args, *files])
+    return stdout + stderr, status
+
+
+_ENUMS = """
+from type_enum import Field, TypeEnum
+
+class E(TypeEnum):
+    A: Field[int]
+    B: Field[str]
+"""
+
+# `uses_t` depends on all variants, `uses_a` only on `E.A` and `imports` not on `E`
+_USERS = {
+    "uses_t": """
+    from enums import E
+
+    def f(x: E.T) -> int:
+        match x:
+            case E.A(n):
+                return n
+            case E.B(s):
+                return len(s)
+    """,
+    "uses_a": """
+    from enums import E
+
+    def g() -> int:
+        return E.A(1)[0]
+    """,
+    "imports": """
+    import enums
+
+    X = 1
+    """,
+}
+
+
+class Project:
+    """A temporary project that is checked incrementally with a persistent cache."""
+
+    def __init__(self, root: Path, sources: dict[str, str]) -> None:
+        self.root = root
+        (root / "mypy.ini").write_text(_CONFIG)
+        for name, source in sources.items():
+            self.write(name, source)
+        args = ["--config-file", str(root / "mypy.ini")]
+        args += ["--cache-dir", str(root / ".mypy_cache")]
+        files = [str(root / f"{name}.py") for name in sources]
+        self.sources, self.options = process_options([*args, *files])
+        self.options.incremental = True
+
+    def write(self, name: str, source: str) -> None:
+        path = self.root / f"{name}.py"
+        mtime = path.stat().st_mtime if path.exists() else 0
+        path.write_text(textwrap.dedent(source))
+        # make sure that the change is noticed even on file systems with coarse mtimes
+        os.utime(path, (mtime + 1, mtime + 1))
+
+    def check(self) -> tuple[set[str], list[str]]:
+        """Run mypy and return the rechecked modules of the project and the errors."""
+        result = build.build(self.sources, self.options)
+        ours = {source.module for source in self.sources}
+        return result.manager.rechecked_modules & ours, result.errors
+
+
+class FineGrainedProject(Project):
+    """A temporary project that is checked with the mypy daemon."""
+
+    def __init__(self, root: Path, sources: dict[str, str]) -> None:
+        super().__init__(root, sources)
+        self.options.fine_grained_incremental = True
+        self.options.local_partial_types = True
+        self.server = Server(self.options, DEFAULT_STATUS_FILE)
+
+    def check(self) -> tuple[set[str], list[str]]:
+        """Run the daemon and return the reprocessed modules of the project."""
+        manager = self.server.fine_grained_manager
+        if manager is not None:
+            manager.manager.processed_targets.clear()
+        response = self.server.check(
+            self.sources, export_types=False, is_tty=False, terminal_width=80
+        )
+        manager = self.server.fine_grained_manager
+        assert manager is not None
+        processed = {module for module, _ in manager.manager.processed_targets}
+        return processed, str(response["out"]).splitlines()[:-1]
+
+
+class PluginTest(CustomTestCase):
+    def test_forward_reference(self) -> None:
+        output, status = run_mypy(
+            {
+                "m": """
+                from type_enum import Field, TypeEnum
+
+                class A(TypeEnum):
+                    x: Field[B.T]
+                    y: Field[C]
+
+                class B(TypeEnum):
+                    z: Field[int]
+
+                class C:
+                    pass
+
+                def f(a: A.T) -> int:
+                    match a:
+                        case A.x(B.z(n)):
+                            return n
+                        case A.y(_):
+                            return 0
+                """
+            }
+        )
+        self.assertEqual(status, 0, output)
+
+    def test_bulk_constructors(self) -> None:
+        output, status = run_mypy(
+            {
+                "m": """
+                from type_enum import Field, TypeEnum
+
+                class E(TypeEnum):
+                    rgb: Field[int, int, float]
+
+                a: list[E.rgb] = E.rgb.from_rows([(1, 2, 3.0)], check=True)
+                b: list[E.rgb] = E.rgb.from_columns([1], [2], [3.0], pause_gc=True)
+                E.rgb.from_rows([(1, 2)])
+                E.rgb.from_columns([1], ["2"], [3.0])
+                """
+            }
+        )
+        self.assertEqual(status, 1)
+        self.assertIn('expected "tuple[int, int, float]"', output)
+        self.assertIn('List item 0 has incompatible type "str"; expected "int"', output)
+        self.assertIn("Found 2 errors", output)
+
+    def test_unresolvable_name(self) -> None:
+        # the semantic analyzer needs a final iteration to give up on `X`, which it
+        # never reached when the plugin kept re-adding `E.T`
+        output, status = run_mypy(
+            {
+                "m": """
+                from type_enum import Field, TypeEnum
+
+                X = Y
+                Y = X
+
+                class E(TypeEnum):
+                    a: Field[int]
+                """
+            }
+        )
+        self.assertEqual(status, 1)
+        self.assertIn('Cannot resolve name "Y"', output)
+        self.assertNotIn("INTERNAL ERROR", output)
+
+
+class IncrementalTest(CustomTestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def test_unrelated_edit(self) -> None:
+        project = Project(self.root, {"enums": _ENUMS, **_USERS})
+        project.check()
+        # shifting the TypeEnum down must not change the interface of the module
+        project.write("enums", "# a comment\n" + _ENUMS)
+        rechecked, errors = project.check()
+        self.assertEqual(rechecked, {"enums"})
+        self.assertEqual(errors, [])
+
+    def test_cached_variants(self) -> None:
+        project = Project(self.root, {"enums": _ENUMS, **_USERS})
+        project.check()
+        # `enums` is loaded from the cache now
+        project.write("uses_a", _USERS["uses_a"].replace("E.A(1)", 'E.A("1")'))
+        rechecked, errors = project.check()
+        self.assertEqual(rechecked, {"uses_a"})
+        self.assertEqual(len(errors), 1)
+        self.assertIn('Argument 1 to "A" has incompatible type "str"', errors[0])
+
+    def test_variant_edit(self) -> None:
+        project = Project(self.root, {"enums": _ENUMS, **_USERS})
+        project.check()
+        project.write("enums", _ENUMS.replace("Field[str]", "Field[bytes]"))
+        rechecked, errors = project.check()
+        # without the daemon, mypy rechecks all modules that import a changed module
+        self.assertEqual(rechecked, {"enums", *_USERS})
+        self.assertEqual(errors, [])
+
+    def test_fine_grained_variant_edit(self) -> None:
+        project = FineGrainedProject(self.root, {"enums": _ENUMS, **_USERS})
+        project.check()
+        project.write("enums", _ENUMS.replace("Field[str]", "Field[bytes]"))
+        processed, errors = project.check()
+        self.assertEqual(processed, {"enums", "uses_t"})
+        self.assertEqual(errors, [])
+        project.write("enums", _ENUMS.replace("Field[int]", "Field[str]"))
+        processed, errors = project.check()
+        self.assertEqual(processed, {"enums", "uses_t", "uses_a"})
+        self.assertTrue(any("uses_a.py" in error for error in errors), errors)
+
+    def test_fine_grained_unrelated_edit(self) -> None:
+        project = FineGrainedProject(self.root, {"enums": _ENUMS, **_USERS})
+        project.check()
+        project.write("enums", "# a comment\n" + _ENUMS)
+        processed, errors = project.check()
+        self.assertEqual(processed, {"enums"})
+        self.assertEqual(errors, [])
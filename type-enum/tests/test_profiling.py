@@ -0,0 +1,65 @@
+from typing import Tuple, Type
+
+import type_enum
+from type_enum import TypeEnum
+
+from .common import CustomTestCase
+
+
+class ProfilingTest(CustomTestCase):
+    def setUp(self) -> None:
+        type_enum.reset_profiling()
+        type_enum.enable_profiling()
+
+    def tearDown(self) -> None:
+        type_enum.disable_profiling()
+        type_enum.reset_profiling()
+
+    def test_report(self) -> None:
+        class Small(TypeEnum):
+            A: Type[Tuple[int]]
+
+        class Large(TypeEnum):
+            A: Type[Tuple[int]]
+            B: Type[Tuple[int, str]]
+            C: Type[Tuple[()]]
+            D: Type[Tuple[str]]
+
+        report = type_enum.profile_report()
+        self.assertEqual(len(report), 2)
+        profiles = {profile.name.rpartition(".")[2]: profile for profile in report}
+        self.assertEqual(set(profiles), {"Small", "Large"})
+        large = profiles["Large"]
+        self.assertTrue(large.name.startswith(__name__))
+        for phase in ("annotations", "variants", "docstrings", "union", "other"):
+            self.assertGreater(getattr(large, phase), 0, phase)
+        self.assertAlmostEqual(large.total, sum(large[1:]))
+        self.assertEqual(list(report), sorted(report, key=lambda p: -p.total))
+        self.assertEqual(len(type_enum.profile_report(limit=1)), 1)
+        self.assertIn(large.name, str(report))
+
+    def test_lazy(self) -> None:
+        class E(TypeEnum, lazy=True):
+            A: Type[Tuple[int]]
+            B: Type[Tuple[()]]
+
+        (profile,) = type_enum.profile_report()
+        self.assertEqual(profile.variants, 0)
+        self.assertEqual(profile.annotations, 0)
+        E.A.__doc__
+        (profile,) = type_enum.profile_report()
+        self.assertGreater(profile.annotations, 0)
+        self.assertGreater(profile.variants, 0)
+        self.assertGreater(profile.docstrings, 0)
+        self.assertEqual(profile.union, 0)
+        E.T
+        (profile,) = type_enum.profile_report()
+        self.assertGreater(profile.union, 0)
+
+    def test_disabled(self) -> None:
+        type_enum.disable_profiling()
+
+        class E(TypeEnum):
+            A: Type[Tuple[int]]
+
+        self.assertEqual(type_enum.profile_report(), [])
@@ -0,0 +1,125 @@
+import asyncio
+from typing import Any
+import unittest
+
+from type_enum import Field, TypeEnum
+from type_enum.routing import AsyncDispatcher
+
+
+class Job(TypeEnum):
+    fast: Field[int]
+    slow: Field[int]
+    fail: Field[()]
+
+
+class AsyncDispatcherTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.handled: list[Any] = []
+        self.release = asyncio.Event()
+        self.running = 0
+        self.max_running = 0
+
+    async def handle_fast(self, job: Any) -> None:
+        self.handled.append(job)
+
+    async def handle_slow(self, job: Any) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await self.release.wait()
+        self.running -= 1
+        self.handled.append(job)
+
+    async def handle_fail(self, job: Any) -> None:
+        raise RuntimeError("failed")
+
+    def handlers(self) -> dict[Any, Any]:
+        return {
+            Job.fast: self.handle_fast,
+            Job.slow: self.handle_slow,
+            Job.fail: self.handle_fail,
+        }
+
+    async def test_missing_handler(self) -> None:
+        with self.assertRaisesRegex(TypeError, "slow, fail"):
+            AsyncDispatcher(Job, {Job.fast: self.handle_fast})
+
+        class Other(TypeEnum):
+            fast: Field[int]
+
+        with self.assertRaises(TypeError):
+            AsyncDispatcher(Job, {**self.handlers(), Other.fast: self.handle_fast})
+        with self.assertRaises(TypeError):
+            AsyncDispatcher(Job, self.handlers(), concurrency={Other.fast: 2})
+        with self.assertRaises(ValueError):
+            AsyncDispatcher(Job, self.handlers(), concurrency={Job.slow: 0})
+
+    async def test_routing(self) -> None:
+        self.release.set()
+        jobs = [Job.fast(1), Job.slow(2), Job.fast(3), Job.slow(4)]
+        async with AsyncDispatcher(Job, self.handlers()) as dispatcher:
+            for job in jobs:
+                await dispatcher.put(job)
+            with self.assertRaises(TypeError):
+                await dispatcher.put((1,))
+        self.assertCountEqual(self.handled, jobs)
+        with self.assertRaises(RuntimeError):
+            await dispatcher.put(Job.fast(5))
+
+    async def test_concurrency(self) -> None:
+        dispatcher = AsyncDispatcher(Job, self.handlers(), concurrency={Job.slow: 3})
+        for i in range(5):
+            await dispatcher.put(Job.slow(i))
+        await dispatcher.put(Job.fast(0))
+        await asyncio.sleep(0.01)
+        # the fast job does not wait behind the slow ones
+        self.assertEqual(self.handled, [Job.fast(0)])
+        self.assertEqual(self.running, 3)
+        self.assertEqual(dispatcher.pending(Job.slow), 2)
+        self.release.set()
+        await dispatcher.aclose()
+        self.assertEqual(len(self.handled), 6)
+        self.assertEqual(self.max_running, 3)
+
+    async def test_queue_size(self) -> None:
+        dispatcher = AsyncDispatcher(Job, self.handlers(), queue_size={Job.slow: 2})
+        dispatcher.put_nowait(Job.slow(0))
+        await asyncio.sleep(0)  # the worker takes the first job
+        dispatcher.put_nowait(Job.slow(1))
+        dispatcher.put_nowait(Job.slow(2))
+        with self.assertRaises(asyncio.QueueFull):
+            dispatcher.put_nowait(Job.slow(3))
+        put = asyncio.create_task(dispatcher.put(Job.slow(3)))
+        await asyncio.sleep(0.01)
+        self.assertFalse(put.done())
+        self.release.set()
+        await put
+        await dispatcher.aclose()
+        self.assertEqual(len(self.handled), 4)
+
+    async def test_errors(self) -> None:
+        errors: list[tuple[Any, Exception]] = []
+        async with AsyncDispatcher(
+            Job, self.handlers(), on_error=lambda job, e: errors.append((job, e))
+        ) as dispatcher:
+            await dispatcher.put(Job.fail())
+            await dispatcher.put(Job.fail())
+            await dispatcher.put(Job.fast(1))
+        self.assertEqual([job for job, _ in errors], [Job.fail(), Job.fail()])
+        self.assertIsInstance(errors[0][1], RuntimeError)
+        self.assertEqual(self.handled, [Job.fast(1)])
+
+    async def test_failing_error_callback(self) -> None:
+        def on_error(job: Any, e: Exception) -> None:
+            raise ValueError("callback failed")
+
+        reported: list[dict[str, Any]] = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: reported.append(context))
+        async with AsyncDispatcher(
+            Job, self.handlers(), on_error=on_error
+        ) as dispatcher:
+            await dispatcher.put(Job.fail())
+            await dispatcher.put(Job.fail())
+        # the worker went on after the callback failed, so leaving did not hang
+        self.assertEqual(len(reported), 2)
+        self.assertIsInstance(reported[0]["exception"], ValueError)
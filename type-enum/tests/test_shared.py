@@ -0,0 +1,106 @@
+import multiprocessing
+import pickle
+from typing import Any
+import unittest
+
+from type_enum import Field, TypeEnum
+
+from .common import CustomTestCase
+
+try:
+    import numpy as np
+
+    from type_enum import shared
+    from type_enum.array import TypeEnumArray
+    from type_enum.shared import SharedBatch, parallel_map
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+class Shape(TypeEnum):
+    circle: Field[float]
+    rect: Field[float, float]
+    empty: Field[()]
+    label: Field[str, int]
+
+
+SHAPES: list[Any] = [
+    Shape.circle(1.0),
+    Shape.rect(2.0, 3.0),
+    Shape.empty(),
+    Shape.label("a", 1),
+    Shape.circle(2.0),
+] * 20
+
+
+def area(shape: Any) -> float:
+    match shape:
+        case Shape.circle(r):
+            return 3.0 * r * r
+        case Shape.rect(w, h):
+            return w * h
+    return 0.0
+
+
+def total_area(batch: "SharedBatch") -> float:
+    with batch.attach() as array:
+        return sum(map(area, array))
+
+
+@unittest.skipIf(np is None, "requires numpy")
+class SharedBatchTest(CustomTestCase):
+    def test_attach(self) -> None:
+        with SharedBatch(Shape, SHAPES) as batch:
+            self.assertEqual(len(batch), 100)
+            copy = pickle.loads(pickle.dumps(batch))
+            self.assertEqual(copy.name, batch.name)
+            with copy.attach() as array:
+                self.assertEqual(list(array), SHAPES)
+                # the numeric columns are views of the block
+                self.assertFalse(array.tags.flags.owndata)
+                (radii,) = array.select(Shape.circle)
+                self.assertFalse(radii.flags.writeable)
+                self.assertEqual(radii.tolist(), [1.0, 2.0] * 20)
+                del radii
+            copy.close()
+
+    def test_from_array(self) -> None:
+        array = TypeEnumArray(Shape, SHAPES)[10:20]
+        with SharedBatch(Shape, array) as batch, batch.attach() as shared:
+            self.assertEqual(list(shared), SHAPES[10:20])
+        with self.assertRaises(TypeError):
+            SharedBatch(TypeEnum, array)
+
+    def test_empty(self) -> None:
+        with SharedBatch(Shape, []) as batch, batch.attach() as array:
+            self.assertEqual(list(array), [])
+        # values that a native column would change are rejected
+        with self.assertRaises(TypeError):
+            SharedBatch(Shape, [Shape.rect(1, 2.0)])
+
+    def test_other_process(self) -> None:
+        with SharedBatch(Shape, SHAPES) as batch, multiprocessing.Pool(1) as pool:
+            self.assertEqual(pool.apply(total_area, (batch,)), sum(map(area, SHAPES)))
+
+    def test_object_columns_are_reused(self) -> None:
+        with SharedBatch(Shape, SHAPES) as batch:
+            expected = [area(shape) for shape in SHAPES[:5]]
+            self.assertEqual(shared._map_chunk(batch, area, 0, 5), expected)
+            name, objects = shared._objects
+            self.assertEqual(name, batch.name)
+            (labels,) = objects.values()
+            self.assertEqual(shared._map_chunk(batch, area, 0, 5), expected)
+            self.assertIs(next(iter(shared._objects[1].values())), labels)
+
+    def test_parallel_map(self) -> None:
+        expected = [area(shape) for shape in SHAPES]
+        self.assertEqual(parallel_map(area, SHAPES, enum=Shape, processes=2), expected)
+        with multiprocessing.Pool(2) as pool:
+            array = TypeEnumArray(Shape, SHAPES)
+            self.assertEqual(
+                parallel_map(area, array, pool=pool, chunksize=7), expected
+            )
+            self.assertEqual(parallel_map(area, array[:3], pool=pool), expected[:3])
+        self.assertEqual(parallel_map(area, [], enum=Shape), [])
+        with self.assertRaises(TypeError):
+            parallel_map(area, SHAPES)
@@ -0,0 +1,145 @@
+import asyncio
+from typing import Any
+import unittest
+
+from type_enum import Field, TypeEnum
+from type_enum.stream import MessageReader, MessageWriter
+
+
+class Msg(TypeEnum):
+    ping: Field[int]
+    text: Field[str, bytes]
+    stop: Field[()]
+
+
+MESSAGES: list[Any] = [
+    Msg.ping(1),
+    Msg.text("héllo", b"\x00\x01"),
+    Msg.stop(),
+    Msg.ping(-(2**40)),
+] * 250
+
+
+def feed(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class StreamTest(unittest.IsolatedAsyncioTestCase):
+    async def echo(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        messages = MessageWriter(writer, Msg)
+        async for message in MessageReader(reader, Msg):
+            await messages.send(message)
+        messages.close()
+        await messages.wait_closed()
+
+    async def connect(
+        self,
+    ) -> tuple[MessageReader, MessageWriter, asyncio.StreamWriter]:
+        server = await asyncio.start_server(self.echo, "127.0.0.1", 0)
+        self.addAsyncCleanup(server.wait_closed)
+        self.addCleanup(server.close)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        return MessageReader(reader, Msg), MessageWriter(writer, Msg), writer
+
+    async def test_echo(self) -> None:
+        reader, writer, stream = await self.connect()
+        writes = 0
+        write = stream.write
+
+        def counted_write(data: Any) -> None:
+            nonlocal writes
+            writes += 1
+            write(data)
+
+        stream.write = counted_write  # type: ignore[method-assign]
+        for message in MESSAGES:
+            writer.write(message)
+        await writer.drain()
+        self.assertEqual(writes, 1)
+        received = [await reader.read() for _ in MESSAGES]
+        self.assertEqual(received, MESSAGES)
+
+        writer.write_many(MESSAGES)
+        writer.write_eof()
+        self.assertEqual([message async for message in reader], MESSAGES)
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_send(self) -> None:
+        reader, writer, _ = await self.connect()
+        for message in MESSAGES[:4]:
+            await writer.send(message)
+            self.assertEqual(await reader.read(), message)
+        writer.write_eof()
+        self.assertIsNone(await reader.read())
+        writer.close()
+
+    async def test_backpressure(self) -> None:
+        release = asyncio.Event()
+        received: list[Any] = []
+
+        async def slow(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            await release.wait()
+            received.extend([message async for message in MessageReader(reader, Msg)])
+            writer.close()
+
+        server = await asyncio.start_server(slow, "127.0.0.1", 0)
+        self.addAsyncCleanup(server.wait_closed)
+        self.addCleanup(server.close)
+        port = server.sockets[0].getsockname()[1]
+        _, stream = await asyncio.open_connection("127.0.0.1", port)
+        writer = MessageWriter(stream, Msg)
+        big = Msg.text("x" * 2**16, b"")
+        sent = 0
+
+        async def send_all() -> None:
+            nonlocal sent
+            while sent < 4096:
+                await writer.send(big)
+                sent += 1
+
+        # the receiver does not read, so the sender has to wait
+        with self.assertRaises(TimeoutError):
+            await asyncio.wait_for(
+                asyncio.shield(task := asyncio.create_task(send_all())), 0.5
+            )
+        self.assertLess(sent, 4096)
+        release.set()
+        await task
+        writer.close()
+        await writer.wait_closed()
+        while len(received) < sent:
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(received), sent)
+
+    async def test_invalid_value(self) -> None:
+        reader, writer, _ = await self.connect()
+        writer.write(Msg.ping(1))
+        with self.assertRaises(TypeError):
+            writer.write_many([Msg.ping(2), "not a message"])
+        writer.write_eof()
+        self.assertEqual([message async for message in reader], [Msg.ping(1)])
+        writer.close()
+
+    async def test_truncated(self) -> None:
+        data = b"\x09\x00\x00\x00\x00" + (1).to_bytes(8, "little")
+        reader = MessageReader(feed(data), Msg)
+        self.assertEqual(await reader.read(), Msg.ping(1))
+        reader = MessageReader(feed(data[:-1]), Msg)
+        with self.assertRaises(asyncio.IncompleteReadError):
+            await reader.read()
+
+    async def test_invalid_message(self) -> None:
+        with self.assertRaises(ValueError):
+            await MessageReader(feed(b"\xff\xff\xff\x7f"), Msg).read()
+        # a length that does not match the value
+        with self.assertRaises(ValueError):
+            await MessageReader(feed(b"\x02\x00\x00\x00\x02\x00"), Msg).read()
@@ -1 +1,5 @@
 from ._core import *
+from ._counting import *
+from ._hashcons import *
+from ._interning import *
+from ._profiling import *
@@ -1,10 +1,18 @@
 import functools
-from operator import or_
-from types import new_class
+import gc
+from itertools import repeat, starmap
+import operator
+import threading
+from time import perf_counter
+from types import MappingProxyType, new_class, resolve_bases
+import typing
 from typing import (
     Any,
+    Callable,
     Generic,
+    Iterable,
     Iterator,
+    Mapping,
     NamedTuple,
     TypeAlias,
     TypeVar,
@@ -16,85 +24,145 @@ from typing import (
     get_type_hints,
 )
 
-from ._utils import is_dunder, type_to_str
+from . import _counting, _hashcons, _interning, _profiling
+from ._utils import field_types, is_dunder, plain_new, runtime_types, type_to_str
 
 __all__ = ["Field", "TypeEnum"]
 
 
+_R = TypeVar("_R")
+
+
 class Entry(NamedTuple):
     typ: type
     typevars: tuple[type, ...]
+    types: tuple[Any, ...]
+
+
+def _profile_definition(new: Callable[..., Any]) -> Callable[..., Any]:
+    """Record the time spent in `TypeEnumMeta.__new__` outside the profiled phases."""
+
+    @functools.wraps(new)
+    def wrapper(
+        cls: type, name: str, bases: tuple[type, ...], ns: dict[str, Any], **kwds: Any
+    ) -> Any:
+        if not _profiling.enabled:
+            return new(cls, name, bases, ns, **kwds)
+        profile_name = _profile_name(ns["__module__"], ns.get("__qualname__", name))
+        recorded = _profiling.total(profile_name)
+        start = perf_counter()
+        try:
+            return new(cls, name, bases, ns, **kwds)
+        finally:
+            elapsed = perf_counter() - start
+            in_phases = _profiling.total(profile_name) - recorded
+            _profiling.record(profile_name, "other", elapsed - in_phases)
+
+    return wrapper
 
 
 class TypeEnumMeta(type):
     """Metaclass for TypeEnum."""
 
-    def __new__(cls, name: str, bases: tuple[type, ...], ns: dict[str, Any]):
+    @_profile_definition
+    def __new__(
+        cls,
+        name: str,
+        bases: tuple[type, ...],
+        ns: dict[str, Any],
+        *,
+        lazy: bool = False,
+        cache_hash: bool = False,
+        intern: Any = (),
+        hash_cons: bool = False,
+    ):
         for base in bases:
             if base is not TypeEnum and base is not Generic:
                 raise TypeError(
                     "TypeEnum classes cannot be subclassed further "
                     "and may only have Generic as an additional base class"
                 )
-        member_map: dict[str, Entry] = {}
-        cls.__annotations__ = ns.get("__annotations__", {})
-        typ_anns = get_type_hints(cls, localns=ns)
-        for attr_name in typ_anns:
-            if is_dunder(attr_name):
-                continue
-            if attr_name == "T":
-                continue
-            # types = ns[attr_name]
-            wrapped_types = typ_anns[attr_name]
-            if get_origin(wrapped_types) is not type:
+        annotations = ns.get("__annotations__", {})
+        field_names = [
+            attr_name
+            for attr_name in annotations
+            if not is_dunder(attr_name) and attr_name != "T"
+        ]
+        # All variants inherit from this class, which makes the variants accessible
+        # from each other (as in `E.A.B`) without having to add every variant to every
+        # other variant.
+        variant_base = _create_variant_base(
+            name, ns["__module__"], ns.get("__qualname__")
+        )
+        profile_name = _profile_name(ns["__module__"], ns.get("__qualname__", name))
+        intern_sizes = _interning.parse_sizes(intern, field_names)
+        hash_cons_table = None
+        if hash_cons:
+            if cache_hash or intern_sizes:
                 raise TypeError(
-                    f"Expected type annotation for '{attr_name}' to be a Type[Tuple[...]], "
-                    f"but found '{wrapped_types}'"
+                    "Hash-consed TypeEnums cannot cache hashes or intern variants"
                 )
-            inner = get_args(wrapped_types)[0]
-            if get_origin(inner) is not tuple:
-                raise TypeError(
-                    f"Expected type annotation for '{attr_name}' to be a Type[Tuple[...]], "
-                    f"but found '{wrapped_types}'"
+            hash_cons_table = _hashcons.HashConsTable()
+        if lazy:
+            _check_namespace(ns, annotations)
+            if not field_names:
+                raise TypeError(f"Empty TypeEnum.")
+            # the annotations are only resolved once the first variant is needed
+            lazy_state = _LazyState(dict(ns), field_names, cache_hash, intern_sizes)
+            for attr_name in field_names:
+                ns[attr_name] = _LazyClassAttribute(
+                    attr_name, functools.partial(_materialize_variant, attr_name)
                 )
-            types = get_args(inner)
-            if len(types) == 1 and types[0] == ():
-                types = ()
-            # subtype = _create_tuple_class(name, attr_name, types)
-            typevars: tuple[type, ...] = tuple(
-                typ for typ in types if isinstance(typ, TypeVar)
-            )
-            subtype = _create_subclass(
-                name, attr_name, types, typevars, ns["__module__"]
-            )
-
-            ns[attr_name] = subtype
-            member_map[attr_name] = Entry(subtype, typevars)
-
-        for attr_name in ns:
-            if not is_dunder(attr_name) and attr_name not in typ_anns:
-                raise TypeError(
-                    f"A TypeEnum may only contain fields: `{attr_name}` is not a field."
+            ns["_member_map"] = _LazyClassAttribute("_member_map", _lazy_member_map)
+            ns["_variants"] = set()
+            ns["_lazy_state"] = lazy_state
+            ns["T"] = _LazyClassAttribute("T", _lazy_union)
+        else:
+            member_map: dict[str, Entry] = {}
+            typ_anns = _timed(profile_name, "annotations", _resolve_annotations, ns)
+            for tag, attr_name in enumerate(field_names):
+                types, typevars = _parse_field(attr_name, typ_anns[attr_name])
+                subtype = _timed(
+                    profile_name,
+                    "variants",
+                    _create_subclass,
+                    name,
+                    ns.get("__qualname__", name),
+                    attr_name,
+                    types,
+                    typevars,
+                    ns["__module__"],
+                    tag,
+                    variant_base,
+                    cache_hash,
                 )
+                if types and attr_name in intern_sizes:
+                    _interning.intern_variant(subtype, intern_sizes[attr_name])
+                if types and hash_cons_table is not None:
+                    _hashcons.hash_cons_variant(subtype, hash_cons_table)
+                subtype.__doc__ = _timed(
+                    profile_name,
+                    "docstrings",
+                    _variant_docstring,
+                    name,
+                    attr_name,
+                    types,
+                )
+                ns[attr_name] = subtype
+                setattr(variant_base, attr_name, subtype)
+                member_map[attr_name] = Entry(subtype, typevars, types)
 
-        if not member_map and name != "TypeEnum":
-            raise TypeError(f"Empty TypeEnum.")
-
-        for subtype, _ in member_map.values():
-            for subname_, (subtype_, _) in member_map.items():
-                setattr(subtype, subname_, subtype_)
-        ns["_member_map"] = member_map
+            _check_namespace(ns, typ_anns)
+            if not member_map and name != "TypeEnum":
+                raise TypeError(f"Empty TypeEnum.")
 
-        def _init(self, *args: Any, **kwargs: Any) -> None:
-            raise TypeError("TypeEnum cannot be instantiated")
+            ns["_member_map"] = member_map
+            ns["_variants"] = frozenset(typ for typ, *_ in member_map.values())
+            if name != "TypeEnum":
+                ns["T"] = _timed(profile_name, "union", _make_union, member_map)
 
-        ns["__init__"] = _init
-        if name != "TypeEnum":
-            subtypes = [
-                (typ.__class_getitem__(typevars) if typevars else typ)
-                for typ, typevars in member_map.values()
-            ]
-            ns["T"] = functools.reduce(or_, subtypes[1:], Union[subtypes[0]])
+        ns["_hash_cons"] = hash_cons_table
+        _finish_namespace(ns, field_names, variant_base)
         try:
             exc = None
             enum_class = super().__new__(cls, name, bases, ns)
@@ -104,27 +172,482 @@ class TypeEnumMeta(type):
             exc = e.__cause__ or e
         if exc is not None:
             raise exc
+        if lazy:
+            for attr_name in field_names:
+                setattr(variant_base, attr_name, _LazySibling(enum_class, attr_name))
         return enum_class
 
     def __subclasscheck__(cls, subclass: type) -> bool:
-        return any(subclass == typ for typ, _ in cls._member_map.values())
+        return subclass in cls._variants
 
     def __instancecheck__(cls, instance: object) -> bool:
-        return any(isinstance(instance, typ) for typ, _ in cls._member_map.values())
+        # This is on the hot path of `isinstance(x, E)`, so we avoid looping over the
+        # variants; the MRO fallback only matters for subclasses of variants.
+        variants = cls._variants
+        typ = type(instance)
+        return typ in variants or not variants.isdisjoint(typ.__mro__)
 
     def __iter__(cls) -> Iterator[type]:
-        return (typ for typ, _ in cls._member_map.values())
+        return (entry.typ for entry in cls._member_map.values())
+
+    @property
+    def _tags_(cls) -> Mapping[str, int]:
+        """Mapping from variant names to their integer tags.
+
+        Tags are assigned in declaration order, starting at 0, and are also available
+        as `_tag_` on each variant class.
+        """
+        return cls._tags
+
+    def _dispatch_(
+        cls, handlers: Mapping[Any, Callable[[Any], Any]]
+    ) -> Callable[[Any], Any]:
+        """Compile a mapping from variants to handlers into a dispatch function.
+
+        Every variant must have exactly one handler. The returned function calls the
+        handler for the variant of its argument with the argument itself, and raises
+        `TypeError` for values that are not variants of this TypeEnum.
+        """
+        # Looking up the handler by the exact type of the value is as fast as indexing
+        # with `value._tag_`, but also rejects values from other TypeEnums.
+        by_type = _by_variant(cls, handlers, "handler", complete=True)
+        name = cls.__name__
+
+        def dispatcher(value: Any) -> Any:
+            try:
+                handler = by_type[type(value)]
+            except KeyError:
+                raise TypeError(f"{value!r} is not a variant of {name}") from None
+            return handler(value)
+
+        _counting.register_dispatcher(cls, dispatcher, by_type)
+        return dispatcher
+
+
+def _by_variant(
+    enum: TypeEnumMeta, mapping: Mapping[Any, _R], what: str, *, complete: bool = False
+) -> dict[type, _R]:
+    """Key `mapping` by variant classes, accepting aliases like `Maybe.some[int]`.
+
+    Raises `TypeError` for keys that are not variants of `enum`, for two keys of the
+    same variant and, with `complete=True`, for variants without a key.
+    """
+    result: dict[type, _R] = {}
+    for key, item in mapping.items():
+        variant = get_origin(key) or key
+        if variant not in enum._variants:
+            raise TypeError(f"{key!r} is not a variant of {enum.__name__}")
+        if variant in result:
+            raise TypeError(f"Duplicate {what} for {key!r}")
+        result[variant] = item
+    if complete:
+        missing = [variant.__name__ for variant in enum if variant not in result]
+        if missing:
+            raise TypeError(
+                f"Missing {what}s for variants of {enum.__name__}: {', '.join(missing)}"
+            )
+    return result
+
+
+def _profile_name(module: str, qualname: str) -> str:
+    return f"{module}.{qualname}"
+
+
+def _timed(profile_name: str, phase: str, func: Callable[..., _R], *args: Any) -> _R:
+    if _profiling.enabled:
+        return _profiling.timed(profile_name, phase, func, *args)
+    return func(*args)
+
+
+def _resolve_annotations(ns: dict[str, Any]) -> dict[str, Any]:
+    # A throwaway class holds the annotations, as lazy TypeEnums resolve them in
+    # whatever thread first uses them. Its module is this one, as it was when the
+    # annotations were set on `TypeEnumMeta` itself.
+    holder = type(
+        "_Annotations",
+        (),
+        {"__annotations__": ns.get("__annotations__", {}), "__module__": __name__},
+    )
+    return get_type_hints(holder, localns=ns)
+
+
+def _check_namespace(ns: dict[str, Any], annotations: dict[str, Any]) -> None:
+    for attr_name in ns:
+        if not is_dunder(attr_name) and attr_name not in annotations:
+            raise TypeError(
+                f"A TypeEnum may only contain fields: `{attr_name}` is not a field."
+            )
+
+
+def _finish_namespace(
+    ns: dict[str, Any], field_names: list[str], variant_base: type
+) -> None:
+    ns["_variant_base"] = variant_base
+    ns["_tags"] = MappingProxyType({n: tag for tag, n in enumerate(field_names)})
+
+    def _init(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("TypeEnum cannot be instantiated")
+
+    ns["__init__"] = _init
+
+
+def _parse_field(
+    attr_name: str, wrapped_types: Any
+) -> tuple[tuple[type, ...], tuple[type, ...]]:
+    """Extract the field types and the type variables from a `Type[Tuple[...]]`."""
+    if get_origin(wrapped_types) is not type:
+        raise TypeError(
+            f"Expected type annotation for '{attr_name}' to be a Type[Tuple[...]], "
+            f"but found '{wrapped_types}'"
+        )
+    inner = get_args(wrapped_types)[0]
+    if get_origin(inner) is not tuple:
+        raise TypeError(
+            f"Expected type annotation for '{attr_name}' to be a Type[Tuple[...]], "
+            f"but found '{wrapped_types}'"
+        )
+    types = get_args(inner)
+    if len(types) == 1 and types[0] == ():
+        types = ()
+    typevars: tuple[type, ...] = tuple(typ for typ in types if isinstance(typ, TypeVar))
+    return types, typevars
+
+
+def _make_union(member_map: dict[str, Entry]) -> Any:
+    subtypes = tuple(
+        (typ.__class_getitem__(typevars) if typevars else typ)
+        for typ, typevars, _ in member_map.values()
+    )
+    # Unlike folding with `|`, this deduplicates the members only once.
+    return Union[subtypes]
+
+
+class _LazyClassAttribute:
+    """Class attribute that is computed on first access and then cached on the class."""
+
+    __slots__ = ("name", "compute")
+
+    def __init__(self, name: str, compute: Callable[[type], Any]) -> None:
+        self.name = name
+        self.compute = compute
+
+    def __get__(self, instance: object, owner: type) -> Any:
+        value = self.compute(owner)
+        setattr(owner, self.name, value)
+        return value
+
+
+class _LazyState:
+    """Bookkeeping for a TypeEnum that was created with `lazy=True`."""
+
+    __slots__ = (
+        "ns",
+        "field_names",
+        "cache_hash",
+        "intern_sizes",
+        "hints",
+        "member_map",
+    )
+
+    def __init__(
+        self,
+        ns: dict[str, Any],
+        field_names: list[str],
+        cache_hash: bool,
+        intern_sizes: dict[str, int],
+    ) -> None:
+        self.ns = ns
+        self.field_names = field_names
+        self.cache_hash = cache_hash
+        self.intern_sizes = intern_sizes
+        self.hints: dict[str, Any] | None = None
+        self.member_map: dict[str, Entry] = {}
+
+
+# Guards the materialization of variants, so that every variant class is created
+# exactly once even if it is first accessed from several threads.
+_lazy_lock = threading.RLock()
+
+
+def _materialize_variant(attr_name: str, enum: TypeEnumMeta) -> type:
+    with _lazy_lock:
+        state: _LazyState = enum._lazy_state
+        if attr_name in state.member_map:
+            # another thread was faster
+            return state.member_map[attr_name].typ
+        profile_name = _profile_name(enum.__module__, enum.__qualname__)
+        if state.hints is None:
+            state.hints = _timed(
+                profile_name, "annotations", _resolve_annotations, state.ns
+            )
+        types, typevars = _parse_field(attr_name, state.hints[attr_name])
+        name = enum.__name__
+        subtype = _timed(
+            profile_name,
+            "variants",
+            _create_subclass,
+            name,
+            enum.__qualname__,
+            attr_name,
+            types,
+            typevars,
+            enum.__module__,
+            enum._tags[attr_name],
+            enum._variant_base,
+            state.cache_hash,
+        )
+        if types and attr_name in state.intern_sizes:
+            _interning.intern_variant(subtype, state.intern_sizes[attr_name])
+        if types and enum._hash_cons is not None:
+            _hashcons.hash_cons_variant(subtype, enum._hash_cons)
+        subtype.__doc__ = _LazyClassAttribute(
+            "__doc__",
+            lambda _: _timed(
+                profile_name, "docstrings", _variant_docstring, name, attr_name, types
+            ),
+        )
+        setattr(enum._variant_base, attr_name, subtype)
+        state.member_map[attr_name] = Entry(subtype, typevars, types)
+        enum._variants.add(subtype)
+        _counting.variant_created(enum, subtype)
+        return subtype
+
+
+class _LazySibling:
+    """Placeholder for a variant of a lazy TypeEnum on the base class of the variants.
+
+    The placeholder is replaced by the variant class once the variant is created.
+    """
+
+    __slots__ = ("enum", "name")
+
+    def __init__(self, enum: TypeEnumMeta, name: str) -> None:
+        self.enum = enum
+        self.name = name
+
+    def __get__(self, instance: object, owner: type) -> type:
+        return getattr(self.enum, self.name)
+
+
+def _lazy_union(enum: TypeEnumMeta) -> Any:
+    member_map = enum._member_map
+    profile_name = _profile_name(enum.__module__, enum.__qualname__)
+    return _timed(profile_name, "union", _make_union, member_map)
+
+
+def _lazy_member_map(enum: TypeEnumMeta) -> dict[str, Entry]:
+    state: _LazyState = enum._lazy_state
+    for attr_name in state.field_names:
+        getattr(enum, attr_name)
+    return {attr_name: state.member_map[attr_name] for attr_name in state.field_names}
+
+
+def _variant_docstring(basename: str, typename: str, types: tuple[type, ...]) -> str:
+    return (
+        f"{basename}.{typename}(" + ", ".join(type_to_str(typ) for typ in types) + ")"
+    )
+
+
+def _create_variant_base(basename: str, module: str, qualname: str | None) -> type:
+    return type(
+        "_Variants",
+        (tuple,),
+        {
+            "__slots__": (),
+            "__module__": module,
+            "__qualname__": f"{qualname or basename}._Variants",
+            "__eq__": _variant_eq,
+            "__ne__": _variant_ne,
+            "__hash__": _variant_hash,
+            "__reduce__": _variant_reduce,
+            "from_rows": classmethod(_variant_from_rows),
+            "from_columns": classmethod(_variant_from_columns),
+        },
+    )
+
+
+_tuple_eq = tuple.__eq__
+_tuple_hash = tuple.__hash__
+
+
+def _variant_eq(self: tuple, other: object) -> Any:
+    """Variants are only equal to values of the same variant with equal fields."""
+    if type(other) is type(self):
+        return _tuple_eq(self, other)
+    if isinstance(other, tuple):
+        # returning `NotImplemented` would let `tuple.__eq__` compare the fields
+        return False
+    return NotImplemented
+
+
+def _variant_ne(self: tuple, other: object) -> Any:
+    result = _variant_eq(self, other)
+    return result if result is NotImplemented else not result
+
+
+def _variant_hash(self: tuple) -> int:
+    # mixing in the hash of the class keeps `E.A(3)` and `E.B(3)` apart
+    return _tuple_hash(self) ^ hash(type(self))
+
+
+def _variant_reduce(self: tuple) -> tuple[type, tuple[Any, ...]]:
+    """Pickle variants as a call of the variant class, which pickle finds by name.
+
+    Unpickling calls the variant like user code does, so it returns the singletons of
+    nullary variants and the canonical values of interned and hash-consed variants.
+    """
+    return type(self), tuple(self)
+
+
+def _variant_from_rows(
+    cls: Any,
+    rows: Iterable[Iterable[Any]],
+    *,
+    check: bool = False,
+    pause_gc: bool = False,
+) -> list[Any]:
+    """Create a value of this variant from the fields in each row.
+
+    The same as `[cls(*row) for row in rows]`, but unless `__new__` was replaced (e.g.
+    by interning), the values are created without calling it. With `check=True`, the
+    fields are first checked against the annotations of the variant, column by column.
+    With `pause_gc=True`, the garbage collector of the whole process is disabled until
+    the values are created.
+    """
+    if pause_gc:
+        return _without_gc(_from_rows, cls, rows, check)
+    return _from_rows(cls, rows, check)
+
+
+def _from_rows(cls: Any, rows: Iterable[Iterable[Any]], check: bool) -> list[Any]:
+    size = len(cls._fields)
+    if check:
+        rows = list(map(tuple, rows))
+        _check_arity(cls, rows, size)
+        _check_columns(cls, list(zip(*rows)) if rows else [[]] * size)
+    new = plain_new(cls)
+    if new is None or cls.__new__ is not new:
+        return list(starmap(cls, rows))
+    values = list(map(tuple.__new__, repeat(cls), rows))
+    if not check:
+        _check_arity(cls, values, size)
+    return values
+
+
+def _variant_from_columns(
+    cls: Any, *columns: Iterable[Any], check: bool = False, pause_gc: bool = False
+) -> list[Any]:
+    """Create values of this variant from one iterable per field.
+
+    The same as `[cls(*fields) for fields in zip(*columns, strict=True)]`, but unless
+    `__new__` was replaced (e.g. by interning), the values are created without calling
+    it. With `check=True`, each column is first checked against the annotation of its
+    field. `pause_gc` is the same as for `from_rows`.
+    """
+    if pause_gc:
+        return _without_gc(_from_columns, cls, columns, check)
+    return _from_columns(cls, columns, check)
+
+
+def _from_columns(
+    cls: Any, columns: tuple[Iterable[Any], ...], check: bool
+) -> list[Any]:
+    if len(columns) != len(cls._fields):
+        raise TypeError(
+            f"{cls.__qualname__} has {len(cls._fields)} fields, got {len(columns)} columns"
+        )
+    if check:
+        columns = tuple(list(column) for column in columns)
+        _check_columns(cls, columns)
+    rows = zip(*columns, strict=True)
+    new = plain_new(cls)
+    if new is None or cls.__new__ is not new:
+        return list(starmap(cls, rows))
+    return list(map(tuple.__new__, repeat(cls), rows))
+
+
+# the number of calls of `_without_gc` that are running, and whether the collector was
+# enabled before the first of them
+_gc_pauses = 0
+_gc_was_enabled = False
+_gc_lock = threading.Lock()
+
+
+def _without_gc(func: Callable[..., _R], *args: Any) -> _R:
+    """Call `func` with the garbage collector paused.
+
+    Creating many values triggers many collections, which visit the values created so
+    far but cannot find any garbage among them. Concurrent calls share the pause, which
+    ends with the last of them.
+    """
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if not _gc_pauses:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        return func(*args)
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if not _gc_pauses and _gc_was_enabled:
+                gc.enable()
+
+
+def _check_arity(cls: Any, rows: list[Any], size: int) -> None:
+    # one pass in C over all rows, and another one only if a row is wrong
+    if rows and set(map(len, rows)) != {size}:
+        index, row = next((i, row) for i, row in enumerate(rows) if len(row) != size)
+        raise TypeError(
+            f"{cls.__qualname__} takes {size} fields, got {len(row)} in row {index}"
+        )
+
+
+def _check_columns(cls: Any, columns: Iterable[Any]) -> None:
+    """Check that the values in each column have the type of its field."""
+    for i, (tp, column) in enumerate(zip(field_types(cls), columns)):
+        allowed = runtime_types(tp)
+        if allowed is None:
+            continue
+        # the distinct types of a column are few, so checking them is cheap
+        if all(issubclass(t, allowed) for t in set(map(type, column))):
+            continue
+        index, value = next(
+            (index, value)
+            for index, value in enumerate(column)
+            if not isinstance(value, allowed)
+        )
+        raise TypeError(
+            f"field {i} of {cls.__qualname__}: expected {type_to_str(tp)}, "
+            f"got {value!r} in row {index}"
+        )
+
+
+def _cached_variant_hash(self: Any) -> int:
+    try:
+        return self._hash_
+    except AttributeError:
+        result = self._hash_ = _tuple_hash(self) ^ hash(type(self))
+        return result
 
 
 def _create_subclass(
     basename: str,
+    qualname: str,
     typename: str,
     types: tuple[type, ...],
     typevars: tuple[type, ...],
     module: str,
+    tag: int,
+    base: type,
+    cache_hash: bool = False,
 ) -> type:
     def body(namespace: dict[str, Any]) -> None:
         namespace["__module__"] = module
+        # lets pickle find the variant as an attribute of the TypeEnum
+        namespace["__qualname__"] = f"{qualname}.{typename}"
+        namespace["_tag_"] = tag
         namespace["__annotations__"] = {f"field{i}": typ for i, typ in enumerate(types)}
         num_values = len(types)
         repr_fmt = "(" + ", ".join("%r" for _ in range(num_values)) + ")"
@@ -139,12 +662,199 @@ def _create_subclass(
     if typevars:
         baseclasses += (Generic[*typevars],)
     subtype = new_class(typename, baseclasses, exec_body=body)
-    subtype.__doc__ = (
-        f"{basename}.{typename}(" + ", ".join(type_to_str(typ) for typ in types) + ")"
-    )
+    # NamedTuple does not allow other base classes, so we swap out `tuple` afterwards
+    subtype.__bases__ = (base,) + subtype.__bases__[1:]
+    if cache_hash:
+        subtype = _add_hash_cache(subtype, typevars)
+    if typevars:
+        _cache_specializations(subtype)
+    if not types:
+        _make_singleton(subtype)
     return subtype
 
 
+def _make_singleton(variant: type) -> None:
+    """Make a variant without fields return the same value on every call."""
+    instance = tuple.__new__(variant, ())
+
+    def __new__(cls: type) -> Any:
+        if cls is variant:
+            return instance
+        return tuple.__new__(cls, ())
+
+    def _make(cls: type, iterable: Any) -> Any:
+        # `_replace` uses this as well
+        return cls(*iterable)
+
+    type.__setattr__(variant, "__new__", staticmethod(__new__))
+    type.__setattr__(variant, "_make", classmethod(_make))
+
+
+class _VariantAlias(typing._GenericAlias, _root=True):  # type: ignore[name-defined]
+    """A parameterized generic variant like `Maybe.some[int]`.
+
+    Calling it is the same as calling the variant: typing's own aliases would also try
+    to set `__orig_class__` on the new value, which fails (slowly) for tuples.
+    """
+
+    # Python looks up `__call__` on the type and calls whatever the descriptor returns,
+    # so this calls the variant without an intermediate Python frame.
+    __call__ = property(operator.attrgetter("__origin__"))
+
+
+# `Generic` is implemented in C since Python 3.12, and calls this function of typing
+_generic_class_getitem = getattr(
+    typing,
+    "_generic_class_getitem",
+    Generic.__class_getitem__.__func__,  # type: ignore[attr-defined]
+)
+
+
+class _Specializations(dict[Any, _VariantAlias]):
+    """The parameterizations of a generic variant, created on first use."""
+
+    __slots__ = ("variant",)
+
+    def __init__(self, variant: type) -> None:
+        super().__init__()
+        self.variant = variant
+
+    def __missing__(self, params: Any) -> _VariantAlias:
+        result = self[params] = self.specialize(params)
+        return result
+
+    def specialize(self, params: Any) -> _VariantAlias:
+        alias = _generic_class_getitem(self.variant, params)
+        return _VariantAlias(alias.__origin__, alias.__args__)
+
+
+def _cache_specializations(variant: type) -> None:
+    """Make parameterizing the generic `variant` return cached `_VariantAlias`es."""
+    specializations = _Specializations(variant)
+    cached = specializations.__getitem__
+
+    def class_getitem(params: Any) -> _VariantAlias:
+        try:
+            return cached(params)
+        except TypeError:
+            # unhashable parameters like `Annotated[int, {}]` are not cached, as in
+            # typing; invalid parameters raise the same error again
+            return specializations.specialize(params)
+
+    type.__setattr__(variant, "__class_getitem__", staticmethod(class_getitem))
+
+
+def _add_hash_cache(namedtuple: type, typevars: tuple[type, ...]) -> type:
+    """Derive a class from a variant class whose instances can cache their hash.
+
+    The instances of the derived class have a `__dict__`, which `tuple` subclasses with
+    `__slots__` (like the classes created by `NamedTuple`) cannot have.
+    """
+    ns: dict[str, Any] = {
+        "__module__": namedtuple.__module__,
+        "__qualname__": namedtuple.__qualname__,
+        # the counters and `type_enum.codegen` look for these in the class itself
+        "__new__": namedtuple.__dict__["__new__"],
+        "_tag_": namedtuple.__dict__["_tag_"],
+        # `_variant_reduce` pickles and copies only the fields, so the cached hash
+        # (which is only valid in the current process) is never carried over
+        "__hash__": _cached_variant_hash,
+    }
+    if typevars:
+        # lets `Generic` find the type parameters of the derived class
+        ns["__orig_bases__"] = (namedtuple[typevars],)
+    return type(namedtuple.__name__, (namedtuple,), ns)
+
+
+try:
+    # the C implementation of the field accessors of `collections.namedtuple`
+    from collections import _tuplegetter  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+
+    def _tuplegetter(index: int, doc: str) -> Any:
+        return property(operator.itemgetter(index), doc=doc)
+
+
+class _StaticVariant(tuple):
+    """Base class for the variants in modules written by `type_enum.codegen`.
+
+    Provides the methods that `collections.namedtuple` would otherwise generate.
+    """
+
+    __slots__ = ()
+    _fields: tuple[str, ...] = ()
+    _field_defaults: dict[str, Any] = {}
+
+    __eq__ = _variant_eq
+    __ne__ = _variant_ne
+    __hash__ = _variant_hash
+    __reduce__ = _variant_reduce
+    from_rows = classmethod(_variant_from_rows)
+    from_columns = classmethod(_variant_from_columns)
+
+    @classmethod
+    def _make(cls, iterable: Any) -> Any:
+        result = tuple.__new__(cls, iterable)
+        if len(result) != len(cls._fields):
+            raise TypeError(f"Expected {len(cls._fields)} arguments, got {len(result)}")
+        return result
+
+    def _replace(self, /, **kwds: Any) -> Any:
+        result = self._make(map(kwds.pop, self._fields, self))
+        if kwds:
+            raise ValueError(f"Got unexpected field names: {list(kwds)!r}")
+        return result
+
+    def _asdict(self) -> dict[str, Any]:
+        return dict(zip(self._fields, self))
+
+    def __getnewargs__(self) -> tuple[Any, ...]:
+        return tuple(self)
+
+
+def _from_variants(
+    name: str,
+    module: str,
+    bases: tuple[Any, ...],
+    variant_base: type,
+    variants: tuple[type, ...],
+    union: Any,
+    intern: Mapping[str, int] = MappingProxyType({}),
+    hash_cons: bool = False,
+) -> TypeEnumMeta:
+    """Assemble a TypeEnum from variant classes that were written out as source code.
+
+    This skips all the work that `TypeEnumMeta.__new__` does; the variant classes must
+    already have their tags, docstrings and annotations.
+    """
+    member_map: dict[str, Entry] = {}
+    ns: dict[str, Any] = {"__module__": module, "__qualname__": name}
+    hash_cons_table = _hashcons.HashConsTable() if hash_cons else None
+    for variant in variants:
+        if not variant._fields:
+            _make_singleton(variant)
+        elif variant.__name__ in intern:
+            _interning.intern_variant(variant, intern[variant.__name__])
+        elif hash_cons_table is not None:
+            _hashcons.hash_cons_variant(variant, hash_cons_table)
+        member_map[variant.__name__] = Entry(
+            variant,
+            getattr(variant, "__parameters__", ()),
+            tuple(variant.__annotations__.values()),
+        )
+        ns[variant.__name__] = variant
+        setattr(variant_base, variant.__name__, variant)
+    ns["_member_map"] = member_map
+    ns["_variants"] = frozenset(variants)
+    ns["T"] = union
+    ns["_hash_cons"] = hash_cons_table
+    _finish_namespace(ns, list(member_map), variant_base)
+    resolved_bases = resolve_bases(bases)
+    if resolved_bases != bases:
+        ns["__orig_bases__"] = bases
+    return type.__new__(TypeEnumMeta, name, resolved_bases, ns)
+
+
 class TypeEnum(metaclass=TypeEnumMeta):
     T: Any
 
@@ -0,0 +1,215 @@
+"""Opt-in counting of how often TypeEnum variants are constructed and dispatched.
+
+While counting is enabled for a TypeEnum, the `__new__` of its variants and the handlers
+of its dispatch functions are replaced by wrappers that increment a counter. Every
+thread increments its own list of counters, so the wrappers need no lock; the lists are
+only summed up when the counts are read. Disabling counting puts the original functions
+back, so TypeEnums that are not counted pay nothing.
+"""
+
+import functools
+import threading
+from typing import Any, Callable, NamedTuple
+import weakref
+
+__all__ = [
+    "VariantCounts",
+    "disable_counting",
+    "enable_counting",
+    "reset_counts",
+    "snapshot_counts",
+    "variant_counts",
+]
+
+_Handler = Callable[[Any], Any]
+
+
+class VariantCounts(NamedTuple):
+    """How often a variant was constructed and how often it was dispatched on."""
+
+    constructed: int
+    dispatched: int
+
+
+class _Counters:
+    """The counters of one TypeEnum.
+
+    The list of every thread has two slots per variant: the slot `tag` counts
+    constructions and the slot `num_variants + tag` counts dispatches.
+    """
+
+    def __init__(self, num_variants: int) -> None:
+        self.num_variants = num_variants
+        self.enabled = False
+        self.local = threading.local()
+        self.per_thread: list[list[int]] = []
+        # resetting subtracts the totals at the time of the reset, so that the threads
+        # never have to synchronize with the reset
+        self.offset = [0] * (2 * num_variants)
+        # the original `__new__` of the variants that are currently instrumented
+        self.originals: dict[type, Any] = {}
+
+    def thread_counts(self) -> list[int]:
+        try:
+            return self.local.counts
+        except AttributeError:
+            counts = self.local.counts = [0] * (2 * self.num_variants)
+            with _lock:
+                self.per_thread.append(counts)
+            return counts
+
+    def totals(self) -> list[int]:
+        with _lock:
+            per_thread = list(self.per_thread)
+        totals = [0] * (2 * self.num_variants)
+        for counts in per_thread:
+            for i, count in enumerate(counts):
+                totals[i] += count
+        return totals
+
+
+_lock = threading.RLock()
+_counters: dict[type, _Counters] = {}
+# dispatch function -> (TypeEnum, its handler table, the original handlers)
+_dispatchers: weakref.WeakKeyDictionary[
+    Callable[..., Any], tuple[type, dict[type, _Handler], dict[type, _Handler]]
+] = weakref.WeakKeyDictionary()
+
+
+def enable_counting(enum: Any) -> None:
+    """Start counting constructions and dispatches of the variants of `enum`.
+
+    Only calls of the variant classes (including `E.A[int](...)`) are
+    counted, and only dispatch functions created with `enum._dispatch_()`. Counting adds
+    roughly the cost of a Python function call to each of them.
+    """
+    with _lock:
+        counters = _counters.get(enum)
+        if counters is None:
+            counters = _counters[enum] = _Counters(len(enum._tags))
+        if counters.enabled:
+            return
+        counters.enabled = True
+        for variant in list(enum._variants):
+            _instrument_variant(counters, variant)
+        for dispatch_enum, table, handlers in list(_dispatchers.values()):
+            if dispatch_enum is enum:
+                _instrument_dispatcher(counters, table, handlers)
+
+
+def disable_counting(enum: Any) -> None:
+    """Stop counting for `enum`; the counts so far are kept."""
+    with _lock:
+        counters = _counters.get(enum)
+        if counters is None or not counters.enabled:
+            return
+        counters.enabled = False
+        for variant, original in counters.originals.items():
+            type.__setattr__(variant, "__new__", original)
+        counters.originals.clear()
+        for dispatch_enum, table, handlers in list(_dispatchers.values()):
+            if dispatch_enum is enum:
+                table.update(handlers)
+
+
+def variant_counts(enum: Any) -> dict[str, VariantCounts]:
+    """Return the counts of the variants of `enum` since the last reset."""
+    with _lock:
+        counters = _counters.get(enum)
+        if counters is None:
+            return {name: VariantCounts(0, 0) for name in enum._tags}
+        totals = counters.totals()
+        offset = counters.offset
+    n = counters.num_variants
+    return {
+        name: VariantCounts(
+            totals[tag] - offset[tag], totals[n + tag] - offset[n + tag]
+        )
+        for name, tag in enum._tags.items()
+    }
+
+
+def snapshot_counts() -> dict[str, dict[str, VariantCounts]]:
+    """Return the counts of all TypeEnums that were ever counted.
+
+    The keys are the fully qualified names of the TypeEnums.
+    """
+    with _lock:
+        enums = list(_counters)
+    return {
+        f"{enum.__module__}.{enum.__qualname__}": variant_counts(enum) for enum in enums
+    }
+
+
+def reset_counts(enum: Any | None = None) -> None:
+    """Set the counts of `enum` (or of all TypeEnums) back to zero."""
+    with _lock:
+        selected = list(_counters.values()) if enum is None else [_counters.get(enum)]
+        for counters in selected:
+            if counters is not None:
+                counters.offset = counters.totals()
+
+
+def variant_created(enum: Any, variant: type) -> None:
+    """Instrument a variant of a lazy TypeEnum that was created after enabling."""
+    with _lock:
+        counters = _counters.get(enum)
+        if counters is not None and counters.enabled:
+            _instrument_variant(counters, variant)
+
+
+def register_dispatcher(
+    enum: Any, dispatcher: Callable[..., Any], table: dict[type, _Handler]
+) -> None:
+    """Make the handler table of a new dispatch function known to the counters."""
+    with _lock:
+        _dispatchers[dispatcher] = (enum, table, dict(table))
+        counters = _counters.get(enum)
+        if counters is not None and counters.enabled:
+            _instrument_dispatcher(counters, table, dict(table))
+
+
+def _instrument_variant(counters: _Counters, variant: type) -> None:
+    if variant in counters.originals:
+        return
+    original = variant.__dict__["__new__"]
+    new = original.__func__ if isinstance(original, staticmethod) else original
+    index = variant._tag_
+    thread_counts = counters.thread_counts
+    local = counters.local
+
+    @functools.wraps(new)
+    def __new__(cls: type, *args: Any, **kwargs: Any) -> Any:
+        try:
+            counts = local.counts
+        except AttributeError:
+            counts = thread_counts()
+        counts[index] += 1
+        return new(cls, *args, **kwargs)
+
+    counters.originals[variant] = original
+    type.__setattr__(variant, "__new__", staticmethod(__new__))
+
+
+def _instrument_dispatcher(
+    counters: _Counters, table: dict[type, _Handler], handlers: dict[type, _Handler]
+) -> None:
+    for variant, handler in handlers.items():
+        index = counters.num_variants + variant._tag_
+        table[variant] = _counting_handler(counters, index, handler)
+
+
+def _counting_handler(counters: _Counters, index: int, handler: _Handler) -> _Handler:
+    thread_counts = counters.thread_counts
+    local = counters.local
+
+    @functools.wraps(handler)
+    def counting_handler(value: Any) -> Any:
+        try:
+            counts = local.counts
+        except AttributeError:
+            counts = thread_counts()
+        counts[index] += 1
+        return handler(value)
+
+    return counting_handler
@@ -0,0 +1,149 @@
+"""Hash-consing of the values of a TypeEnum.
+
+For a TypeEnum with `hash_cons=True`, calling a variant returns the existing value if a
+value of the same variant with equal fields is still alive, so every value exists only
+once. Equality of such values is identity and their hash is the identity hash.
+
+Variants are tuples, which cannot be weakly referenced, so the table holds strong
+references and is swept from time to time instead: a sweep removes the values that are
+no longer referenced from anywhere but the table. Sweeps happen automatically whenever
+the table has doubled in size since the last sweep, and can be requested with
+`collect_hash_cons`. The sweep relies on reference counts, i.e. on CPython.
+"""
+
+import math
+import sys
+import threading
+from typing import Any, NamedTuple
+
+__all__ = ["HashConsInfo", "collect_hash_cons", "hash_cons_info"]
+
+# the table is not swept before it has this many values
+MIN_THRESHOLD = 1024
+
+
+class HashConsInfo(NamedTuple):
+    """Statistics of the table of a hash-consed TypeEnum."""
+
+    size: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the constructions that returned an existing value."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class HashConsTable:
+    """The canonical values of a TypeEnum, keyed by variant, fields and field types."""
+
+    __slots__ = ("values", "lock", "hits", "misses", "threshold")
+
+    def __init__(self) -> None:
+        # The insertion order of the dict puts every value after the values in its
+        # fields, which lets a single pass over the reversed dict free whole subtrees.
+        self.values: dict[tuple[Any, ...], Any] = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.threshold = MIN_THRESHOLD
+
+    def sweep(self) -> int:
+        """Remove the values that are only referenced by the table (needs the lock)."""
+        values = self.values
+        keys = list(values)
+        removed = 0
+        while keys:
+            # popping drops the last reference to the key of a removed value (which
+            # refers to its fields) before the values in its fields are looked at
+            key = keys.pop()
+            # one reference from the dict and one from the argument
+            if sys.getrefcount(values[key]) <= 2:
+                del values[key]
+                removed += 1
+        self.threshold = max(MIN_THRESHOLD, 2 * len(values))
+        return removed
+
+
+def hash_cons_info(enum: Any) -> HashConsInfo:
+    """Return the size of the table of `enum` and how often it was hit and missed."""
+    table = _table(enum)
+    with table.lock:
+        return HashConsInfo(len(table.values), table.hits, table.misses)
+
+
+def collect_hash_cons(enum: Any) -> int:
+    """Remove the unused values from the table of `enum` and return how many."""
+    table = _table(enum)
+    with table.lock:
+        return table.sweep()
+
+
+def _table(enum: Any) -> HashConsTable:
+    table = getattr(enum, "_hash_cons", None)
+    if table is None:
+        raise TypeError(f"{enum!r} is not hash-consed")
+    return table
+
+
+def hash_cons_variant(variant: type, table: HashConsTable) -> None:
+    """Make `variant` return the canonical values from `table`."""
+    original = variant.__dict__["__new__"]
+    new = original.__func__ if isinstance(original, staticmethod) else original
+    values = table.values
+    lock = table.lock
+
+    def __new__(cls: type, *args: Any, **kwargs: Any) -> Any:
+        if kwargs or cls is not variant:
+            value = new(cls, *args, **kwargs)
+            if cls is not variant:
+                return value
+            args = tuple(value)
+        else:
+            value = None
+        # equal fields of different types (`1`, `1.0`, `True`) are kept apart, as are
+        # the two zeros of floats
+        key: tuple[Any, ...] = (cls, args, tuple(map(type, args)))
+        if 0.0 in args:
+            key += (tuple(map(_sign, args)),)
+        with lock:
+            existing = values.get(key)
+            if existing is not None:
+                table.hits += 1
+                return existing
+            if value is None:
+                value = new(cls, *args)
+            values[key] = value
+            table.misses += 1
+            if len(values) >= table.threshold:
+                table.sweep()
+        return value
+
+    def _make(cls: type, iterable: Any) -> Any:
+        return cls(*iterable)
+
+    type.__setattr__(variant, "__new__", staticmethod(__new__))
+    type.__setattr__(variant, "_make", classmethod(_make))
+    type.__setattr__(variant, "__eq__", _identity_eq)
+    type.__setattr__(variant, "__ne__", _identity_ne)
+    type.__setattr__(variant, "__hash__", object.__hash__)
+
+
+def _sign(field: Any) -> float | None:
+    return math.copysign(1.0, field) if type(field) is float else None
+
+
+def _identity_eq(self: tuple, other: object) -> Any:
+    if self is other:
+        return True
+    if isinstance(other, tuple):
+        # returning `NotImplemented` would let `tuple.__eq__` compare the fields
+        return False
+    return NotImplemented
+
+
+def _identity_ne(self: tuple, other: object) -> Any:
+    result = _identity_eq(self, other)
+    return result if result is NotImplemented else not result
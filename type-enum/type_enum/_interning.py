@@ -0,0 +1,71 @@
+"""Opt-in interning of the values of individual variants.
+
+The `__new__` of an interned variant is wrapped in a `functools.lru_cache`, so calling
+the variant with arguments that were seen recently returns the value that was created
+back then, instead of allocating a new one. The cache is bounded and evicts the least
+recently used values first.
+"""
+
+from collections.abc import Mapping
+import functools
+from typing import Any
+import weakref
+
+__all__ = ["clear_interned", "interning_info"]
+
+DEFAULT_MAXSIZE = 1024
+
+# variant class -> the `lru_cache` that wraps its `__new__`
+_caches: weakref.WeakKeyDictionary[type, Any] = weakref.WeakKeyDictionary()
+
+
+def interning_info(variant: type) -> functools._CacheInfo:
+    """Return the hits, misses, maximum size and current size of the cache of `variant`.
+
+    Raises `TypeError` if `variant` is not interned.
+    """
+    return _cache(variant).cache_info()
+
+
+def clear_interned(variant: type) -> None:
+    """Remove all values from the cache of `variant` and reset its statistics."""
+    _cache(variant).cache_clear()
+
+
+def _cache(variant: type) -> Any:
+    try:
+        return _caches[variant]
+    except KeyError:
+        raise TypeError(f"{variant!r} is not interned") from None
+
+
+def intern_variant(variant: type, maxsize: int) -> None:
+    """Make `variant` return cached values for hashable arguments."""
+    if maxsize <= 0:
+        raise ValueError(f"The interning cache of {variant!r} needs a positive size")
+    original = variant.__dict__["__new__"]
+    new = original.__func__ if isinstance(original, staticmethod) else original
+    # `typed=True` keeps `E.A(1)` and `E.A(True)` apart
+    cached = functools.lru_cache(maxsize, typed=True)(new)
+    _caches[variant] = cached
+
+    def _make(cls: type, iterable: Any) -> Any:
+        # `_replace` uses this as well
+        return cls(*iterable)
+
+    type.__setattr__(variant, "__new__", staticmethod(cached))
+    type.__setattr__(variant, "_make", classmethod(_make))
+
+
+def parse_sizes(intern: Any, field_names: list[str]) -> dict[str, int]:
+    """Turn the `intern` argument of a TypeEnum into a dict of cache sizes."""
+    if isinstance(intern, str):
+        raise TypeError("`intern` must be a collection of variant names, not a string")
+    if isinstance(intern, Mapping):
+        sizes = dict(intern)
+    else:
+        sizes = dict.fromkeys(intern, DEFAULT_MAXSIZE)
+    unknown = [name for name in sizes if name not in field_names]
+    if unknown:
+        raise TypeError(f"Cannot intern unknown variants: {', '.join(unknown)}")
+    return sizes
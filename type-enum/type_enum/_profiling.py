@@ -0,0 +1,119 @@
+"""Opt-in measurement of the time it takes to define TypeEnums."""
+
+import atexit
+import os
+import sys
+from time import perf_counter
+from typing import Any, Callable, NamedTuple, TypeVar
+
+__all__ = [
+    "EnumProfile",
+    "ProfileReport",
+    "disable_profiling",
+    "enable_profiling",
+    "profile_report",
+    "reset_profiling",
+]
+
+_R = TypeVar("_R")
+
+PHASES = ("annotations", "variants", "docstrings", "union", "other")
+
+enabled = False
+_records: dict[str, dict[str, float]] = {}
+
+
+class EnumProfile(NamedTuple):
+    """Time (in seconds) spent on defining one TypeEnum, split into phases.
+
+    `annotations` is the time for resolving the annotations with `get_type_hints`,
+    `variants` for creating the variant classes, `docstrings` for generating their
+    docstrings, `union` for constructing `T` and `other` for everything else in
+    `TypeEnumMeta.__new__`. For lazy TypeEnums, the first four phases are measured when
+    they actually happen.
+    """
+
+    name: str
+    annotations: float
+    variants: float
+    docstrings: float
+    union: float
+    other: float
+
+    @property
+    def total(self) -> float:
+        return (
+            self.annotations + self.variants + self.docstrings + self.union + self.other
+        )
+
+
+class ProfileReport(list[EnumProfile]):
+    """The recorded profiles, sorted by total time; `str()` renders them as a table."""
+
+    def __str__(self) -> str:
+        header = f"{'TypeEnum':<40}" + "".join(f"{p:>12}" for p in (*PHASES, "total"))
+        lines = [header, "-" * len(header)]
+        for profile in self:
+            times = (*profile[1:], profile.total)
+            lines.append(
+                f"{profile.name:<40}" + "".join(f"{t * 1e3:>10.3f}ms" for t in times)
+            )
+        return "\n".join(lines)
+
+
+def enable_profiling() -> None:
+    """Start recording how long the definitions of TypeEnums take.
+
+    Profiling can also be enabled by setting the environment variable
+    `TYPE_ENUM_PROFILE` to a non-empty value, in which case the report is printed to
+    stderr when the interpreter exits.
+    """
+    global enabled
+    enabled = True
+
+
+def disable_profiling() -> None:
+    """Stop recording; the profiles recorded so far are kept."""
+    global enabled
+    enabled = False
+
+
+def reset_profiling() -> None:
+    """Forget all recorded profiles."""
+    _records.clear()
+
+
+def profile_report(limit: int | None = None) -> ProfileReport:
+    """Return the recorded profiles, the slowest TypeEnum first."""
+    profiles = [EnumProfile(name, **times) for name, times in _records.items()]
+    profiles.sort(key=lambda profile: profile.total, reverse=True)
+    return ProfileReport(profiles[:limit])
+
+
+def record(name: str, phase: str, seconds: float) -> None:
+    times = _records.get(name)
+    if times is None:
+        times = _records[name] = dict.fromkeys(PHASES, 0.0)
+    times[phase] += seconds
+
+
+def total(name: str) -> float:
+    times = _records.get(name)
+    return sum(times.values()) if times is not None else 0.0
+
+
+def timed(name: str, phase: str, func: Callable[..., _R], *args: Any) -> _R:
+    start = perf_counter()
+    try:
+        return func(*args)
+    finally:
+        record(name, phase, perf_counter() - start)
+
+
+def _print_report() -> None:
+    print(profile_report(), file=sys.stderr)
+
+
+if os.environ.get("TYPE_ENUM_PROFILE"):
+    enable_profiling()
+    atexit.register(_print_report)
@@ -1,5 +1,12 @@
+import inspect
 from types import NoneType, UnionType
-from typing import Any, Literal, Union, get_args, get_origin
+from typing import Any, Literal, TypeVar, Union, get_args, get_origin
+import weakref
+
+# variant class -> the types of its fields
+_field_types: weakref.WeakKeyDictionary[type, tuple[Any, ...]] = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def type_to_str(type_: Any) -> str:
@@ -91,3 +98,81 @@ def is_dunder(name: str) -> bool:
         and name[2] != "_"
         and name[-3] != "_"
     )
+
+
+def is_variant(tp: Any) -> bool:
+    """Return True if `tp` is a variant class of a TypeEnum."""
+    return isinstance(tp, type) and isinstance(tp.__dict__.get("_tag_"), int)
+
+
+def variants_of(tp: Any) -> tuple[type, ...] | None:
+    """Return the variants of a variant or a union of variants like `E.T`, else None."""
+    if is_variant(tp):
+        return (tp,)
+    if _is_union_type(tp):
+        args = get_args(tp)
+        if all(is_variant(arg) for arg in args):
+            return args
+    return None
+
+
+def field_types(variant: type) -> tuple[Any, ...]:
+    """Return the annotated types of the fields of `variant`."""
+    try:
+        return _field_types[variant]
+    except KeyError:
+        types = _field_types[variant] = tuple(variant.__annotations__.values())
+        return types
+
+
+def split_optional(tp: Any) -> tuple[bool, Any]:
+    """Split `X | None` into `(True, X)`; other types give `(False, tp)`."""
+    if _is_union_type(tp):
+        args = get_args(tp)
+        if NoneType in args and len(args) >= 2:
+            args = tuple(arg for arg in args if arg is not NoneType)
+            return True, args[0] if len(args) == 1 else Union[args]
+    return False, tp
+
+
+def plain_new(variant: type) -> Any:
+    """Return the `__new__` of `variant` if it only creates the tuple, else None.
+
+    That is the `__new__` generated by `NamedTuple` or by `type_enum.codegen`, which
+    take `_cls` and the fields; interning and hash-consing wrap it in other functions.
+    """
+    new = variant.__dict__.get("__new__")
+    func = getattr(new, "__func__", new)
+    code = getattr(func, "__code__", None)
+    if code is None or code.co_varnames[:1] != ("_cls",):
+        return None
+    if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+        return None
+    return func
+
+
+def runtime_types(tp: Any) -> tuple[type, ...] | None:
+    """Return the classes whose instances are values of type `tp`, for `isinstance`.
+
+    Returns None for types that cannot be checked like that, e.g. `Any` or type
+    variables. Only the outer type of generics is checked, e.g. `list` for `list[int]`.
+    """
+    if tp is Any or isinstance(tp, TypeVar):
+        return None
+    if tp is None or tp is NoneType:
+        return (NoneType,)
+    if _is_union_type(tp):
+        result: tuple[type, ...] = ()
+        for arg in get_args(tp):
+            types = runtime_types(arg)
+            if types is None:
+                return None
+            result += types
+        return result
+    # `int` is accepted for `float`, and both for `complex`, as by type checkers
+    if tp is float:
+        return (float, int)
+    if tp is complex:
+        return (complex, float, int)
+    origin = get_origin(tp) or tp
+    return (origin,) if isinstance(origin, type) else None
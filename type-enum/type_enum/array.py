@@ -0,0 +1,324 @@
+"""Columnar storage for large numbers of TypeEnum values (requires NumPy).
+
+A `TypeEnumArray` stores the values of one TypeEnum without creating a Python object for
+each of them: one array holds the tag of every value, and every field of every variant
+gets its own NumPy column. An offset array maps each position to its row in the columns
+of its variant (the same layout as Arrow's dense unions). Fields annotated with `bool`,
+`int`, `float` or `complex` get native columns; all other fields are stored in columns
+of Python objects. The values in a native column must have exactly the type of its
+field (e.g. an `int` is not accepted for a `float` field, as it would come back as a
+`float`); other values are rejected with a `TypeError`.
+
+Values are only turned back into variant instances when they are accessed by index or
+iteration. Whole variants can be processed at once with `mask`, `select` and `map`.
+"""
+
+from typing import Any, Callable, Iterable, Iterator, Mapping, get_origin
+
+import numpy as np
+
+from ._core import TypeEnumMeta, _by_variant
+
+__all__ = ["TypeEnumArray"]
+
+_OBJECT = np.dtype(object)
+_DTYPES = {
+    bool: np.dtype(np.bool_),
+    int: np.dtype(np.int64),
+    float: np.dtype(np.float64),
+    complex: np.dtype(np.complex128),
+}
+
+
+def _column_dtype(typ: Any) -> np.dtype:
+    try:
+        return _DTYPES.get(typ, _OBJECT)
+    except TypeError:
+        # unhashable annotation
+        return _OBJECT
+
+
+# the types of the values that a native column stores without changing them
+_ACCEPTED = {
+    bool: (bool, np.bool_),
+    int: (int, np.integer),
+    float: (float, np.floating),
+    complex: (complex, np.complexfloating),
+}
+
+
+def _is_accepted(typ: type, field_type: Any) -> bool:
+    # `bool` is a subclass of `int`, but would come back as an `int`
+    return issubclass(typ, _ACCEPTED[field_type]) and (
+        field_type is bool or not issubclass(typ, (bool, np.bool_))
+    )
+
+
+def _reserve(array: np.ndarray, size: int, needed: int) -> np.ndarray:
+    """Return `array` or a copy of its first `size` entries with room for `needed`."""
+    if needed <= len(array):
+        return array
+    grown = np.empty(max(needed, 2 * len(array), 8), dtype=array.dtype)
+    grown[:size] = array[:size]
+    return grown
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class _VariantColumns:
+    """The field columns of one variant, with spare capacity at the end."""
+
+    __slots__ = ("variant", "types", "dtypes", "columns", "size")
+
+    def __init__(self, variant: type, types: tuple[Any, ...]) -> None:
+        self.variant = variant
+        self.types = types
+        self.dtypes = [_column_dtype(typ) for typ in types]
+        self.columns = [np.empty(0, dtype=dtype) for dtype in self.dtypes]
+        self.size = 0
+
+    def convert(self, rows: list[Any]) -> list[np.ndarray]:
+        """Turn a list of values of the variant into one array per field."""
+        count = len(rows)
+        converted = []
+        for i, dtype in enumerate(self.dtypes):
+            values = [row[i] for row in rows]
+            if dtype is not _OBJECT:
+                self._check(i, values, rows)
+            converted.append(np.fromiter(values, dtype, count=count))
+        return converted
+
+    def _check(self, i: int, values: list[Any], rows: list[Any]) -> None:
+        """Check that a native column can store `values` without changing them."""
+        typ = self.types[i]
+        # the distinct types of a column are few, so checking them is cheap
+        if all(_is_accepted(t, typ) for t in set(map(type, values))):
+            return
+        index, value = next(
+            (index, value)
+            for index, value in enumerate(values)
+            if not _is_accepted(type(value), typ)
+        )
+        raise TypeError(
+            f"field {i} of {self.variant.__qualname__}: expected {typ.__name__}, "
+            f"got {value!r} in {rows[index]!r}"
+        )
+
+    def extend(self, count: int, converted: list[np.ndarray]) -> None:
+        start, stop = self.size, self.size + count
+        for i, values in enumerate(converted):
+            column = self.columns[i] = _reserve(self.columns[i], start, stop)
+            column[start:stop] = values
+        self.size = stop
+
+    def view(self) -> tuple[np.ndarray, ...]:
+        return tuple(_read_only(column[: self.size]) for column in self.columns)
+
+
+class TypeEnumArray:
+    """A growable, column-oriented array of values of one TypeEnum.
+
+    Indexing with an integer returns a variant instance. Indexing with a slice, a
+    boolean mask or an array of positions returns a new `TypeEnumArray`.
+    """
+
+    def __init__(self, enum: TypeEnumMeta, values: Iterable[Any] = ()) -> None:
+        self.enum = enum
+        member_map = enum._member_map
+        self._variants = [entry.typ for entry in member_map.values()]
+        self._by_type = {variant: tag for tag, variant in enumerate(self._variants)}
+        self._stores = [
+            _VariantColumns(entry.typ, entry.types) for entry in member_map.values()
+        ]
+        tag_dtype = np.min_scalar_type(max(len(self._variants) - 1, 0))
+        self._tags = np.empty(0, dtype=tag_dtype)
+        self._offsets = np.empty(0, dtype=np.int64)
+        self._size = 0
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        if self._size <= 6:
+            items = [repr(value) for value in self]
+        else:
+            items = [repr(self[i]) for i in (0, 1, 2)] + ["..."]
+            items += [repr(self[i]) for i in (-3, -2, -1)]
+        return f"TypeEnumArray({self.enum.__name__}, [{', '.join(items)}])"
+
+    @property
+    def tags(self) -> np.ndarray:
+        """The tags of the values (read-only)."""
+        return _read_only(self._tags[: self._size])
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """The row of every value in the columns of its variant (read-only)."""
+        return _read_only(self._offsets[: self._size])
+
+    def append(self, value: Any) -> None:
+        self.extend((value,))
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Append all `values`; nothing is appended if one of them is invalid."""
+        by_type = self._by_type
+        sizes = [store.size for store in self._stores]
+        pending: list[list[Any]] = [[] for _ in self._stores]
+        new_tags: list[int] = []
+        new_offsets: list[int] = []
+        for value in values:
+            try:
+                tag = by_type[type(value)]
+            except KeyError:
+                raise TypeError(
+                    f"{value!r} is not a variant of {self.enum.__name__}"
+                ) from None
+            rows = pending[tag]
+            new_tags.append(tag)
+            new_offsets.append(sizes[tag] + len(rows))
+            rows.append(value)
+        # convert everything before changing anything
+        converted = [
+            store.convert(rows) if rows else None
+            for store, rows in zip(self._stores, pending)
+        ]
+        start, stop = self._size, self._size + len(new_tags)
+        self._tags = _reserve(self._tags, start, stop)
+        self._tags[start:stop] = new_tags
+        self._offsets = _reserve(self._offsets, start, stop)
+        self._offsets[start:stop] = new_offsets
+        for store, rows, columns in zip(self._stores, pending, converted):
+            if columns is not None:
+                store.extend(len(rows), columns)
+        self._size = stop
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, (int, np.integer)):
+            position = range(self._size)[index]
+            tag = int(self._tags[position])
+            row = int(self._offsets[position])
+            columns = self._stores[tag].columns
+            return self._variants[tag](*[column.item(row) for column in columns])
+        return self._take(np.arange(self._size)[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._iter(0, self._size)
+
+    def _iter(self, start: int, stop: int) -> Iterator[Any]:
+        """Iterate over the values at the positions from `start` to `stop`."""
+        variants = self._variants
+        tags = self._tags[start:stop]
+        offsets = self._offsets[start:stop]
+        # only convert the rows of each variant that are needed
+        firsts = [0] * len(variants)
+        rows: list[list[Any] | None] = []
+        for tag, store in enumerate(self._stores):
+            if not store.columns or start >= stop:
+                rows.append(None)
+                continue
+            used = offsets[tags == tag]
+            if not len(used):
+                rows.append(None)
+                continue
+            first = firsts[tag] = int(used.min())
+            last = int(used.max()) + 1
+            columns = [column[first:last].tolist() for column in store.columns]
+            rows.append(list(zip(*columns)))
+        for tag, offset in zip(tags.tolist(), offsets.tolist()):
+            fields = rows[tag]
+            if fields is None:
+                yield variants[tag]()
+            else:
+                yield variants[tag](*fields[offset - firsts[tag]])
+
+    def _tag(self, key: Any) -> int:
+        variant = get_origin(key) or key
+        tag = self._by_type.get(variant)
+        if tag is None:
+            raise TypeError(f"{key!r} is not a variant of {self.enum.__name__}")
+        return tag
+
+    def mask(self, variant: Any) -> np.ndarray:
+        """Return a boolean array that is true at the values of `variant`."""
+        return self._tags[: self._size] == self._tag(variant)
+
+    def select(self, variant: Any) -> tuple[np.ndarray, ...]:
+        """Return the field columns of the values of `variant`, in order (read-only)."""
+        return self._stores[self._tag(variant)].view()
+
+    def map(
+        self,
+        handlers: Mapping[Any, Callable[..., Any]],
+        dtype: Any = None,
+    ) -> np.ndarray:
+        """Apply a vectorized handler per variant and return the results in order.
+
+        Every variant must have exactly one handler. Each handler is called once, with
+        the field columns of its variant (see `select`), and must return either an
+        array with one result per value of the variant, or a scalar for all of them.
+        """
+        by_variant = _by_variant(self.enum, handlers, "handler", complete=True)
+        pieces = []
+        for variant, store in zip(self._variants, self._stores):
+            result = np.asarray(by_variant[variant](*store.view()))
+            if result.ndim == 0:
+                result = np.broadcast_to(result, (store.size,))
+            elif result.shape[:1] != (store.size,):
+                raise ValueError(
+                    f"The handler for {variant.__qualname__} returned "
+                    f"{result.shape[0]} results for {store.size} values"
+                )
+            pieces.append(result)
+        # The results of each variant are in the order of its rows, so the result for
+        # a value is at the start of its variant's results plus its offset.
+        starts = np.cumsum([0] + [store.size for store in self._stores[:-1]])
+        combined = np.concatenate(pieces, dtype=dtype)
+        return combined[starts[self.tags] + self.offsets]
+
+    def _take(self, positions: np.ndarray) -> "TypeEnumArray":
+        """Return a new array with the values at `positions`."""
+        tags = self._tags[: self._size][positions]
+        old_offsets = self._offsets[: self._size][positions]
+        offsets = np.empty(len(positions), dtype=np.int64)
+        columns = []
+        for tag, store in enumerate(self._stores):
+            selected = tags == tag
+            rows = old_offsets[selected]
+            offsets[selected] = np.arange(len(rows))
+            columns.append([column[rows] for column in store.columns])
+        return self._from_parts(self.enum, tags, offsets, columns)
+
+    @classmethod
+    def _from_parts(
+        cls,
+        enum: TypeEnumMeta,
+        tags: np.ndarray,
+        offsets: np.ndarray,
+        columns: list[list[np.ndarray]],
+        counts: list[int] | None = None,
+    ) -> "TypeEnumArray":
+        """Create an array from its tags, offsets and the columns of every variant.
+
+        `counts` are the numbers of values of every variant, if they are known.
+        """
+        result = cls(enum)
+        result._tags = tags.astype(result._tags.dtype, copy=False)
+        result._offsets = offsets.astype(np.int64, copy=False)
+        result._size = len(tags)
+        for store, variant_columns in zip(result._stores, columns):
+            store.columns = [
+                column.astype(dtype, copy=False)
+                for column, dtype in zip(variant_columns, store.dtypes)
+            ]
+        if counts is None:
+            # nullary variants have no columns that would tell how many values they
+            # have
+            counts = np.bincount(result.tags, minlength=len(result._stores)).tolist()
+        for store, count in zip(result._stores, counts):
+            store.size = count
+        return result
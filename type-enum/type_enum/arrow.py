@@ -0,0 +1,240 @@
+"""Conversion of TypeEnum values to and from Apache Arrow (requires PyArrow).
+
+A TypeEnum maps onto an Arrow dense union with one child per variant, in tag order, so
+the type code of a value is the tag of its variant. Each child is a struct with the
+fields of the variant (`field0`, `field1`, ...), whose types are taken from the variant
+annotations:
+
+- `bool`, `int` (64 bits), `float`, `str`, `bytes`, `datetime.date` and
+  `datetime.datetime`, optionally as `X | None`;
+- `list[X]` of these;
+- variants and unions of variants, like `Color.T`, which become nested dense unions.
+
+`write_arrow` writes values to an Arrow IPC file in batches, and `read_arrow` maps such
+a file into memory without copying it. `from_arrow` turns (a slice of) an Arrow array
+back into variant instances, so only the part of a file that is needed is decoded.
+"""
+
+import datetime
+from itertools import islice
+import os
+from typing import Any, Iterable, Iterator, get_args, get_origin
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ._core import TypeEnumMeta
+from ._utils import field_types, split_optional, variants_of
+
+__all__ = [
+    "arrow_type",
+    "from_arrow",
+    "iter_arrow",
+    "read_arrow",
+    "to_arrow",
+    "write_arrow",
+]
+
+DEFAULT_BATCH_SIZE = 65536
+
+# name of the column that holds the values in IPC files
+_COLUMN = "value"
+
+_SCALAR_TYPES = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    bytes: pa.binary(),
+    datetime.date: pa.date32(),
+    datetime.datetime: pa.timestamp("us"),
+}
+
+
+def arrow_type(enum: TypeEnumMeta) -> pa.DenseUnionType:
+    """Return the Arrow type of the values of `enum`."""
+    return _union_type(tuple(enum))
+
+
+def to_arrow(enum: TypeEnumMeta, values: Iterable[Any]) -> pa.UnionArray:
+    """Convert variant instances of `enum` to an Arrow dense union array."""
+    return _union_to_arrow(tuple(enum), values)
+
+
+def from_arrow(enum: TypeEnumMeta, array: pa.Array | pa.ChunkedArray) -> list[Any]:
+    """Convert an Arrow array of type `arrow_type(enum)` back to variant instances."""
+    variants = tuple(enum)
+    if array.type != _union_type(variants):
+        raise TypeError(f"Expected an array of {enum.__name__}, got {array.type}")
+    if isinstance(array, pa.ChunkedArray):
+        return [
+            value
+            for chunk in array.chunks
+            for value in _union_from_arrow(variants, chunk)
+        ]
+    return _union_from_arrow(variants, array)
+
+
+def write_arrow(
+    path: str | os.PathLike[str],
+    enum: TypeEnumMeta,
+    values: Iterable[Any],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Write `values` to an Arrow IPC file and return how many were written.
+
+    `values` can be any iterable; it is consumed `batch_size` values at a time, and each
+    batch becomes a record batch of the file.
+    """
+    metadata = {"type_enum": f"{enum.__module__}.{enum.__qualname__}"}
+    schema = pa.schema([pa.field(_COLUMN, arrow_type(enum), nullable=False)], metadata)
+    iterator = iter(values)
+    count = 0
+    with pa.OSFile(os.fspath(path), "wb") as sink:
+        with pa.ipc.new_file(sink, schema) as writer:
+            while batch := list(islice(iterator, batch_size)):
+                array = to_arrow(enum, batch)
+                writer.write_batch(pa.record_batch([array], schema=schema))
+                count += len(batch)
+    return count
+
+
+def read_arrow(path: str | os.PathLike[str], enum: TypeEnumMeta) -> pa.ChunkedArray:
+    """Memory-map an IPC file written by `write_arrow` and return its values.
+
+    The returned array refers to the mapped file, so nothing is read before it is
+    accessed. Slicing it is free; pass a slice to `from_arrow` to decode a part of it.
+    """
+    source = pa.memory_map(os.fspath(path))
+    values = pa.ipc.open_file(source).read_all().column(_COLUMN)
+    if values.type != arrow_type(enum):
+        raise TypeError(
+            f"{os.fspath(path)!r} does not contain values of {enum.__name__}"
+        )
+    return values
+
+
+def iter_arrow(path: str | os.PathLike[str], enum: TypeEnumMeta) -> Iterator[Any]:
+    """Iterate over the values in an IPC file, decoding one record batch at a time."""
+    for chunk in read_arrow(path, enum).chunks:
+        yield from _union_from_arrow(tuple(enum), chunk)
+
+
+def _arrow_type(tp: Any) -> pa.DataType:
+    variants = variants_of(tp)
+    if variants is not None:
+        return _union_type(variants)
+    if get_origin(tp) is list:
+        (item,) = get_args(tp)
+        return pa.list_(_scalar_type(item))
+    return _scalar_type(tp)
+
+
+def _scalar_type(tp: Any) -> pa.DataType:
+    # Arrow values can always be null, so `X | None` is stored like `X`
+    _, tp = split_optional(tp)
+    try:
+        return _SCALAR_TYPES[tp]
+    except (KeyError, TypeError):
+        raise TypeError(f"Cannot store fields of type {tp!r} in Arrow arrays") from None
+
+
+def _union_type(variants: tuple[type, ...]) -> pa.DenseUnionType:
+    if len(variants) > 128:
+        raise TypeError("Arrow unions can have at most 128 variants")
+    children = [
+        pa.field(
+            variant.__name__,
+            pa.struct(
+                [
+                    pa.field(name, _arrow_type(tp))
+                    for name, tp in zip(variant._fields, field_types(variant))
+                ]
+            ),
+        )
+        for variant in variants
+    ]
+    return pa.dense_union(children, type_codes=list(range(len(variants))))
+
+
+def _union_to_arrow(variants: tuple[type, ...], values: Iterable[Any]) -> pa.UnionArray:
+    union_type = _union_type(variants)
+    codes_by_type = {variant: code for code, variant in enumerate(variants)}
+    codes: list[int] = []
+    offsets: list[int] = []
+    rows: list[list[Any]] = [[] for _ in variants]
+    for value in values:
+        try:
+            code = codes_by_type[type(value)]
+        except KeyError:
+            raise TypeError(f"Cannot store {value!r} as {union_type}") from None
+        variant_rows = rows[code]
+        codes.append(code)
+        offsets.append(len(variant_rows))
+        variant_rows.append(value)
+    children = [
+        _struct_to_arrow(child.type, field_types(variant), variant_rows)
+        for child, variant, variant_rows in zip(union_type, variants, rows)
+    ]
+    return pa.UnionArray.from_dense(
+        pa.array(codes, pa.int8()),
+        pa.array(offsets, pa.int32()),
+        children,
+        [variant.__name__ for variant in variants],
+        list(range(len(variants))),
+    )
+
+
+def _struct_to_arrow(
+    struct_type: pa.StructType, types: tuple[Any, ...], rows: list[Any]
+) -> pa.StructArray:
+    if not types:
+        # a struct without fields still needs a length
+        return pa.array([{}] * len(rows), type=struct_type)
+    columns = [
+        _column_to_arrow(field.type, tp, [row[i] for row in rows])
+        for i, (field, tp) in enumerate(zip(struct_type, types))
+    ]
+    return pa.StructArray.from_arrays(columns, fields=list(struct_type))
+
+
+def _column_to_arrow(arrow_type: pa.DataType, tp: Any, values: list[Any]) -> pa.Array:
+    variants = variants_of(tp)
+    if variants is not None:
+        return _union_to_arrow(variants, values)
+    return pa.array(values, type=arrow_type)
+
+
+def _union_from_arrow(variants: tuple[type, ...], array: pa.UnionArray) -> list[Any]:
+    # `UnionArray.type_codes` and `.offsets` ignore the offset of sliced arrays
+    _, code_buffer, offset_buffer = array.buffers()[:3]
+    codes = pa.Array.from_buffers(
+        pa.int8(), len(array), [None, code_buffer], offset=array.offset
+    )
+    offsets = pa.Array.from_buffers(
+        pa.int32(), len(array), [None, offset_buffer], offset=array.offset
+    )
+    result: list[Any] = [None] * len(array)
+    for code, variant in enumerate(variants):
+        positions = pc.indices_nonzero(pc.equal(codes, code))
+        if not len(positions):
+            continue
+        types = field_types(variant)
+        if not types:
+            value = variant()
+            for position in positions.to_pylist():
+                result[position] = value
+            continue
+        rows = array.field(code).take(pc.take(offsets, positions))
+        columns = [_column_from_arrow(tp, rows.field(i)) for i, tp in enumerate(types)]
+        for position, fields in zip(positions.to_pylist(), zip(*columns)):
+            result[position] = variant(*fields)
+    return result
+
+
+def _column_from_arrow(tp: Any, array: pa.Array) -> list[Any]:
+    variants = variants_of(tp)
+    if variants is not None:
+        return _union_from_arrow(variants, array)
+    return array.to_pylist()
@@ -0,0 +1,332 @@
+"""A compact binary encoding of TypeEnum values.
+
+Every value is written as its tag (one byte, or two for TypeEnums with more than 256
+variants), followed by a header with the fixed-size fields and the lengths of the
+variable-size fields, packed with `struct`, followed by the variable-size fields:
+
+- `bool`, `int` (64 bits) and `float` are packed into the header;
+- `str` (as UTF-8) and `bytes` get their length in the header and follow it;
+- variants and unions of variants (like `Color.T`) follow the header in the same
+  encoding, so they need no length.
+
+`X | None` is supported for all of these except variants; for fixed-size fields, it
+adds a flag to the header, and for `str` and `bytes` the length -1 means `None`. All
+numbers are little-endian.
+
+A `BinaryCodec` compiles an encoder and a decoder function for each variant from its
+annotations when it is created. The encoders write into a single `bytearray` with
+`struct.pack_into`, and the decoders read from a `memoryview` without copying it, so
+encoding or decoding many values in bulk is much faster than pickling them.
+"""
+
+import struct
+from typing import Any, Callable, Iterable
+
+from ._core import TypeEnumMeta
+from ._utils import field_types, plain_new, split_optional, variants_of
+
+__all__ = ["BinaryCodec"]
+
+_FIXED_CODES = {bool: "?", int: "q", float: "d"}
+
+_Encoder = Callable[[Any, bytearray, int], int]
+_Decoder = Callable[[memoryview, int], tuple[Any, int]]
+
+
+class BinaryCodec:
+    """Encoder and decoder for the values of one TypeEnum."""
+
+    def __init__(self, enum: TypeEnumMeta) -> None:
+        self.enum = enum
+        root = _UnionCodec(tuple(enum), {})
+        self._encoders = root.encoders
+        self._decoders = root.decoders
+        self._decode_value = root.decode
+
+    def encode(self, value: Any) -> bytes:
+        """Return the encoding of a single value."""
+        out = bytearray()
+        self.encode_into((value,), out)
+        return bytes(out)
+
+    def encode_many(self, values: Iterable[Any]) -> bytearray:
+        """Return the concatenated encodings of `values`."""
+        out = bytearray()
+        self.encode_into(values, out)
+        return out
+
+    def encode_into(self, values: Iterable[Any], out: bytearray) -> int:
+        """Append the encodings of `values` to `out` and return the number of bytes.
+
+        If a value cannot be encoded, `out` is restored to its original length.
+        """
+        encoders = self._encoders
+        start = pos = len(out)
+        value = None
+        try:
+            for value in values:
+                try:
+                    encoder = encoders[type(value)]
+                except KeyError:
+                    raise TypeError(
+                        f"{value!r} is not a variant of {self.enum.__name__}"
+                    ) from None
+                pos = encoder(value, out, pos)
+        except struct.error as e:
+            del out[start:]
+            raise ValueError(f"Cannot encode {value!r}: {e}") from None
+        except AttributeError as e:
+            # e.g. `str.encode` of a non-string
+            del out[start:]
+            raise TypeError(f"Cannot encode {value!r}: {e}") from None
+        except BaseException:
+            del out[start:]
+            raise
+        # the encoders grow `out` in large steps
+        del out[pos:]
+        return pos - start
+
+    def decode(self, data: Any) -> Any:
+        """Decode a single value that fills all of `data`."""
+        buf = _byte_view(data)
+        value, end = self._decode(buf, 0)
+        if end != len(buf):
+            if end > len(buf):
+                raise ValueError("Truncated value at offset 0")
+            raise ValueError(f"{len(buf) - end} bytes left after the value")
+        return value
+
+    def decode_from(self, data: Any, offset: int = 0) -> tuple[Any, int]:
+        """Decode the value at `offset` in `data` and return it with its end offset."""
+        buf = _byte_view(data)
+        value, end = self._decode(buf, offset)
+        if end > len(buf):
+            raise ValueError(f"Truncated value at offset {offset}")
+        return value, end
+
+    def decode_many(self, data: Any) -> list[Any]:
+        """Decode all values in `data`, which must contain whole values only."""
+        buf = _byte_view(data)
+        decode_value = self._decode_value
+        result: list[Any] = []
+        append = result.append
+        pos = 0
+        end = len(buf)
+        try:
+            if len(self._decoders) <= 256:
+                # the same as `decode_value`, without a function call per value
+                decoders = self._decoders
+                while pos < end:
+                    value, pos = decoders[buf[pos]](buf, pos + 1)
+                    append(value)
+            else:
+                while pos < end:
+                    value, pos = decode_value(buf, pos)
+                    append(value)
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid value at offset {pos}: {e}") from None
+        if pos != end:
+            raise ValueError(f"Truncated value at the end of {end} bytes")
+        return result
+
+    def _decode(self, buf: memoryview, pos: int) -> tuple[Any, int]:
+        try:
+            return self._decode_value(buf, pos)
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid value at offset {pos}: {e}") from None
+
+
+class _UnionCodec:
+    """The compiled encoders and decoders for the variants of a union."""
+
+    __slots__ = ("encoders", "decoders", "encode", "decode")
+
+    def __init__(
+        self,
+        variants: tuple[type, ...],
+        codecs: dict[tuple[type, ...], "_UnionCodec"],
+    ) -> None:
+        tag_code = "B" if len(variants) <= 256 else "H"
+        namespace: dict[str, Any] = {}
+        source = [
+            _variant_source(tag, variant, tag_code, namespace, codecs)
+            for tag, variant in enumerate(variants)
+        ]
+        exec("\n".join(source), namespace)
+        encoders: dict[type, _Encoder] = {
+            variant: namespace[f"_enc{tag}"] for tag, variant in enumerate(variants)
+        }
+        decoders: list[_Decoder] = [
+            namespace[f"_dec{tag}"] for tag in range(len(variants))
+        ]
+        names = ", ".join(variant.__name__ for variant in variants)
+
+        def encode(value: Any, out: bytearray, pos: int) -> int:
+            try:
+                encoder = encoders[type(value)]
+            except KeyError:
+                raise TypeError(f"{value!r} is not one of {names}") from None
+            return encoder(value, out, pos)
+
+        if tag_code == "B":
+
+            def decode(buf: memoryview, pos: int) -> tuple[Any, int]:
+                return decoders[buf[pos]](buf, pos + 1)
+
+        else:
+            unpack_tag = struct.Struct("<H").unpack_from
+
+            def decode(buf: memoryview, pos: int) -> tuple[Any, int]:
+                return decoders[unpack_tag(buf, pos)[0]](buf, pos + 2)
+
+        self.encoders = encoders
+        self.decoders = decoders
+        self.encode = encode
+        self.decode = decode
+
+
+def _byte_view(data: Any) -> memoryview:
+    view = memoryview(data)
+    # e.g. `bytes` and `bytearray` need no cast
+    return view if view.format == "B" and view.ndim == 1 else view.cast("B")
+
+
+def _codec_for(
+    variants: tuple[type, ...], codecs: dict[tuple[type, ...], _UnionCodec]
+) -> _UnionCodec:
+    codec = codecs.get(variants)
+    if codec is None:
+        codec = codecs[variants] = _UnionCodec(variants, codecs)
+    return codec
+
+
+def _variant_source(
+    tag: int,
+    variant: type,
+    tag_code: str,
+    namespace: dict[str, Any],
+    codecs: dict[tuple[type, ...], _UnionCodec],
+) -> str:
+    """Return the source code of the encoder and the decoder of one variant."""
+    types = field_types(variant)
+    names = [f"f{i}" for i in range(len(types))]
+    header = ""  # struct codes after the tag
+    packed: list[str] = []  # expressions packed into the header
+    unpacked: list[str] = []  # names unpacked from the header
+    prepare: list[str] = []  # statements run before packing
+    payload_size: list[str] = []
+    encode_payload: list[str] = []
+    decode_payload: list[str] = []
+    for i, tp in enumerate(types):
+        f = names[i]
+        optional, inner = split_optional(tp)
+        nested = variants_of(inner)
+        if nested is not None and not optional:
+            codec = _codec_for(nested, codecs)
+            namespace[f"_enc{tag}_{i}"] = codec.encode
+            namespace[f"_dec{tag}_{i}"] = codec.decode
+            encode_payload.append(f"pos = _enc{tag}_{i}({f}, out, pos)")
+            decode_payload.append(f"{f}, pos = _dec{tag}_{i}(buf, pos)")
+        elif inner in _FIXED_CODES:
+            code = _FIXED_CODES[inner]
+            if optional:
+                header += "?" + code
+                packed += [f"{f} is not None", f"{f} or 0"]
+                unpacked += [f"p{i}", f]
+                decode_payload.append(f"if not p{i}: {f} = None")
+            else:
+                header += code
+                packed.append(f)
+                unpacked.append(f)
+        elif inner is str or inner is bytes:
+            encoded = f"{f}.encode()" if inner is str else f
+            decoded = (
+                f'str(buf[pos:end], "utf-8")'
+                if inner is str
+                else "buf[pos:end].tobytes()"
+            )
+            if optional:
+                header += "i"
+                prepare.append(f'b{i} = b"" if {f} is None else {encoded}')
+                packed.append(f"-1 if {f} is None else len(b{i})")
+                decode_payload += [
+                    f"if n{i} < 0:",
+                    f"    {f} = None",
+                    "else:",
+                    f"    end = pos + n{i}",
+                    f"    {f} = {decoded}",
+                    "    pos = end",
+                ]
+            else:
+                header += "I"
+                prepare.append(f"b{i} = {encoded}")
+                packed.append(f"len(b{i})")
+                decode_payload += [f"end = pos + n{i}", f"{f} = {decoded}", "pos = end"]
+            unpacked.append(f"n{i}")
+            payload_size.append(f"len(b{i})")
+            encode_payload += [
+                f"end = pos + len(b{i})",
+                f"out[pos:end] = b{i}",
+                "pos = end",
+            ]
+        else:
+            raise TypeError(
+                f"Cannot encode field {i} of {variant.__qualname__} of type {tp!r}"
+            )
+
+    encode_struct = struct.Struct("<" + tag_code + header)
+    decode_struct = struct.Struct("<" + header)
+    namespace[f"_pack{tag}"] = encode_struct.pack_into
+    namespace[f"_unpack{tag}"] = decode_struct.unpack_from
+    namespace[f"_variant{tag}"] = variant
+    size = " + ".join([str(encode_struct.size), *payload_size])
+    unpack_fields = f"{', '.join(names)}, = value" if names else "pass"
+    lines = [
+        f"def _enc{tag}(value, out, pos):",
+        f"    {unpack_fields}",
+        *(f"    {line}" for line in prepare),
+        f"    end = pos + {size}",
+        "    if end > len(out):",
+        "        out += bytes(end + len(out))",
+        f"    _pack{tag}(out, pos, {', '.join([str(tag), *packed])})",
+        f"    pos += {encode_struct.size}",
+        *(f"    {line}" for line in encode_payload),
+        "    return pos",
+        "",
+        f"def _dec{tag}(buf, pos):",
+    ]
+    new = plain_new(variant) if names else None
+    if new is not None:
+        namespace["_tuple_new"] = tuple.__new__
+        namespace[f"_new{tag}"] = new
+    if names and unpacked == names:
+        # only fixed-size fields: the unpacked tuple has the fields already
+        fields = f"_unpack{tag}(buf, pos)"
+        if new is not None:
+            # skip the Python-level `__new__` unless it was replaced, e.g. by counting
+            lines += [
+                f"    if _variant{tag}.__new__ is _new{tag}:",
+                f"        return _tuple_new(_variant{tag}, {fields}), pos + "
+                f"{decode_struct.size}",
+            ]
+        lines.append(f"    return _variant{tag}(*{fields}), pos + {decode_struct.size}")
+        return "\n".join(lines) + "\n"
+    if unpacked:
+        lines += [
+            f"    {', '.join(unpacked)}, = _unpack{tag}(buf, pos)",
+            f"    pos += {decode_struct.size}",
+        ]
+    lines += [f"    {line}" for line in decode_payload]
+    if names:
+        fields = ", ".join(names)
+        if new is not None:
+            lines += [
+                f"    if _variant{tag}.__new__ is _new{tag}:",
+                f"        return _tuple_new(_variant{tag}, ({fields},)), pos",
+            ]
+        lines.append(f"    return _variant{tag}({fields}), pos")
+    else:
+        # nullary variants are singletons
+        namespace[f"_value{tag}"] = variant()
+        lines.append(f"    return _value{tag}, pos")
+    return "\n".join(lines) + "\n"
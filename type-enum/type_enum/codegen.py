@@ -0,0 +1,330 @@
+"""Write the TypeEnums of a module out as static Python source code.
+
+Usage::
+
+    python -m type_enum.codegen mymod [othermod ...] [--output-dir DIR]
+
+For every given module, this writes ``DIR/<name>_static.py``, which defines the same
+TypeEnums, but with the variant classes spelled out as ordinary class statements. So,
+importing the generated module does not need to resolve annotations or create classes
+with `typing.NamedTuple`, which makes it a lot faster to import than the original.
+
+Types that are used in the fields are imported from the module where they are defined,
+and TypeEnums that refer to other TypeEnums from the same module refer to the generated
+versions. Other types in the fields must not be defined in the original module, though:
+importing it would create all of its TypeEnums again, so `generate` raises a
+`ValueError` for them, and they have to be moved to a separate module.
+"""
+
+import argparse
+import enum
+import importlib
+from pathlib import Path
+import sys
+from types import GenericAlias, ModuleType, NoneType, UnionType
+from typing import Any, Literal, Sequence, TypeVar, Union, get_args, get_origin
+
+from . import _interning
+from ._core import Entry, TypeEnum, TypeEnumMeta, _cached_variant_hash
+from ._interning import interning_info
+from ._utils import is_variant
+
+__all__ = ["generate", "main"]
+
+_HEADER = '''\
+"""Static version of the TypeEnums in `{module}`.
+
+Generated by `python -m type_enum.codegen {module}`. Do not edit.
+"""
+'''
+
+
+def generate(module: ModuleType | str) -> str:
+    """Return the source code of the static version of the TypeEnums in `module`."""
+    if isinstance(module, str):
+        module = importlib.import_module(module)
+    enums = [
+        value
+        for name, value in vars(module).items()
+        if isinstance(value, TypeEnumMeta)
+        and value is not TypeEnum
+        and value.__module__ == module.__name__
+        and value.__qualname__ == name
+    ]
+    writer = _SourceWriter(module.__name__, enums)
+    body = [writer.write_enum(enum_class) for enum_class in enums]
+    return "\n\n".join([writer.write_header(), *body])
+
+
+class _SourceWriter:
+    def __init__(self, module_name: str, enums: list[TypeEnumMeta]) -> None:
+        self.module_name = module_name
+        self.local_enums = {id(enum_class) for enum_class in enums}
+        self.imports: set[str] = {"typing"}
+        self.typevars: dict[str, TypeVar] = {}
+        self.cache_hash = False
+
+    def write_header(self) -> str:
+        lines = [_HEADER.format(module=self.module_name)]
+        lines.extend(f"import {name}" for name in sorted(self.imports))
+        lines.append("")
+        lines.append("from type_enum import TypeEnum")
+        core_names = ["_from_variants", "_StaticVariant", "_tuplegetter"]
+        if self.cache_hash:
+            core_names.append("_cached_variant_hash")
+        if self.typevars:
+            core_names.append("_cache_specializations")
+        core_names.sort(key=str.lower)
+        lines.append(f"from type_enum._core import {', '.join(core_names)}")
+        lines.append("")
+        lines.append("_tuple_new = tuple.__new__")
+        # type variables can be bound to types which need an import
+        typevar_lines = [self.write_typevar(tv) for tv in self.typevars.values()]
+        if typevar_lines:
+            lines.append("")
+            lines.extend(typevar_lines)
+        lines.append("")
+        return "\n".join(lines)
+
+    def write_typevar(self, tv: TypeVar) -> str:
+        args = [repr(tv.__name__)]
+        args.extend(self.render(constraint) for constraint in tv.__constraints__)
+        if tv.__bound__ is not None:
+            args.append(f"bound={self.render(tv.__bound__)}")
+        if tv.__covariant__:
+            args.append("covariant=True")
+        if tv.__contravariant__:
+            args.append("contravariant=True")
+        return f"{tv.__name__} = typing.TypeVar({', '.join(args)})"
+
+    def write_enum(self, enum_class: TypeEnumMeta) -> str:
+        name = enum_class.__name__
+        bases = getattr(enum_class, "__orig_bases__", enum_class.__bases__)
+        # The variant classes get local names that cannot clash with the names that
+        # are used in the annotations; their real names are set afterwards.
+        local_names = [f"_v{tag}" for tag in range(len(enum_class._member_map))]
+        lines = [
+            f"def _make_{name}() -> typing.Any:",
+            "    class _Variants(_StaticVariant):",
+            f"        __qualname__ = {name + '._Variants'!r}",
+        ]
+        if next(iter(enum_class)).__hash__ is _cached_variant_hash:
+            self.cache_hash = True
+            lines.append("        __hash__ = _cached_variant_hash")
+        else:
+            lines.insert(2, "        __slots__ = ()")
+        for local_name, (attr_name, entry) in zip(
+            local_names, enum_class._member_map.items()
+        ):
+            lines.append("")
+            lines.extend(self.write_variant(name, local_name, attr_name, entry))
+        lines.append("")
+        lines.extend(
+            f"    {local_name}.__name__ = {attr_name!r}"
+            for local_name, attr_name in zip(local_names, enum_class._member_map)
+        )
+        union_members = [
+            f"{local_name}[{', '.join(self.render(tv) for tv in entry.typevars)}]"
+            if entry.typevars
+            else local_name
+            for local_name, entry in zip(local_names, enum_class._member_map.values())
+        ]
+        lines.extend(
+            [
+                "    return _from_variants(",
+                f"        {name!r},",
+                "        __name__,",
+                f"        {_tuple_expr([self.render_base(base) for base in bases])},",
+                "        _Variants,",
+                f"        {_tuple_expr(local_names)},",
+                f"        typing.Union[{', '.join(union_members)}],",
+                *self.write_options(enum_class),
+                "    )",
+                "",
+                "",
+                f"{name} = _make_{name}()",
+                "",
+            ]
+        )
+        return "\n".join(lines)
+
+    def write_options(self, enum_class: TypeEnumMeta) -> list[str]:
+        """Return the keyword arguments of `_from_variants` that set up construction."""
+        lines = []
+        sizes = {
+            attr_name: interning_info(entry.typ).maxsize
+            for attr_name, entry in enum_class._member_map.items()
+            if entry.typ in _interning._caches
+        }
+        if sizes:
+            lines.append(f"        intern={sizes!r},")
+        if enum_class._hash_cons is not None:
+            lines.append("        hash_cons=True,")
+        return lines
+
+    def write_variant(
+        self, enum_name: str, local_name: str, attr_name: str, entry: Entry
+    ) -> list[str]:
+        typ = entry.typ
+        fields: tuple[str, ...] = typ._fields
+        bases = "_Variants"
+        if entry.typevars:
+            typevars = ", ".join(self.render(tv) for tv in entry.typevars)
+            bases += f", typing.Generic[{typevars}]"
+        annotations = ", ".join(
+            f"{field!r}: {self.render(field_type)}"
+            for field, field_type in zip(fields, entry.types)
+        )
+        args = "".join(f", {field}" for field in fields)
+        if fields:
+            repr_fmt = f"{enum_name}.{attr_name}({', '.join('%r' for _ in fields)})"
+            repr_expr = f"{repr_fmt!r} % self"
+        else:
+            repr_expr = repr(f"{enum_name}.{attr_name}()")
+        lines = [
+            f"    class {local_name}({bases}):",
+            f"        {typ.__doc__!r}",
+            "",
+            "        __slots__ = ()",
+            f"        __qualname__ = {typ.__qualname__!r}",
+            f"        __annotations__ = {{{annotations}}}",
+            f"        _tag_ = {typ._tag_!r}",
+            f"        _fields = {fields!r}",
+            f"        __match_args__ = {fields!r}",
+        ]
+        lines.extend(
+            f"        {field} = _tuplegetter({i}, 'Alias for field number {i}')"
+            for i, field in enumerate(fields)
+        )
+        lines.extend(
+            [
+                "",
+                f"        def __new__(_cls{args}):",
+                f"            return _tuple_new(_cls, {_tuple_expr(fields)})",
+                "",
+                "        def __repr__(self):",
+                f"            return {repr_expr}",
+            ]
+        )
+        if entry.typevars:
+            # otherwise, `tuple.__class_getitem__` would be used
+            lines.extend(["", f"    _cache_specializations({local_name})"])
+        return lines
+
+    def render_base(self, base: Any) -> str:
+        if base is TypeEnum:
+            return "TypeEnum"
+        return self.render(base)
+
+    def render(self, tp: Any) -> str:
+        """Return a source code expression that evaluates to the given type."""
+        if tp is None or tp is NoneType:
+            return "None"
+        if tp is Any:
+            return "typing.Any"
+        if tp is ...:
+            return "..."
+        if isinstance(tp, TypeVar):
+            existing = self.typevars.setdefault(tp.__name__, tp)
+            if existing is not tp:
+                raise ValueError(f"Found two different type variables named {tp!r}")
+            return tp.__name__
+        if isinstance(tp, list):
+            # argument list of a Callable
+            return "[" + ", ".join(self.render(arg) for arg in tp) + "]"
+        if isinstance(tp, UnionType):
+            return " | ".join(self.render(arg) for arg in get_args(tp))
+        origin = get_origin(tp)
+        # (`get_origin(Generic)` is `Generic` itself)
+        if origin is not None and origin is not tp:
+            args = get_args(tp)
+            if origin is Literal:
+                return f"typing.Literal[{', '.join(map(self.render_value, args))}]"
+            if origin is Union:
+                rendered_origin = "typing.Union"
+            elif isinstance(tp, GenericAlias) or getattr(tp, "_name", None) is None:
+                rendered_origin = self.render(origin)
+            else:
+                rendered_origin = f"typing.{tp._name}"
+            if not args:
+                # only happens for the empty tuple
+                return f"{rendered_origin}[()]"
+            return f"{rendered_origin}[{', '.join(self.render(arg) for arg in args)}]"
+        if is_variant(tp):
+            return self.render_variant(tp)
+        return self.render_reference(tp)
+
+    def render_variant(self, variant: type) -> str:
+        module = sys.modules[variant.__module__]
+        for name, value in vars(module).items():
+            if isinstance(value, TypeEnumMeta) and variant in value._variants:
+                if id(value) in self.local_enums:
+                    return f"{name}.{variant.__name__}"
+                self.check_not_local(module.__name__, f"{name}.{variant.__name__}")
+                self.imports.add(module.__name__)
+                return f"{module.__name__}.{name}.{variant.__name__}"
+        raise ValueError(f"Cannot find the TypeEnum of {variant!r}")
+
+    def render_reference(self, obj: Any) -> str:
+        module = getattr(obj, "__module__", None)
+        qualname = getattr(obj, "__qualname__", None)
+        if not isinstance(module, str) or not isinstance(qualname, str):
+            raise ValueError(f"Cannot generate source code for {obj!r}")
+        if "<locals>" in qualname:
+            raise ValueError(f"Cannot refer to the local class {qualname!r}")
+        if module == "builtins":
+            return qualname
+        if module == self.module_name and id(obj) in self.local_enums:
+            return qualname
+        self.check_not_local(module, qualname)
+        self.imports.add(module)
+        return f"{module}.{qualname}"
+
+    def check_not_local(self, module: str, qualname: str) -> None:
+        """Refuse to import the original module from the generated one."""
+        if module == self.module_name:
+            raise ValueError(
+                f"{module}.{qualname} is defined in the module itself, which the "
+                "generated module would have to import; move it to another module"
+            )
+
+    def render_value(self, value: Any) -> str:
+        if isinstance(value, enum.Enum):
+            return f"{self.render_reference(type(value))}.{value.name}"
+        return repr(value)
+
+
+def _tuple_expr(items: Sequence[str]) -> str:
+    if len(items) == 1:
+        return f"({items[0]},)"
+    return f"({', '.join(items)})"
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m type_enum.codegen",
+        description="Write the TypeEnums of modules out as static Python source code.",
+    )
+    parser.add_argument("modules", nargs="+", help="modules with TypeEnum definitions")
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        default=Path("."),
+        help="directory to write the generated modules to (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--suffix",
+        default="_static",
+        help="suffix for the names of the generated modules (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    for module_name in args.modules:
+        source = generate(module_name)
+        path = args.output_dir / f"{module_name.rpartition('.')[2]}{args.suffix}.py"
+        path.write_text(source)
+        print(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
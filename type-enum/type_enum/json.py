@@ -0,0 +1,334 @@
+"""Encoding TypeEnum values as JSON, and decoding JSON into validated values.
+
+Every value is written as a JSON array of the name of its variant and its fields, e.g.
+`["click", 1, 2]` for `Event.click(1, 2)`. The fields can be:
+
+- `bool`, `int`, `float` and `str` (an `int` is accepted for a `float`);
+- `list[X]` and `dict[str, X]`, which become arrays and objects;
+- variants and unions of variants (like `Color.T`), which are nested arrays;
+- `X | None` of any of these, and `Any`, which is not checked.
+
+A `JsonCodec` compiles a decoder function for each variant from its annotations when it
+is created. The decoders check the fields in the lists that `json.loads` returns and
+pass them straight to the variant, so no dict is built for a value and no `match`
+statements have to be written by hand.
+"""
+
+import json
+from typing import IO, Any, Callable, Iterable, Iterator, get_args, get_origin
+
+from ._core import TypeEnumMeta
+from ._utils import field_types, plain_new, split_optional, variants_of
+
+__all__ = ["JsonCodec"]
+
+_SCALAR_TYPES = (bool, int, float, str)
+
+_Converter = Callable[[Any], Any]
+
+
+class JsonCodec:
+    """Encoder and decoder between the values of one TypeEnum and JSON."""
+
+    def __init__(self, enum: TypeEnumMeta) -> None:
+        self.enum = enum
+        root = _UnionCodec(tuple(enum), {})
+        self._encode_value = root.encode
+        self._decode_value = root.decode
+        self._dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+    def to_data(self, value: Any) -> list[Any]:
+        """Return the JSON-compatible data of `value`, like `["click", 1, 2]`."""
+        return self._encode_value(value)
+
+    def from_data(self, data: Any) -> Any:
+        """Return the value of data that was parsed from JSON, checking its types."""
+        return self._decode_value(data)
+
+    def encode(self, value: Any) -> str:
+        """Return `value` as a JSON string."""
+        return self._dumps(self._encode_value(value))
+
+    def decode(self, text: str | bytes) -> Any:
+        """Parse a JSON string into a value, checking its types.
+
+        Raises `ValueError` if `text` is not valid JSON or not a value of the TypeEnum.
+        """
+        return self._decode_value(json.loads(text))
+
+    def write_lines(self, values: Iterable[Any], file: IO[str]) -> int:
+        """Write `values` to `file` as JSON lines and return how many were written."""
+        encode_value = self._encode_value
+        dumps = self._dumps
+        write = file.write
+        count = 0
+        for value in values:
+            write(dumps(encode_value(value)) + "\n")
+            count += 1
+        return count
+
+    def iter_lines(self, file: Iterable[str | bytes]) -> Iterator[Any]:
+        """Decode newline-delimited JSON from `file`, reading one line at a time.
+
+        Blank lines are skipped. Invalid lines raise `ValueError` with the line number.
+        """
+        decode_value = self._decode_value
+        loads = json.loads
+        for lineno, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                value = decode_value(loads(line))
+            except ValueError as e:
+                raise ValueError(f"line {lineno}: {e}") from None
+            yield value
+
+
+class _UnionCodec:
+    """The compiled encoders and decoders for the variants of a union."""
+
+    __slots__ = ("encode", "decode")
+
+    def __init__(
+        self,
+        variants: tuple[type, ...],
+        codecs: dict[tuple[type, ...], "_UnionCodec"],
+    ) -> None:
+        namespace: dict[str, Any] = {"_tuple_new": tuple.__new__, "_invalid": _invalid}
+        source = [
+            _variant_source(tag, variant, namespace, codecs)
+            for tag, variant in enumerate(variants)
+        ]
+        exec("\n".join(source), namespace)
+        encoders: dict[type, _Converter] = {
+            variant: namespace[f"_enc{tag}"] for tag, variant in enumerate(variants)
+        }
+        decoders: dict[str, _Converter] = {
+            variant.__name__: namespace[f"_dec{tag}"]
+            for tag, variant in enumerate(variants)
+        }
+        names = ", ".join(variant.__name__ for variant in variants)
+
+        def encode(value: Any) -> Any:
+            try:
+                encoder = encoders[type(value)]
+            except KeyError:
+                raise TypeError(f"{value!r} is not one of {names}") from None
+            return encoder(value)
+
+        def decode(data: Any) -> Any:
+            if type(data) is not list or not data:
+                raise ValueError(f"expected an array with one of {names}, got {data!r}")
+            try:
+                decoder = decoders[data[0]]
+            except (KeyError, TypeError):
+                raise ValueError(f"expected one of {names}, got {data[0]!r}") from None
+            return decoder(data)
+
+        self.encode = encode
+        self.decode = decode
+
+
+def _codec_for(
+    variants: tuple[type, ...], codecs: dict[tuple[type, ...], _UnionCodec]
+) -> _UnionCodec:
+    codec = codecs.get(variants)
+    if codec is None:
+        codec = codecs[variants] = _UnionCodec(variants, codecs)
+    return codec
+
+
+def _variant_source(
+    tag: int,
+    variant: type,
+    namespace: dict[str, Any],
+    codecs: dict[tuple[type, ...], _UnionCodec],
+) -> str:
+    """Return the source code of the encoder and the decoder of one variant."""
+    types = field_types(variant)
+    names = [f"f{i}" for i in range(len(types))]
+    fields = "".join(f"{name}, " for name in names)
+    name = variant.__name__
+    namespace[f"_variant{tag}"] = variant
+    checks: list[str] = []
+    encoded: list[str] = []
+    for i, tp in enumerate(types):
+        f = names[i]
+        where = f"field {i} of {variant.__qualname__}"
+        optional, inner = split_optional(tp)
+        if inner in _SCALAR_TYPES:
+            # checked inline, as most fields are scalars
+            test = f"type({f}) is not {inner.__name__}"
+            if optional:
+                test = f"{f} is not None and {test}"
+            error = f"raise _invalid({where!r}, {inner.__name__!r}, {f})"
+            if inner is float:
+                checks += [
+                    f"if {test}:",
+                    f"    if type({f}) is not int:",
+                    f"        {error}",
+                    f"    {f} = float({f})",
+                ]
+            else:
+                checks += [f"if {test}:", f"    {error}"]
+            encoded.append(f)
+            continue
+        decoder = _decoder(tp, codecs)
+        if decoder is not None:
+            namespace[f"_dec{tag}_{i}"] = decoder
+            checks += [
+                "try:",
+                f"    {f} = _dec{tag}_{i}({f})",
+                "except ValueError as e:",
+                f"    raise ValueError({where + ': '!r} + str(e)) from None",
+            ]
+        encoder = _encoder(tp, codecs)
+        if encoder is None:
+            encoded.append(f)
+        else:
+            namespace[f"_enc{tag}_{i}"] = encoder
+            encoded.append(f"_enc{tag}_{i}({f})")
+
+    if encoded == names:
+        encode_body = [f"return [{name!r}, *value]"]
+    else:
+        encode_body = [f"{fields}= value", f"return [{name!r}, {', '.join(encoded)}]"]
+    lines = [f"def _enc{tag}(value):", *(f"    {line}" for line in encode_body)]
+
+    lines += ["", f"def _dec{tag}(data):"]
+    if not names:
+        # nullary variants are singletons
+        namespace[f"_value{tag}"] = variant()
+        lines += [
+            "    if len(data) != 1:",
+            f"        raise ValueError({f'{name} takes no fields, got '!r} + repr(data))",
+            f"    return _value{tag}",
+        ]
+        return "\n".join(lines) + "\n"
+    lines += [
+        f"    if len(data) != {len(names) + 1}:",
+        f"        raise ValueError({f'{name} takes {len(names)} fields, got '!r}"
+        " + repr(data))",
+        f"    _, {fields}= data",
+        *(f"    {line}" for line in checks),
+    ]
+    new = plain_new(variant)
+    if new is not None:
+        # skip the Python-level `__new__` unless it was replaced, e.g. by counting
+        namespace[f"_new{tag}"] = new
+        lines += [
+            f"    if _variant{tag}.__new__ is _new{tag}:",
+            f"        return _tuple_new(_variant{tag}, ({fields}))",
+        ]
+    lines.append(f"    return _variant{tag}({fields})")
+    return "\n".join(lines) + "\n"
+
+
+def _invalid(where: str, expected: str, value: Any) -> ValueError:
+    return ValueError(f"{where}: expected {expected}, got {value!r}")
+
+
+def _decoder(tp: Any, codecs: dict[tuple[type, ...], _UnionCodec]) -> Any:
+    """Return a function that checks and converts parsed JSON of type `tp`.
+
+    Returns None if any JSON is accepted as it is.
+    """
+    if tp is Any:
+        return None
+    optional, inner = split_optional(tp)
+    decode = _inner_decoder(inner, codecs)
+    if not optional:
+        return decode
+
+    def decode_optional(data: Any) -> Any:
+        return None if data is None else decode(data)
+
+    return decode_optional
+
+
+def _inner_decoder(tp: Any, codecs: dict[tuple[type, ...], _UnionCodec]) -> Any:
+    if tp is float:
+
+        def decode_float(data: Any) -> Any:
+            if type(data) is not float:
+                if type(data) is not int:
+                    raise _invalid("value", "float", data)
+                return float(data)
+            return data
+
+        return decode_float
+    if tp in _SCALAR_TYPES:
+
+        def decode_scalar(data: Any) -> Any:
+            if type(data) is not tp:
+                raise _invalid("value", tp.__name__, data)
+            return data
+
+        return decode_scalar
+    variants = variants_of(tp)
+    if variants is not None:
+        return _codec_for(variants, codecs).decode
+    origin = get_origin(tp)
+    args = get_args(tp)
+    if origin is list and len(args) == 1:
+        decode_item = _decoder(args[0], codecs)
+
+        def decode_list(data: Any) -> Any:
+            if type(data) is not list:
+                raise _invalid("value", "list", data)
+            if decode_item is None:
+                return data
+            return [decode_item(item) for item in data]
+
+        return decode_list
+    if origin is dict and len(args) == 2 and args[0] is str:
+        decode_item = _decoder(args[1], codecs)
+
+        def decode_dict(data: Any) -> Any:
+            if type(data) is not dict:
+                raise _invalid("value", "dict", data)
+            if decode_item is None:
+                return data
+            return {key: decode_item(item) for key, item in data.items()}
+
+        return decode_dict
+    raise TypeError(f"Cannot decode {tp!r} from JSON")
+
+
+def _encoder(tp: Any, codecs: dict[tuple[type, ...], _UnionCodec]) -> Any:
+    """Return a function that converts values of type `tp` to JSON-compatible data.
+
+    Returns None if the values need no conversion.
+    """
+    optional, inner = split_optional(tp)
+    variants = variants_of(inner)
+    if variants is not None:
+        encode = _codec_for(variants, codecs).encode
+    else:
+        origin = get_origin(inner)
+        args = get_args(inner)
+        if origin is list and args:
+            encode_item = _encoder(args[0], codecs)
+            if encode_item is None:
+                return None
+
+            def encode(value: Any) -> Any:
+                return [encode_item(item) for item in value]
+
+        elif origin is dict and len(args) == 2:
+            encode_item = _encoder(args[1], codecs)
+            if encode_item is None:
+                return None
+
+            def encode(value: Any) -> Any:
+                return {key: encode_item(item) for key, item in value.items()}
+
+        else:
+            return None
+    if not optional:
+        return encode
+
+    def encode_optional(value: Any) -> Any:
+        return None if value is None else encode(value)
+
+    return encode_optional
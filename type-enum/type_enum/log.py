@@ -0,0 +1,315 @@
+"""An append-only log of TypeEnum values on disk, read through `mmap`.
+
+A log is a directory with these files:
+
+- `records`: a header with the names of the variants, followed by the records, which
+  are the length and the CRC-32 of a value (as two 32-bit numbers) and its encoding
+  with a `BinaryCodec`;
+- `offsets`: the offset of every record in `records` (as a 64-bit number), so a record
+  is found by its sequence number without reading the records before it;
+- `variants/<name>`: the sequence numbers of the records of one variant, so the records
+  of a variant are read without decoding the others.
+
+Every append writes the records first, then the indexes of the variants, and the
+offsets last. When a log is opened, records at the end of `records` that were cut off
+or damaged (e.g. by a crash during a write) are removed, and the indexes are made to
+match the records that remain, so the records are the only source of truth. All
+numbers are little-endian.
+"""
+
+from array import array
+from bisect import bisect_left
+import heapq
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import IO, Any, Iterable, Iterator, overload
+from zlib import crc32
+
+from ._core import TypeEnumMeta
+from .binary import BinaryCodec
+
+__all__ = ["EventLog"]
+
+_MAGIC = b"type-enum log 1\n"
+
+# the length and the CRC-32 of the encoded value
+_FRAME = struct.Struct("<II")
+
+
+class EventLog:
+    """An append-only log of the values of one TypeEnum in the directory `path`.
+
+    The directory is created if it does not exist. Only one `EventLog` may write to a
+    directory at a time. With `sync=True`, each append waits until the records and the
+    indexes are written to the disk with `os.fsync`.
+    """
+
+    def __init__(
+        self, enum: TypeEnumMeta, path: str | os.PathLike[str], *, sync: bool = False
+    ) -> None:
+        self.enum = enum
+        self.path = os.fspath(path)
+        self._codec = BinaryCodec(enum)
+        variants = tuple(enum)
+        self._tags = {variant: tag for tag, variant in enumerate(variants)}
+        self._variant_count = len(variants)
+        self._wide_tags = len(variants) > 256
+        self._sync = sync
+        os.makedirs(os.path.join(self.path, "variants"), exist_ok=True)
+        self._records = _open(os.path.join(self.path, "records"))
+        self._offset_file = _open(os.path.join(self.path, "offsets"))
+        self._variant_files = [
+            _open(os.path.join(self.path, "variants", variant.__name__))
+            for variant in variants
+        ]
+        names = [variant.__name__ for variant in variants]
+        header = _MAGIC + json.dumps(names).encode() + b"\n"
+        self._start = len(header)
+        self._records.seek(0)
+        existing = self._records.read(len(header))
+        if existing != header:
+            if not header.startswith(existing):
+                self.close()
+                raise ValueError(f"{self.path!r} is not a log of {enum.__name__}")
+            # a new log, or one whose header was cut off
+            self._records.truncate(0)
+            self._records.write(header)
+            self._records.flush()
+        self._map: mmap.mmap | None = None
+        self._view = memoryview(b"")
+        self._mapped = 0
+        self._recover()
+
+    def _recover(self) -> None:
+        """Remove incomplete records at the end, and make the indexes match the rest."""
+        self._size = self._records.seek(0, os.SEEK_END)
+        view = self._data()
+        offsets = _read_index(self._offset_file)
+        indexes = [_read_index(file) for file in self._variant_files]
+        # indexes may refer to records that were not written completely
+        while offsets and self._check(view, offsets[-1]) is None:
+            offsets.pop()
+        count = len(offsets)
+        for index in indexes:
+            while index and index[-1] >= count:
+                index.pop()
+        kept = [len(index) for index in indexes]
+        pos = self._start
+        if offsets:
+            pos = _FRAME.size + offsets[-1] + _FRAME.unpack_from(view, offsets[-1])[0]
+        # and records may be missing from the indexes
+        while (checked := self._check(view, pos)) is not None:
+            end, tag = checked
+            indexes[tag].append(len(offsets))
+            offsets.append(pos)
+            pos = end
+        del view
+        if pos < self._size:
+            self._records.truncate(pos)
+            self._size = pos
+            self._data()
+        for file, index, n in zip(self._variant_files, indexes, kept):
+            _rewrite_index(file, index, n)
+        _rewrite_index(self._offset_file, offsets, count)
+        self._offsets = offsets
+        self._indexes = indexes
+
+    def _check(self, view: memoryview, pos: int) -> tuple[int, int] | None:
+        """Return the end and the tag of a complete record at `pos`, else None."""
+        if pos + _FRAME.size > len(view):
+            return None
+        length, crc = _FRAME.unpack_from(view, pos)
+        start = pos + _FRAME.size
+        end = start + length
+        if not length or end > len(view) or crc32(view[start:end]) != crc:
+            return None
+        tag = view[start]
+        if self._wide_tags:
+            tag |= view[start + 1] << 8
+        if tag >= self._variant_count:
+            return None
+        return end, tag
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __repr__(self) -> str:
+        return f"<EventLog of {len(self)} {self.enum.__name__} values in {self.path!r}>"
+
+    def append(self, value: Any) -> int:
+        """Append `value` and return its sequence number."""
+        return self.extend((value,)).start
+
+    def extend(self, values: Iterable[Any]) -> range:
+        """Append `values` and return the range of their sequence numbers.
+
+        If a value cannot be encoded, none of them are appended.
+        """
+        encode_into = self._codec.encode_into
+        pack_frame = _FRAME.pack
+        wide_tags = self._wide_tags
+        out = bytearray()
+        encoded = bytearray()
+        starts = array("Q")
+        tags: list[int] = []
+        for value in values:
+            del encoded[:]
+            encode_into((value,), encoded)
+            starts.append(len(out))
+            out += pack_frame(len(encoded), crc32(encoded))
+            out += encoded
+            tag = encoded[0]
+            if wide_tags:
+                tag |= encoded[1] << 8
+            tags.append(tag)
+        first = len(self._offsets)
+        if not starts:
+            return range(first, first)
+        base = self._size
+        new_indexes: dict[int, array[int]] = {}
+        for seq, tag in enumerate(tags, first):
+            index = new_indexes.get(tag)
+            if index is None:
+                index = new_indexes[tag] = array("Q")
+            index.append(seq)
+        new_offsets = array("Q", [base + start for start in starts])
+
+        # the records first and the offsets last, see `_recover`
+        self._write(self._records, out)
+        for tag, index in new_indexes.items():
+            self._write(self._variant_files[tag], _index_bytes(index))
+        self._write(self._offset_file, _index_bytes(new_offsets))
+        self._size = base + len(out)
+        for tag, index in new_indexes.items():
+            self._indexes[tag].extend(index)
+        self._offsets.extend(new_offsets)
+        return range(first, first + len(starts))
+
+    def _write(self, file: IO[bytes], data: bytes | bytearray) -> None:
+        file.write(data)
+        file.flush()
+        if self._sync:
+            os.fsync(file.fileno())
+
+    @overload
+    def __getitem__(self, seq: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, seq: slice) -> list[Any]: ...
+
+    def __getitem__(self, seq: int | slice) -> Any:
+        """Return the value with the sequence number `seq`, or a list for a slice."""
+        view = self._data()
+        decode = self._codec._decode
+        if isinstance(seq, slice):
+            return [
+                decode(view, offset + _FRAME.size)[0] for offset in self._offsets[seq]
+            ]
+        try:
+            offset = self._offsets[seq]
+        except IndexError:
+            raise IndexError("log index out of range") from None
+        return decode(view, offset + _FRAME.size)[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.scan()
+
+    def scan(self, *variants: type, start: int = 0) -> Iterator[Any]:
+        """Iterate over the values of `variants` (or of all variants) in order.
+
+        Only the records of `variants` are read, using their indexes. The iteration
+        begins at the sequence number `start`, and values that are appended after the
+        call are not included.
+        """
+        stop = len(self._offsets)
+        offsets = self._offsets
+        if not variants:
+            positions: Iterable[int] = offsets[start:stop]
+        else:
+            seqs = []
+            for variant in dict.fromkeys(variants):
+                tag = self._tags.get(variant)
+                if tag is None:
+                    raise TypeError(
+                        f"{variant!r} is not a variant of {self.enum.__name__}"
+                    )
+                index = self._indexes[tag]
+                seqs.append(index[bisect_left(index, start) : bisect_left(index, stop)])
+            merged = seqs[0] if len(seqs) == 1 else heapq.merge(*seqs)
+            positions = [offsets[seq] for seq in merged]
+        return _decode_all(self._codec._decode, self._data(), positions)
+
+    def sync(self) -> None:
+        """Wait until everything that was appended is written to the disk."""
+        for file in (self._records, *self._variant_files, self._offset_file):
+            os.fsync(file.fileno())
+
+    def close(self) -> None:
+        """Close the files of the log."""
+        for file in (self._records, *self._variant_files, self._offset_file):
+            file.close()
+        # running scans keep the old map open until they end
+        self._map = None
+        self._view = memoryview(b"")
+        self._mapped = -1
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _data(self) -> memoryview:
+        """Return a view of all records, mapping the file again if it has grown."""
+        if self._mapped != self._size:
+            # any views of the old map (e.g. in running scans) keep it open
+            self._map = mmap.mmap(
+                self._records.fileno(), self._size, access=mmap.ACCESS_READ
+            )
+            self._view = memoryview(self._map)
+            self._mapped = self._size
+        return self._view
+
+
+def _decode_all(
+    decode: Any, view: memoryview, positions: Iterable[int]
+) -> Iterator[Any]:
+    payload = _FRAME.size
+    for pos in positions:
+        yield decode(view, pos + payload)[0]
+
+
+def _open(path: str) -> IO[bytes]:
+    # all writes go to the end of the file
+    return open(path, "a+b")
+
+
+def _read_index(file: IO[bytes]) -> "array[int]":
+    file.seek(0)
+    data = file.read()
+    index = array("Q")
+    # ignore a number that was cut off
+    index.frombytes(data[: len(data) // index.itemsize * index.itemsize])
+    if sys.byteorder == "big":
+        index.byteswap()
+    return index
+
+
+def _index_bytes(index: "array[int]") -> bytes:
+    if sys.byteorder == "big":
+        index = array("Q", index)
+        index.byteswap()
+    return index.tobytes()
+
+
+def _rewrite_index(file: IO[bytes], index: "array[int]", kept: int) -> None:
+    """Replace the numbers in `file` after the first `kept` with those in `index`."""
+    size = kept * index.itemsize
+    if file.seek(0, os.SEEK_END) != size:
+        file.truncate(size)
+    if len(index) > kept:
+        file.write(_index_bytes(index[kept:]))
+    file.flush()
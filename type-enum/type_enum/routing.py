@@ -0,0 +1,174 @@
+"""Routing TypeEnum values to asyncio handlers, with a queue and workers per variant.
+
+An `AsyncDispatcher` is the asynchronous counterpart of `TypeEnum._dispatch_`: every
+variant has an async handler, which is checked when the dispatcher is created. The
+values are not handled one after the other by a single consumer loop, though; each
+variant has its own bounded queue and up to `concurrency` worker tasks, so a slow
+variant does not hold up the others, and a burst of one variant only fills its queue.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Mapping, get_origin
+
+from ._core import TypeEnumMeta, _by_variant
+
+__all__ = ["AsyncDispatcher"]
+
+_Handler = Callable[[Any], Awaitable[Any]]
+
+
+class _Route:
+    """The handler, queue and worker tasks of one variant."""
+
+    __slots__ = ("handler", "queue", "concurrency", "workers")
+
+    def __init__(self, handler: _Handler, queue_size: int, concurrency: int) -> None:
+        self.handler = handler
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(queue_size)
+        self.concurrency = concurrency
+        self.workers: list[asyncio.Task[None]] = []
+
+
+class AsyncDispatcher:
+    """Calls an async handler for every value of a TypeEnum, concurrently per variant.
+
+    Every variant must have exactly one handler in `handlers`. `concurrency` is the
+    number of values of a variant that are handled at the same time, and `queue_size`
+    the number of values of a variant that may wait (0 means no limit); both are either
+    a number for all variants or a mapping from variants to numbers (variants that are
+    not in the mapping get 1 and 0). The worker tasks of a variant are started when its
+    first value is put into the dispatcher.
+
+    Exceptions raised by handlers are passed to `on_error` with the value, or else to
+    the exception handler of the event loop (as are exceptions raised by `on_error`);
+    the worker then goes on with the next value. Leaving the dispatcher as an async
+    context manager waits until all values have been handled, and stops the workers.
+    """
+
+    def __init__(
+        self,
+        enum: TypeEnumMeta,
+        handlers: Mapping[Any, _Handler],
+        *,
+        concurrency: int | Mapping[Any, int] = 1,
+        queue_size: int | Mapping[Any, int] = 0,
+        on_error: Callable[[Any, Exception], Any] | None = None,
+    ) -> None:
+        self.enum = enum
+        table = _by_variant(enum, handlers, "handler", complete=True)
+        concurrency = _option(enum, concurrency, 1, "concurrency")
+        queue_size = _option(enum, queue_size, 0, "queue size")
+        for variant, n in concurrency.items():
+            if n < 1:
+                raise ValueError(f"The concurrency of {variant.__qualname__} is {n}")
+        self._routes = {
+            variant: _Route(table[variant], queue_size[variant], concurrency[variant])
+            for variant in enum
+        }
+        self._on_error = on_error
+        self._closed = False
+        # the number of values that were put in and have not been handled yet
+        self._unfinished = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    async def put(self, value: Any) -> None:
+        """Queue `value` for its handler, waiting while its variant's queue is full."""
+        await self._route(value).queue.put(value)
+        self._unfinished += 1
+        self._idle.clear()
+
+    def put_nowait(self, value: Any) -> None:
+        """Queue `value` for its handler, or raise `asyncio.QueueFull`."""
+        self._route(value).queue.put_nowait(value)
+        self._unfinished += 1
+        self._idle.clear()
+
+    def _route(self, value: Any) -> _Route:
+        if self._closed:
+            raise RuntimeError("The dispatcher is closed")
+        try:
+            route = self._routes[type(value)]
+        except KeyError:
+            raise TypeError(
+                f"{value!r} is not a variant of {self.enum.__name__}"
+            ) from None
+        if not route.workers:
+            route.workers = [
+                asyncio.create_task(self._work(route)) for _ in range(route.concurrency)
+            ]
+        return route
+
+    async def _work(self, route: _Route) -> None:
+        queue = route.queue
+        handler = route.handler
+        while True:
+            value = await queue.get()
+            try:
+                await handler(value)
+            except Exception as e:
+                self._report(value, e)
+            finally:
+                self._unfinished -= 1
+                if not self._unfinished:
+                    self._idle.set()
+
+    def _report(self, value: Any, error: Exception) -> None:
+        if self._on_error is not None:
+            try:
+                self._on_error(value, error)
+                return
+            except Exception as e:
+                # the worker must survive, or the values after this one would never
+                # be handled and `join` would wait forever
+                message = f"Error callback for {value!r} failed"
+                error = e
+        else:
+            message = f"Handler for {value!r} failed"
+        asyncio.get_running_loop().call_exception_handler(
+            {"message": message, "exception": error}
+        )
+
+    def pending(self, variant: Any) -> int:
+        """Return the number of values of `variant` that wait for a worker."""
+        return self._routes[get_origin(variant) or variant].queue.qsize()
+
+    async def join(self) -> None:
+        """Wait until all values that were put into the dispatcher have been handled."""
+        await self._idle.wait()
+
+    async def aclose(self) -> None:
+        """Wait until all values have been handled, then stop the workers."""
+        self._closed = True
+        try:
+            await self.join()
+        finally:
+            await self._stop()
+
+    async def _stop(self) -> None:
+        self._closed = True
+        workers = [task for route in self._routes.values() for task in route.workers]
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for route in self._routes.values():
+            route.workers = []
+
+    async def __aenter__(self) -> "AsyncDispatcher":
+        return self
+
+    async def __aexit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            await self.aclose()
+        else:
+            # queued values are dropped if the body failed
+            await self._stop()
+
+
+def _option(
+    enum: TypeEnumMeta, option: int | Mapping[Any, int], default: int, what: str
+) -> dict[type, int]:
+    if isinstance(option, int):
+        return dict.fromkeys(enum, option)
+    by_variant = _by_variant(enum, option, what)
+    return {variant: by_variant.get(variant, default) for variant in enum}
@@ -0,0 +1,268 @@
+"""Shared-memory batches of TypeEnum values for worker processes (requires NumPy).
+
+A `SharedBatch` copies the columns of a `TypeEnumArray` (the tags, the offsets, and one
+column per field of every variant) into a `multiprocessing.shared_memory` block. Only a
+small handle with the name and the layout of the block is pickled when the batch is
+sent to another process, and `attach` maps the block there as a `TypeEnumArray` whose
+columns are views of the shared memory, without copying them. Columns of fields that
+are not `bool`, `int`, `float` or `complex` hold Python objects, which cannot be shared;
+each of these columns is pickled into the block as a whole instead.
+
+`parallel_map` uses a `SharedBatch` to call a function on every value in a pool of
+worker processes.
+"""
+
+from contextlib import contextmanager
+import mmap
+import multiprocessing
+from multiprocessing import shared_memory
+import os
+import pickle
+import sys
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+
+from ._core import TypeEnumMeta
+from .array import TypeEnumArray
+
+__all__ = ["SharedBatch", "parallel_map"]
+
+# the start of every part of a block is aligned to this many bytes
+_ALIGNMENT = 16
+
+# (offset, dtype, length) of an array, or (offset, None, number of bytes) of a pickle
+_Part = tuple[int, str | None, int]
+
+
+class SharedBatch:
+    """A batch of values of one TypeEnum in a shared memory block.
+
+    The process that creates the batch owns the block and must `close` it (or use the
+    batch as a context manager), which also frees the block. Copies of the batch that
+    are unpickled in other processes refer to the same block.
+    """
+
+    def __init__(self, enum: TypeEnumMeta, values: Iterable[Any]) -> None:
+        if isinstance(values, TypeEnumArray):
+            if values.enum is not enum:
+                raise TypeError(f"{values!r} is not an array of {enum.__name__}")
+            array = values
+        else:
+            array = TypeEnumArray(enum, values)
+        self.enum = enum
+        self._size = len(array)
+        chunks: list[tuple[int, bytes | np.ndarray]] = []
+        end = 0
+
+        def add(data: bytes | np.ndarray) -> int:
+            nonlocal end
+            start = -(-end // _ALIGNMENT) * _ALIGNMENT
+            chunks.append((start, data))
+            end = start + (len(data) if isinstance(data, bytes) else data.nbytes)
+            return start
+
+        def add_array(column: np.ndarray) -> _Part:
+            if column.dtype.hasobject:
+                data = pickle.dumps(column.tolist(), protocol=pickle.HIGHEST_PROTOCOL)
+                return add(data), None, len(data)
+            return add(column), column.dtype.str, len(column)
+
+        self._tags = add_array(array.tags)
+        self._offsets = add_array(array.offsets)
+        self._columns = [
+            [add_array(column) for column in array.select(variant)] for variant in enum
+        ]
+        # nullary variants have no columns that would tell how many values they have
+        self._counts = np.bincount(array.tags, minlength=len(enum._tags)).tolist()
+        # a block cannot be empty
+        self._shm = shared_memory.SharedMemory(create=True, size=max(end, 1))
+        self._owner = True
+        buf = self._shm.buf
+        for start, data in chunks:
+            if isinstance(data, bytes):
+                buf[start : start + len(data)] = data
+            else:
+                np.ndarray(data.shape, data.dtype, buf, start)[:] = data
+        del buf
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block."""
+        return self._shm.name
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return (
+            f"<SharedBatch of {self._size} {self.enum.__name__} values in {self.name}>"
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        # only the name of the block is sent along
+        state["_shm"] = self._shm.name
+        state["_owner"] = False
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._shm = _Unattached(state["_shm"])
+
+    def close(self) -> None:
+        """Close the block in this process, and free it if this process created it."""
+        shm = self._shm
+        if isinstance(shm, shared_memory.SharedMemory):
+            shm.close()
+            if self._owner:
+                shm.unlink()
+                self._owner = False
+
+    def __enter__(self) -> "SharedBatch":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @contextmanager
+    def attach(self) -> Iterator[TypeEnumArray]:
+        """Map the block and return its values as a read-only `TypeEnumArray`.
+
+        The columns of the array are views of the block, which is closed again at the
+        end of the `with` block, so no views of them may be kept beyond it.
+        """
+        with self._attach({}) as array:
+            yield array
+
+    @contextmanager
+    def _attach(self, objects: dict[int, np.ndarray]) -> Iterator[TypeEnumArray]:
+        """Like `attach`, taking the object columns from `objects` if they are there.
+
+        The object columns are unpickled from the block, and do not refer to it, so
+        they can be kept in `objects` (keyed by their start) after the block is closed.
+        """
+        mapped = _attach(self.name)
+        try:
+            array = self._array(mapped.buf, objects)
+            yield array
+            del array
+        finally:
+            mapped.close()
+
+    def _array(self, buf: memoryview, objects: dict[int, np.ndarray]) -> TypeEnumArray:
+        def load(part: _Part) -> np.ndarray:
+            start, dtype, length = part
+            if dtype is None:
+                column = objects.get(start)
+                if column is None:
+                    items = pickle.loads(buf[start : start + length])
+                    column = objects[start] = np.fromiter(items, object, len(items))
+                return column
+            column = np.ndarray((length,), dtype, buf, start)
+            column.flags.writeable = False
+            return column
+
+        columns = [[load(part) for part in parts] for parts in self._columns]
+        return TypeEnumArray._from_parts(
+            self.enum, load(self._tags), load(self._offsets), columns, self._counts
+        )
+
+
+class _Unattached:
+    """Stands in for the `SharedMemory` of a batch that was unpickled."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class _Mapped:
+    """A block that is mapped without registering it with a resource tracker."""
+
+    __slots__ = ("_mmap", "buf")
+
+    def __init__(self, name: str) -> None:
+        import _posixshmem
+
+        fd = _posixshmem.shm_open("/" + name, os.O_RDWR, mode=0o600)
+        try:
+            self._mmap = mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        self.buf = memoryview(self._mmap)
+
+    def close(self) -> None:
+        self.buf.release()
+        self._mmap.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory | _Mapped:
+    """Map an existing block, leaving it to its creator to free it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    if os.name == "posix":
+        # Before Python 3.13, `SharedMemory` registers every block that it maps with a
+        # resource tracker, which frees the block when its process exits. Workers
+        # usually share the tracker of their parent, where registering and
+        # unregistering again would race with the other workers and the owner.
+        return _Mapped(name)
+    # Windows frees a block when the last process closes it
+    return shared_memory.SharedMemory(name)
+
+
+def parallel_map(
+    func: Callable[[Any], Any],
+    values: Iterable[Any],
+    *,
+    enum: TypeEnumMeta | None = None,
+    processes: int | None = None,
+    chunksize: int | None = None,
+    pool: Any = None,
+) -> list[Any]:
+    """Call `func` on every value in worker processes and return the results in order.
+
+    The values are sent to the workers in a `SharedBatch` instead of being pickled one
+    by one, so `enum` is required unless `values` is a `TypeEnumArray`. `func` and its
+    results are pickled as usual. If no `pool` is given, a `multiprocessing.Pool` with
+    `processes` workers is created for the call.
+    """
+    if isinstance(values, TypeEnumArray):
+        enum = values.enum
+    elif enum is None:
+        raise TypeError("`enum` is required unless `values` is a TypeEnumArray")
+    with SharedBatch(enum, values) as batch:
+        size = len(batch)
+        if chunksize is None:
+            # a few chunks per worker balance the load
+            workers = processes or os.cpu_count() or 1
+            chunksize = max(1, -(-size // (4 * workers)))
+        tasks = [
+            (batch, func, start, min(start + chunksize, size))
+            for start in range(0, size, chunksize)
+        ]
+        if not tasks:
+            return []
+        if pool is None:
+            with multiprocessing.Pool(processes) as own_pool:
+                chunks = own_pool.starmap(_map_chunk, tasks)
+        else:
+            chunks = pool.starmap(_map_chunk, tasks)
+    return [result for chunk in chunks for result in chunk]
+
+
+# The name of the batch that this worker process handled last, and its object columns,
+# so that they are unpickled only once per worker.
+_objects: tuple[str, dict[int, np.ndarray]] = ("", {})
+
+
+def _map_chunk(
+    batch: SharedBatch, func: Callable[[Any], Any], start: int, stop: int
+) -> list[Any]:
+    global _objects
+    if _objects[0] != batch.name:
+        _objects = (batch.name, {})
+    # the block is closed after every chunk, as the worker may outlive the batch
+    with batch._attach(_objects[1]) as array:
+        return [func(value) for value in array._iter(start, stop)]
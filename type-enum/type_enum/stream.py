@@ -0,0 +1,185 @@
+"""Sending TypeEnum values as messages over asyncio streams.
+
+Each message is the length of the encoded value (as a 32-bit little-endian number)
+followed by its encoding with a `BinaryCodec`, which starts with the tag of the variant.
+
+A `MessageWriter` buffers the messages that are written in one iteration of the event
+loop and passes them to the transport in a single `write()` call. A `MessageReader`
+reads the stream in large chunks and decodes all complete messages in a chunk at once,
+instead of awaiting every message (or even every length) on its own.
+"""
+
+import asyncio
+from collections import deque
+import struct
+from typing import Any, Iterable
+
+from ._core import TypeEnumMeta
+from .binary import BinaryCodec
+
+__all__ = ["MessageReader", "MessageWriter"]
+
+_LENGTH = struct.Struct("<I")
+
+
+class MessageReader:
+    """An asynchronous iterator over the messages from an `asyncio.StreamReader`.
+
+    Messages longer than `max_size` bytes raise `ValueError`, and a stream that ends in
+    the middle of a message raises `asyncio.IncompleteReadError`. As the stream is only
+    read when the next message is needed, a slow consumer makes the transport stop
+    reading from the socket, which in turn slows down the sender.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        enum: TypeEnumMeta,
+        *,
+        max_size: int = 2**24,
+        chunk_size: int = 2**16,
+    ) -> None:
+        self.enum = enum
+        self._reader = reader
+        self._codec = BinaryCodec(enum)
+        self._max_size = max_size
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._messages: deque[Any] = deque()
+
+    def __aiter__(self) -> "MessageReader":
+        return self
+
+    async def __anext__(self) -> Any:
+        value = await self.read()
+        if value is None:
+            raise StopAsyncIteration
+        return value
+
+    async def read(self) -> Any:
+        """Return the next message, or None at the end of the stream."""
+        messages = self._messages
+        while not messages:
+            data = await self._reader.read(self._chunk_size)
+            if not data:
+                if self._buffer:
+                    raise asyncio.IncompleteReadError(bytes(self._buffer), None)
+                return None
+            self._buffer += data
+            self._decode_buffer()
+        return messages.popleft()
+
+    def _decode_buffer(self) -> None:
+        """Decode the complete messages in the buffer."""
+        buf = self._buffer
+        decode = self._codec._decode
+        append = self._messages.append
+        unpack_length = _LENGTH.unpack_from
+        size = len(buf)
+        pos = 0
+        with memoryview(buf) as view:
+            while pos + 4 <= size:
+                (length,) = unpack_length(view, pos)
+                if length > self._max_size:
+                    raise ValueError(
+                        f"Message of {length} bytes is longer than {self._max_size}"
+                    )
+                end = pos + 4 + length
+                if end > size:
+                    break
+                value, value_end = decode(view[:end], pos + 4)
+                if value_end != end:
+                    raise ValueError(f"Message of {length} bytes is not one value")
+                append(value)
+                pos = end
+        del buf[:pos]
+
+
+class MessageWriter:
+    """Writes messages to an `asyncio.StreamWriter`, batching the `write()` calls.
+
+    The messages of `write` are buffered until the event loop runs its next callbacks,
+    or until there are `buffer_size` bytes of them. `send` and `drain` also wait while
+    the transport has too much data to send, as `StreamWriter.drain` does, which is how
+    a fast sender is slowed down to the pace of the receiver.
+    """
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        enum: TypeEnumMeta,
+        *,
+        buffer_size: int = 2**16,
+    ) -> None:
+        self.enum = enum
+        self._writer = writer
+        self._encode_into = BinaryCodec(enum).encode_into
+        self._buffer_size = buffer_size
+        self._buffer = bytearray()
+        self._encoded = bytearray()
+        self._scheduled = False
+
+    def write(self, value: Any) -> None:
+        """Buffer a message; it is written when the event loop runs next."""
+        self.write_many((value,))
+
+    def write_many(self, values: Iterable[Any]) -> None:
+        """Buffer the messages of `values`.
+
+        If a value cannot be encoded, none of the messages are buffered.
+        """
+        buf = self._buffer
+        start = len(buf)
+        encoded = self._encoded
+        encode_into = self._encode_into
+        pack_length = _LENGTH.pack
+        try:
+            for value in values:
+                # encoding into a small buffer, since `encode_into` trims its output
+                del encoded[:]
+                encode_into((value,), encoded)
+                buf += pack_length(len(encoded))
+                buf += encoded
+        except BaseException:
+            del buf[start:]
+            raise
+        if len(buf) >= self._buffer_size:
+            self.flush()
+        elif buf and not self._scheduled:
+            asyncio.get_running_loop().call_soon(self._flush_soon)
+            self._scheduled = True
+
+    def _flush_soon(self) -> None:
+        self._scheduled = False
+        self.flush()
+
+    def flush(self) -> None:
+        """Pass the buffered messages to the transport now."""
+        if self._buffer:
+            self._writer.write(self._buffer)
+            # the transport may keep the buffer, so it is replaced instead of cleared
+            self._buffer = bytearray()
+
+    async def send(self, value: Any) -> None:
+        """Buffer a message and wait while the transport has too much data to send."""
+        self.write_many((value,))
+        await self._writer.drain()
+
+    async def drain(self) -> None:
+        """Pass the buffered messages to the transport; wait until it can take more."""
+        self.flush()
+        await self._writer.drain()
+
+    def write_eof(self) -> None:
+        """Pass the buffered messages to the transport and close the sending side."""
+        self.flush()
+        self._writer.write_eof()
+
+    def close(self) -> None:
+        """Pass the buffered messages to the transport and close it."""
+        self.flush()
+        self._writer.close()
+
+    async def wait_closed(self) -> None:
+        """Wait until the stream is closed."""
+        await self._writer.wait_closed()